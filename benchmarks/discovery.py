@@ -0,0 +1,53 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import statistics
+import tempfile
+import time
+from cocktaildb import cocktaildb
+from benchmarks.fake_cocktaildb import fake_cocktaildb
+
+
+def time_searches(db, workers, runs) -> list:
+    """
+    Time find_valid_cocktail searches.
+
+    Args:
+        db (cocktaildb): The CocktailDB client pointed at the fake server.
+        workers (int): The number of requests kept in flight.
+        runs (int): The number of searches to time.
+
+    Returns:
+        list: The duration of each search in seconds.
+    """
+    durations = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        db.find_valid_cocktail(workers=workers)
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Benchmark find_valid_cocktail against a local fake CocktailDB."
+    )
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    args = parser.parse_args()
+
+    server = fake_cocktaildb(latency=args.latency)
+    server.start()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        db = cocktaildb(server.base_api_url, os.path.join(cache_dir, "cache.db"))
+        db.ingredients = {"gin", "vodka", "lime juice", "sugar syrup", "soda water"}
+        for workers in args.workers:
+            durations = time_searches(db, workers, args.runs)
+            print(
+                f"workers={workers}: median {statistics.median(durations) * 1000:.1f} ms, "
+                f"max {max(durations) * 1000:.1f} ms"
+            )
+    server.stop()
@@ -0,0 +1,107 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+def make_catalog(size=400, makeable_ratio=0.05, seed=0):
+    """
+    Build a synthetic CocktailDB catalog.
+
+    Args:
+        size (int): The number of drinks in the catalog.
+        makeable_ratio (float): The share of drinks using only stocked ingredients.
+        seed (int): The random seed.
+
+    Returns:
+        list: The drinks in CocktailDB API format.
+    """
+    rng = random.Random(seed)
+    stocked = ["gin", "vodka", "lime juice", "sugar syrup", "soda water", "campari"]
+    unstocked = [f"ingredient {i}" for i in range(60)]
+    drinks = []
+    for i in range(size):
+        pool = stocked if rng.random() < makeable_ratio else stocked + unstocked
+        names = rng.sample(pool, rng.randint(2, 5))
+        drink = {"idDrink": str(10000 + i), "strDrink": f"Drink {i}"}
+        for j in range(1, 16):
+            drink[f"strIngredient{j}"] = names[j - 1] if j <= len(names) else None
+            drink[f"strMeasure{j}"] = "1 oz" if j <= len(names) else None
+        drinks.append(drink)
+    return drinks
+
+
+class fake_cocktaildb:
+    def __init__(self, catalog=None, latency=0.05, port=0):
+        """
+        Initialize a local stand-in for the CocktailDB API.
+
+        Serves random.php, lookup.php and search.php from a synthetic catalog,
+        delaying every response to simulate the round trip to the real API.
+
+        Args:
+            catalog (list): The drinks to serve (default is make_catalog()).
+            latency (float): The delay added to every response in seconds.
+            port (int): The port to listen on (default is any free port).
+
+        Returns:
+            None
+        """
+        self.catalog = catalog if catalog is not None else make_catalog()
+        self.latency = latency
+        self.request_count = 0
+        server = self
+
+        class handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+
+            def do_GET(self):
+                server.request_count += 1
+                time.sleep(server.latency)
+                body = json.dumps(server.respond(self.path)).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), handler)
+        self.httpd.daemon_threads = True
+        self.base_api_url = f"http://127.0.0.1:{self.httpd.server_port}/"
+
+    def respond(self, path) -> dict:
+        """
+        Build the response for a request path.
+
+        Args:
+            path (str): The request path including the query string.
+
+        Returns:
+            dict: The response body.
+        """
+        url = urlparse(path)
+        query = parse_qs(url.query)
+        endpoint = url.path.rsplit("/", 1)[-1]
+        if endpoint == "random.php":
+            return {"drinks": [random.choice(self.catalog)]}
+        if endpoint == "lookup.php":
+            drink_id = query.get("i", [""])[0]
+            drinks = [d for d in self.catalog if d["idDrink"] == drink_id]
+            return {"drinks": drinks or None}
+        if endpoint == "search.php":
+            letter = query.get("f", [""])[0].lower()
+            drinks = [d for d in self.catalog if d["strDrink"].lower()[:1] == letter]
+            return {"drinks": drinks or None}
+        return {"drinks": None}
+
+    def start(self) -> None:
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,138 @@
+import sys
+import os
+import time
+
+START = time.perf_counter()
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+import argparse
+import contextlib
+import io
+import json
+import resource
+
+
+def rss_kb() -> int:
+    """
+    Get the resident set size of this process.
+
+    Args:
+        None
+
+    Returns:
+        int: The current RSS in KiB (the peak RSS where /proc is unavailable).
+    """
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def startup() -> dict:
+    """
+    Build the main window the way gui/main.py does and time each stage.
+
+    Args:
+        None
+
+    Returns:
+        dict: The import, construction and first paint times in ms and the RSS in KiB.
+    """
+    from PyQt6.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+    from gui.main import GUI
+
+    imported = time.perf_counter()
+    window = GUI()
+    constructed = time.perf_counter()
+    window.show()
+    app.processEvents()
+    shown = time.perf_counter()
+    return {
+        "import_ms": (imported - START) * 1000,
+        "construct_ms": (constructed - imported) * 1000,
+        "first_paint_ms": (shown - START) * 1000,
+        "rss_kb": rss_kb(),
+    }
+
+
+def serve_drinks(drinks) -> dict:
+    """
+    Serve drinks through the Functions page on a simulated bartender and measure memory.
+
+    Args:
+        drinks (int): The number of drinks to serve.
+
+    Returns:
+        dict: The RSS before and after in KiB, the growth per drink in KiB and
+            the number of screens left in the Functions page.
+    """
+    from PyQt6.QtWidgets import QApplication, QPushButton
+
+    app = QApplication(sys.argv)
+    from gui.main import GUI
+    from hardware.bartender import bartender
+    from hardware.simulator import simulated_gpio
+
+    window = GUI()
+    page = window.functions_page
+    sim = simulated_gpio()
+    page.bartender = bartender(gpio=sim, clock=sim.clock)
+    names = [c["name"] for c in page.bartender.recipes.all_cocktails()]
+
+    def serve(count):
+        for i in range(count):
+            page.make_cocktail(names[i % len(names)])
+            # Click through every phase until the page goes back to its menu
+            while True:
+                screen = page.dynamic_area.currentWidget()
+                buttons = [
+                    button
+                    for button in screen.findChildren(QPushButton)
+                    if button.text() == "Start Pour" and not button.isHidden()
+                ]
+                if not buttons:
+                    break
+                buttons[0].click()
+                # The next phase re-shows the button on the same pooled screen
+                while page.pouring and buttons[0].isHidden():
+                    app.processEvents()
+            sim.clear()  # The simulator's own timeline is not GUI memory
+
+    serve(min(drinks, 10))  # Warm up caches and lazily created objects
+    before = rss_kb()
+    serve(drinks)
+    after = rss_kb()
+    return {
+        "rss_before_kb": before,
+        "rss_after_kb": after,
+        "growth_per_drink_kb": (after - before) / max(drinks, 1),
+        "screens": page.dynamic_area.count(),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measure the GUI under the offscreen Qt platform (prints JSON)."
+    )
+    parser.add_argument("mode", choices=["startup", "drinks"])
+    parser.add_argument("--drinks", type=int, default=100)
+    args = parser.parse_args()
+
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    with contextlib.redirect_stdout(io.StringIO()):  # GUI and mock GPIO prints
+        if args.mode == "startup":
+            result = startup()
+        else:
+            from benchmarks.sandbox import temporary_recipe_store
+
+            # The served drinks are counted as pours, so keep them out of
+            # the operator's recipe store
+            with temporary_recipe_store():
+                result = serve_drinks(args.drinks)
+    print(json.dumps(result))
@@ -0,0 +1,71 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import contextlib
+import io
+import random
+import threading
+from hardware.pump import pump
+from hardware.scheduler import pour_scheduler
+
+
+def busy_load(stop_event) -> None:
+    """
+    Keep a thread busy to simulate GUI load while pouring.
+
+    Args:
+        stop_event (threading.Event): The event that ends the load.
+
+    Returns:
+        None
+    """
+    while not stop_event.is_set():
+        sum(i * i for i in range(10000))
+
+
+def measure_pulses(precise, pulses, load_threads) -> dict:
+    """
+    Run single-relay pulses of random length and report their timing error.
+
+    Args:
+        precise (bool): Whether the pump uses the hybrid sleep + spin wait.
+        pulses (int): The number of pulses to run.
+        load_threads (int): The number of busy threads running meanwhile.
+
+    Returns:
+        dict: The pulse error report of the pump.
+    """
+    relay_pump = pump([17, 27, 22, 23], precise=precise)
+    scheduler = pour_scheduler(relay_pump)
+    stop_event = threading.Event()
+    for _ in range(load_threads):
+        threading.Thread(target=busy_load, args=(stop_event,), daemon=True).start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):  # Mock GPIO prints
+            for _ in range(pulses):
+                pin = random.choice(relay_pump.relay_pins)
+                scheduler.run(
+                    [{"relay_pin": pin, "duration": random.uniform(0.01, 0.05)}]
+                )
+    finally:
+        stop_event.set()
+    return relay_pump.timing_report()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure relay pulse timing error.")
+    parser.add_argument("--pulses", type=int, default=100)
+    parser.add_argument("--load", type=int, default=2, help="busy threads")
+    args = parser.parse_args()
+
+    for precise in (False, True):
+        report = measure_pulses(precise, args.pulses, args.load)
+        print(
+            f"{'precise' if precise else 'sleep  '}: "
+            + ", ".join(
+                f"{key} {value:.3f}" if isinstance(value, float) else f"{key} {value}"
+                for key, value in report.items()
+            )
+        )
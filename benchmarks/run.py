@@ -0,0 +1,237 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import subprocess
+import tempfile
+import time
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINES_PATH = os.path.join(BENCHMARKS_DIR, "baselines.json")
+TOLERANCE = 1.25  # a metric regresses when it is this many times its baseline
+
+# Hard limits that fail the run whatever the baseline. The GUI serving
+# drinks measured ~56 MB RSS with two pooled screens on x86-64.
+CEILINGS = {
+    "memory_rss_kb": 80 * 1024,
+    "memory_screens_kept": 16,
+}
+
+
+def bench_pours(runs=20) -> dict:
+    """
+    Run short random pour plans through bartender.run_plan on the real clock.
+
+    Args:
+        runs (int): The number of plans to run.
+
+    Returns:
+        dict: The 95th percentile stop skew and the 95th percentile absolute
+            pour error, in ms.
+    """
+    from hardware.bartender import bartender
+    from benchmarks.sandbox import temporary_recipe_store
+
+    # Mock GPIO prints; the bartender opens a throwaway recipe store
+    with contextlib.redirect_stdout(io.StringIO()), temporary_recipe_store():
+        robot = bartender()
+        robot.pump.pulses.clear()
+        stop_skews = []
+        for _ in range(runs):
+            plan = [
+                {"pump": i, "relay_pin": pin, "duration": random.uniform(0.02, 0.1)}
+                for i, pin in enumerate(robot.relay_pins)
+            ]
+            metrics = robot.run_plan(plan)
+            stop_skews.append(metrics["stop_skew"] * 1000)
+    errors = sorted(abs(p["error"]) * 1000 for p in robot.pump.pulses.pulses)
+    return {
+        "pour_stop_skew_p95_ms": percentile(stop_skews, 0.95),
+        "pour_error_p95_ms": percentile(errors, 0.95),
+    }
+
+
+def bench_discovery(runs=10, latency=0.02, workers=8) -> dict:
+    """
+    Time find_valid_cocktail against the local fake CocktailDB server.
+
+    Args:
+        runs (int): The number of searches to time.
+        latency (float): The simulated network latency in seconds.
+        workers (int): The number of requests kept in flight.
+
+    Returns:
+        dict: The median and worst search time in ms.
+    """
+    from cocktaildb import cocktaildb
+    from benchmarks.discovery import time_searches
+    from benchmarks.fake_cocktaildb import fake_cocktaildb, make_catalog
+
+    server = fake_cocktaildb(make_catalog(), latency)
+    server.start()
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            db = cocktaildb(
+                server.base_api_url,
+                cache_path=os.path.join(directory, "api_cache.db"),
+                catalog_path=os.path.join(directory, "catalog.db"),
+            )
+            durations = [d * 1000 for d in time_searches(db, workers, runs)]
+    finally:
+        server.stop()
+    return {
+        "discovery_median_ms": statistics.median(durations),
+        "discovery_max_ms": max(durations),
+    }
+
+
+def run_probe(*args) -> dict:
+    """
+    Run gui_probe.py in a fresh interpreter and read its JSON result.
+
+    Args:
+        *args (str): The probe arguments.
+
+    Returns:
+        dict: The probe result, with the process wall time in ms.
+    """
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, os.path.join(BENCHMARKS_DIR, "gui_probe.py"), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    wall = (time.perf_counter() - start) * 1000
+    result = json.loads(next(line for line in output.splitlines() if line[:1] == "{"))
+    result["wall_ms"] = wall
+    return result
+
+
+def bench_gui_startup(runs=3) -> dict:
+    """
+    Time cold starts of the GUI under the offscreen Qt platform.
+
+    Args:
+        runs (int): The number of cold starts.
+
+    Returns:
+        dict: The median first paint time, process wall time and RSS.
+    """
+    results = [run_probe("startup") for _ in range(runs)]
+    return {
+        "gui_first_paint_ms": statistics.median(r["first_paint_ms"] for r in results),
+        "gui_process_ms": statistics.median(r["wall_ms"] for r in results),
+        "gui_rss_kb": statistics.median(r["rss_kb"] for r in results),
+    }
+
+
+def bench_memory(drinks=200) -> dict:
+    """
+    Measure the GUI's memory growth while serving drinks on a simulated bartender.
+
+    Args:
+        drinks (int): The number of drinks to serve.
+
+    Returns:
+        dict: The RSS growth per drink, the RSS after the last drink and the
+            screens left in the Functions page.
+    """
+    result = run_probe("drinks", "--drinks", str(drinks))
+    return {
+        "memory_growth_per_drink_kb": result["growth_per_drink_kb"],
+        "memory_rss_kb": result["rss_after_kb"],
+        "memory_screens_kept": result["screens"],
+    }
+
+
+def percentile(values, fraction) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+TARGETS = {
+    "pours": bench_pours,
+    "discovery": bench_discovery,
+    "gui_startup": bench_gui_startup,
+    "memory": bench_memory,
+}
+
+
+def compare(results, baselines) -> list:
+    """
+    Compare results with the stored baselines. Every metric is lower-is-better.
+
+    Args:
+        results (dict): The measured metrics.
+        baselines (dict): The baseline metrics.
+
+    Returns:
+        list: The names of the metrics that regressed beyond TOLERANCE or
+            went over their ceiling.
+    """
+    regressions = []
+    for name, value in results.items():
+        if name in CEILINGS and value > CEILINGS[name]:
+            print(f"{name:32} {value:12.3f}   OVER CEILING {CEILINGS[name]}")
+            regressions.append(name)
+            continue
+        baseline = baselines.get(name)
+        if baseline is None:
+            print(f"{name:32} {value:12.3f}   (no baseline)")
+            continue
+        ratio = value / baseline if baseline else (1.0 if not value else float("inf"))
+        flag = "REGRESSION" if ratio > TOLERANCE and value - baseline > 1 else ""
+        print(
+            f"{name:32} {value:12.3f}   baseline {baseline:12.3f}   x{ratio:.2f} {flag}"
+        )
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run the benchmarks and compare them with the stored baselines."
+    )
+    parser.add_argument("targets", nargs="*", help=f"any of {', '.join(TARGETS)}")
+    parser.add_argument(
+        "--save", action="store_true", help="store the results as the new baselines"
+    )
+    args = parser.parse_args()
+    for target in args.targets:
+        if target not in TARGETS:
+            parser.error(f"unknown target {target}")
+
+    os.chdir(os.path.dirname(BENCHMARKS_DIR))  # The app uses repo-relative paths
+    results = {}
+    for target in args.targets or TARGETS:
+        results.update(TARGETS[target]())
+
+    baselines = {}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH, "r") as file:
+            baselines = json.load(file)
+    regressions = compare(results, baselines.get("metrics", {}))
+
+    if args.save:
+        baselines = {
+            "machine": " ".join(
+                [platform.machine(), platform.system(), platform.python_version()]
+            ),
+            "time": time.strftime("%Y-%m-%d"),
+            "metrics": {**baselines.get("metrics", {}), **results},
+        }
+        with open(BASELINES_PATH, "w") as file:
+            json.dump(baselines, file, indent=4, sort_keys=True)
+            file.write("\n")
+        print(f"Saved baselines to {BASELINES_PATH}")
+    elif regressions:
+        sys.exit(1)
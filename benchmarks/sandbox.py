@@ -0,0 +1,37 @@
+import contextlib
+import importlib
+import os
+import tempfile
+from data.cocktails_data import cocktail_list
+
+# The module itself: the data package re-exports its recipe_store class
+store = importlib.import_module("data.recipe_store")
+
+
+@contextlib.contextmanager
+def temporary_recipe_store():
+    """
+    Swap the shared recipe store for a fresh one in a temporary directory.
+
+    Benchmarks pour and save recipes, which must not end up in the operator's
+    data/recipes.db (pour counts drive "Popular First" and the suggested
+    loadout). The temporary store is seeded from cocktail_list, so every run
+    starts from the same recipes.
+
+    Args:
+        None
+
+    Yields:
+        recipe_store: The temporary store, returned by get_recipe_store.
+    """
+    previous = store.shared_store
+    with tempfile.TemporaryDirectory() as directory:
+        recipes = store.recipe_store(
+            os.path.join(directory, "recipes.db"), seed=cocktail_list
+        )
+        store.shared_store = recipes
+        try:
+            yield recipes
+        finally:
+            store.shared_store = previous
+            recipes.connection.close()
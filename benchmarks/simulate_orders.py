@@ -0,0 +1,76 @@
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import argparse
+import contextlib
+import io
+import random
+import time
+from hardware.bartender import bartender
+from hardware.simulator import simulated_gpio
+from benchmarks.sandbox import temporary_recipe_store
+
+
+def simulate_orders(orders, seed=0) -> dict:
+    """
+    Serve random orders on a bartender with simulated GPIO and check every pulse.
+
+    Args:
+        orders (int): The number of orders to serve.
+        seed (int): The random seed of the order stream.
+
+    Returns:
+        dict: The number of orders, phases, swaps and pulses served, the
+            simulated time and the largest pulse error in seconds.
+    """
+    rng = random.Random(seed)
+    sim = simulated_gpio()
+    # Pour plan prints; the bartender opens a throwaway recipe store
+    with contextlib.redirect_stdout(io.StringIO()), temporary_recipe_store():
+        robot = bartender(gpio=sim, clock=sim.clock)
+        cocktails = robot.recipes.all_cocktails()
+        phases = swaps = pulses = 0
+        max_error = 0.0
+        for _ in range(orders):
+            robot.orders.submit(rng.choice(cocktails))
+            order, order_phases = robot.orders.next_order()
+            for assignment, phase_swaps in order_phases:
+                sim.clear()
+                plan = robot.pour_plan(order["cocktail"], assignment)
+                robot.run_plan(plan)
+                timeline = sim.timeline()
+                for step in plan:
+                    ((on, off),) = timeline[step["relay_pin"]]
+                    max_error = max(max_error, abs((off - on) - step["duration"]))
+                phases += 1
+                swaps += len(phase_swaps)
+                pulses += len(plan)
+    return {
+        "orders": orders,
+        "phases": phases,
+        "swaps": swaps,
+        "pulses": pulses,
+        "simulated_s": sim.clock.now(),
+        "max_error_s": max_error,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Serve random orders in virtual time and check the relay timeline."
+    )
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = simulate_orders(args.orders, args.seed)
+    elapsed = time.perf_counter() - start
+    print(
+        ", ".join(
+            f"{key} {value:.3f}" if isinstance(value, float) else f"{key} {value}"
+            for key, value in result.items()
+        )
+        + f", wall {elapsed:.2f} s"
+    )
@@ -0,0 +1,143 @@
+import json
+import sqlite3
+import threading
+import time
+
+
+class response_cache:
+    def __init__(self, path="data/api_cache.db", max_entries=2000, ttl=7 * 24 * 3600):
+        """
+        Initialize the on-disk response cache for CocktailDB API calls.
+
+        Entries are keyed by endpoint and key (e.g. "lookup.php" and a drink
+        ID), expire after a TTL and are evicted least-recently-used first once
+        the cache holds more than max_entries.
+
+        Args:
+            path (str): The path of the SQLite cache file.
+            max_entries (int): The maximum number of entries kept on disk.
+            ttl (float): The default time to live of an entry in seconds.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                endpoint TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (endpoint, key)
+            ) WITHOUT ROWID
+            """
+        )
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+        self.connection.commit()
+
+    def get(self, endpoint, key, allow_stale=False):
+        """
+        Get a cached response.
+
+        Args:
+            endpoint (str): The API endpoint, e.g. "lookup.php".
+            key (str): The key of the response, e.g. the drink ID.
+            allow_stale (bool): Whether to return entries past their TTL.
+
+        Returns:
+            dict: The cached response or None if it is missing or expired.
+        """
+        now = time.time()
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value, expires_at FROM entries WHERE endpoint = ? AND key = ?",
+                (endpoint, str(key)),
+            ).fetchone()
+            if row is None or (row[1] < now and not allow_stale):
+                return None
+            self.connection.execute(
+                "UPDATE entries SET accessed_at = ? WHERE endpoint = ? AND key = ?",
+                (now, endpoint, str(key)),
+            )
+            self.connection.commit()
+        return json.loads(row[0])
+
+    def put(self, endpoint, key, value, ttl=None) -> None:
+        """
+        Store a response and evict the least recently used entries if needed.
+
+        Args:
+            endpoint (str): The API endpoint, e.g. "lookup.php".
+            key (str): The key of the response, e.g. the drink ID.
+            value (dict): The response to cache.
+            ttl (float): The time to live in seconds (default is self.ttl).
+
+        Returns:
+            None
+        """
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (endpoint, str(key), json.dumps(value), expires_at, now),
+            )
+            (count,) = self.connection.execute(
+                "SELECT COUNT(*) FROM entries"
+            ).fetchone()
+            if count > self.max_entries:
+                self.connection.execute(
+                    """
+                    DELETE FROM entries WHERE (endpoint, key) IN (
+                        SELECT endpoint, key FROM entries
+                        ORDER BY accessed_at LIMIT ?
+                    )
+                    """,
+                    (count - self.max_entries,),
+                )
+            self.connection.commit()
+
+    def random(self, endpoint):
+        """
+        Get a random cached response for an endpoint, ignoring TTLs.
+
+        Used as a fallback when the API cannot be reached.
+
+        Args:
+            endpoint (str): The API endpoint, e.g. "lookup.php".
+
+        Returns:
+            dict: A cached response or None if nothing is cached.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM entries WHERE endpoint = ? ORDER BY RANDOM() LIMIT 1",
+                (endpoint,),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def purge_expired(self) -> None:
+        """
+        Delete all entries past their TTL.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.connection.execute(
+                "DELETE FROM entries WHERE expires_at < ?", (time.time(),)
+            )
+            self.connection.commit()
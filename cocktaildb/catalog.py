@@ -0,0 +1,114 @@
+import json
+import sqlite3
+import threading
+
+
+class catalog:
+    def __init__(self, path="data/catalog.db"):
+        """
+        Initialize the offline mirror of the CocktailDB catalog.
+
+        Drinks are stored as raw API records alongside an ingredient table
+        indexed by ingredient and drink, so searches can be answered locally.
+
+        Args:
+            path (str): The path of the SQLite catalog file.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS drinks (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS drink_ingredients (
+                drink_id TEXT NOT NULL REFERENCES drinks (id),
+                ingredient TEXT NOT NULL,
+                measure TEXT
+            );
+            CREATE INDEX IF NOT EXISTS drinks_name ON drinks (name);
+            CREATE INDEX IF NOT EXISTS drink_ingredients_ingredient
+                ON drink_ingredients (ingredient);
+            CREATE INDEX IF NOT EXISTS drink_ingredients_drink_id
+                ON drink_ingredients (drink_id);
+            """
+        )
+
+    def count(self) -> int:
+        """
+        Get the number of drinks in the catalog.
+
+        Args:
+            None
+
+        Returns:
+            int: The number of drinks.
+        """
+        with self.lock:
+            (count,) = self.connection.execute("SELECT COUNT(*) FROM drinks").fetchone()
+        return count
+
+    def replace_all(self, drinks) -> None:
+        """
+        Replace the catalog with a freshly synced set of drinks in one transaction.
+
+        Args:
+            drinks (list): The drinks in CocktailDB API format.
+
+        Returns:
+            None
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM drink_ingredients")
+            self.connection.execute("DELETE FROM drinks")
+            for drink in drinks:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO drinks VALUES (?, ?, ?)",
+                    (drink["idDrink"], drink["strDrink"].lower(), json.dumps(drink)),
+                )
+                for i in range(1, 16):
+                    ingredient = drink.get(f"strIngredient{i}")
+                    measure = drink.get(f"strMeasure{i}")
+                    if ingredient and ingredient.strip():
+                        self.connection.execute(
+                            "INSERT INTO drink_ingredients VALUES (?, ?, ?)",
+                            (drink["idDrink"], ingredient.strip().lower(), measure),
+                        )
+
+    def get_drink(self, drink_id):
+        """
+        Get a drink by its ID.
+
+        Args:
+            drink_id (str): The CocktailDB drink ID.
+
+        Returns:
+            dict: The drink in CocktailDB API format or None if it is not found.
+        """
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT data FROM drinks WHERE id = ?", (str(drink_id),)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def all_drinks(self) -> list:
+        """
+        Get every drink in the catalog.
+
+        Args:
+            None
+
+        Returns:
+            list: The drinks in CocktailDB API format, sorted by name.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT data FROM drinks ORDER BY name"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
@@ -1,25 +1,54 @@
-import requests
 import csv
-from data.cocktails_data import cocktail_list
+import random
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from data.recipe_store import get_recipe_store
+from data.ingredient_index import ingredient_index
+from data.measures import measures_to_oz, drop_unpoured
+from .cache import response_cache
+from .catalog import catalog
 
 
 class cocktaildb:
-    def __init__(self):
+    def __init__(
+        self,
+        base_api_url=None,
+        cache_path="data/api_cache.db",
+        catalog_path="data/catalog.db",
+    ):
         """
         Initialize the CocktailDB class with the API key and base API URL.
 
         Args:
-            None
+            base_api_url (str): Override for the API URL, e.g. a local stand-in
+                server (default is thecocktaildb.com)
+            cache_path (str): The path of the on-disk response cache
+            catalog_path (str): The path of the offline catalog mirror
 
         Returns:
             None
         """
         self.api_key = "1"
-        self.base_api_url = (
+        self.base_api_url = base_api_url or (
             "https://www.thecocktaildb.com/api/json/v1/" + self.api_key + "/"
         )
         self.random_cocktail_url = self.base_api_url + "random.php"
-        self.cocktail_list = cocktail_list
+        self.lookup_cocktail_url = self.base_api_url + "lookup.php"
+        self.search_url = self.base_api_url + "search.php"
+        self.timeout = 5  # seconds before a request is treated as offline
+        self.offline_backoff = 30  # seconds to serve from cache after a failure
+        self.offline_until = 0
+        self.cache = response_cache(cache_path)
+        self.catalog = catalog(catalog_path)
+        self.catalog_cocktails = None  # drink ID -> cocktail, loaded on first search
+        self.catalog_index = None
+        self.search_workers = 8  # requests kept in flight by find_valid_cocktail
+
+        self.session = None  # created by get_session on the first request
+        self.session_lock = threading.Lock()
+        self.recipes = get_recipe_store()
         self.ingredients = self.load_ingredients_from_csv()
 
     def load_ingredients_from_csv(self):
@@ -39,22 +68,114 @@ class cocktaildb:
                 ingredients.add(row["ingredient"].lower())
         return ingredients
 
+    def get_session(self):
+        """
+        Get the HTTP session, importing requests and creating it on first use.
+
+        requests (with urllib3) is the slowest import of the app, so it is
+        deferred until the first API call instead of slowing down startup.
+        The keep-alive session lets each request reuse a pooled connection
+        instead of paying a fresh TCP+TLS handshake.
+
+        Args:
+            None
+
+        Returns:
+            requests.Session: The shared session.
+        """
+        with self.session_lock:
+            if self.session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=self.search_workers)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self.session = session
+            return self.session
+
     def get_random_cocktail(self) -> dict:
         """
         Get a random cocktail from the CocktailDB API.
 
+        Every drink returned is cached by its ID. If the API cannot be reached,
+        a random cached drink is returned instead so discovery keeps working
+        offline.
+
         Args:
             None
 
         Returns:
             dict: A dictionary containing the cocktail data.
         """
-        response = requests.get(self.random_cocktail_url)
+        if time.monotonic() < self.offline_until:
+            return self.cache.random("lookup.php") or {}
+
+        session = self.get_session()
+        from requests import RequestException
+
+        try:
+            response = session.get(self.random_cocktail_url, timeout=self.timeout)
+            if response.status_code != 200:
+                return {}
+            cocktail_data = response.json()
+        except (RequestException, ValueError):
+            # Unreachable, or a body that isn't JSON (e.g. a proxy error page)
+            self.offline_until = time.monotonic() + self.offline_backoff
+            return self.cache.random("lookup.php") or {}
+
+        self.cache_cocktail(cocktail_data)
+        return cocktail_data
+
+    def lookup_cocktail(self, drink_id) -> dict:
+        """
+        Look up a cocktail by its ID, serving it from the cache when possible.
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return {}
+        Args:
+            drink_id (str): The CocktailDB drink ID.
+
+        Returns:
+            dict: A dictionary containing the cocktail data.
+        """
+        cached = self.cache.get("lookup.php", drink_id)
+        if cached:
+            return cached
+
+        if time.monotonic() >= self.offline_until:
+            session = self.get_session()
+            from requests import RequestException
+
+            try:
+                response = session.get(
+                    self.lookup_cocktail_url,
+                    params={"i": drink_id},
+                    timeout=self.timeout,
+                )
+                if response.status_code == 200:
+                    cocktail_data = response.json()
+                    if cocktail_data.get("drinks"):
+                        self.cache_cocktail(cocktail_data)
+                        return cocktail_data
+            except (RequestException, ValueError):
+                self.offline_until = time.monotonic() + self.offline_backoff
+
+        # Fall back to an expired entry rather than nothing
+        return self.cache.get("lookup.php", drink_id, allow_stale=True) or {}
+
+    def cache_cocktail(self, cocktail_data) -> None:
+        """
+        Store the drinks of an API response in the cache, keyed by drink ID.
+
+        Args:
+            cocktail_data (dict): The API response containing a "drinks" list.
+
+        Returns:
+            None
+        """
+        for drink in cocktail_data.get("drinks") or []:
+            if drink.get("idDrink"):
+                self.cache.put("lookup.php", drink["idDrink"], {"drinks": [drink]})
 
     def add_cocktail_to_list(self) -> None:
         """ "
@@ -72,74 +193,187 @@ class cocktaildb:
         if not cocktail_data:
             return
 
-        drink_information = cocktail_data["drinks"][0]
-        drink_name = drink_information["strDrink"].lower()
+        new_cocktail = self.drink_to_cocktail(cocktail_data["drinks"][0])
+        drink_name = new_cocktail["name"]
 
         # Check if the cocktail is already in the list
-        if any(c["name"] == drink_name for c in self.cocktail_list):
+        if self.recipes.has_cocktail(drink_name):
             print(
                 f"Cocktail '{drink_name}' already exists in the list."
             )  # TODO: Remove this troubleshooting print statement
             return
 
-        ingredients = {}
+        self.recipes.save_cocktail(new_cocktail)
+
+    def drink_to_cocktail(self, drink_information) -> dict:
+        """
+        Convert a CocktailDB drink into the cocktail list format.
+
+        Args:
+            drink_information (dict): The drink in CocktailDB API format.
+
+        Returns:
+            dict: The cocktail with its name and the amount of each poured
+                ingredient in ounces. Garnishes and pieces (e.g. "1 lemon
+                peel") are left out.
+        """
+        measures = {}
         for i in range(1, 16):
             ingredient = drink_information.get(f"strIngredient{i}")
             measure = drink_information.get(f"strMeasure{i}")
 
             # Check if the ingredient is null
             if ingredient and ingredient.strip():
-                ingredients[ingredient.lower()] = (
-                    measure.strip() if measure and measure.strip() else "0"
-                )
+                measures[ingredient.strip().lower()] = measure or ""
 
-        new_cocktail = {"name": drink_name, "ingredients": ingredients}
+        return {
+            "name": drink_information["strDrink"].lower(),
+            "ingredients": drop_unpoured(measures_to_oz(measures)),
+        }
 
-        self.cocktail_list.append(new_cocktail)
+    def validate_cocktail(self, cocktail_data):
+        """
+        Check that a cocktail is new and can be made with the available ingredients.
 
-    def find_valid_cocktail(self, max_attempts=100):
+        Args:
+            cocktail_data (dict): The API response containing the drink.
+
+        Returns:
+            dict: The cocktail in cocktail list format or None if it is not valid.
+        """
+        if not cocktail_data or not cocktail_data.get("drinks"):
+            return None
+
+        cocktail = self.drink_to_cocktail(cocktail_data["drinks"][0])
+
+        # Check if the cocktail is already in the list
+        if self.recipes.has_cocktail(cocktail["name"]):
+            return None
+
+        if not all(i in self.ingredients for i in cocktail["ingredients"]):
+            return None
+
+        return cocktail
+
+    def sync_catalog(self) -> int:
+        """
+        Mirror the whole CocktailDB catalog locally by searching every first letter.
+
+        Args:
+            None
+
+        Returns:
+            int: The number of drinks synced.
+        """
+
+        def search_letter(letter):
+            response = self.get_session().get(
+                self.search_url, params={"f": letter}, timeout=self.timeout
+            )
+            response.raise_for_status()
+            return response.json().get("drinks") or []
+
+        with ThreadPoolExecutor(max_workers=self.search_workers) as executor:
+            results = executor.map(search_letter, string.ascii_lowercase + string.digits)
+            drinks = {d["idDrink"]: d for letter in results for d in letter}
+
+        self.catalog.replace_all(drinks.values())
+        self.catalog_cocktails = None  # Rebuild the index on the next search
+        return len(drinks)
+
+    def find_makeable_cocktails(self) -> list:
+        """
+        Find every catalog cocktail that can be made and is not in the cocktail list yet.
+
+        Args:
+            None
+
+        Returns:
+            list: The cocktails in cocktail list format, sorted by name.
+        """
+        if self.catalog_cocktails is None:
+            self.load_catalog_index()
+
+        known = self.recipes.names()
+        cocktails = [
+            {
+                "name": self.catalog_cocktails[drink_id]["name"],
+                "ingredients": dict(self.catalog_cocktails[drink_id]["ingredients"]),
+            }
+            for drink_id in self.catalog_index.makeable(self.ingredients)
+        ]
+        return [c for c in cocktails if c["name"] not in known]
+
+    def load_catalog_index(self) -> None:
+        """
+        Load the catalog into memory and index it by ingredient.
+
+        Every drink is converted once here, measures included, so searches
+        don't parse strMeasure strings again.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        cocktails = {
+            drink["idDrink"]: self.drink_to_cocktail(drink)
+            for drink in self.catalog.all_drinks()
+        }
+        index = ingredient_index()
+        for drink_id, cocktail in cocktails.items():
+            index.add(drink_id, cocktail["ingredients"])
+        self.catalog_index = index
+        self.catalog_cocktails = cocktails
+
+    def find_valid_cocktail(self, max_attempts=100, workers=None):
         """
         Find a valid cocktail that meets the criteria.
 
+        Searches the offline catalog if it has been synced, otherwise rolls
+        random cocktails from the API.
+
         Args:
             max_attempts (int): The maximum number of attempts to find a valid cocktail.
+            workers (int): The number of requests kept in flight at once
+                (default is self.search_workers, 1 searches sequentially).
 
         Returns:
             dict: A dictionary containing the valid cocktail data or None if no valid cocktail is found.
         """
-        attempts = 0
-        while attempts < max_attempts:
-            cocktail_data = self.get_random_cocktail()
-            if not cocktail_data:
-                attempts += 1
-                continue
-
-            drink_information = cocktail_data["drinks"][0]
-            drink_name = drink_information["strDrink"].lower()
-
-            # Check if the cocktail is already in the list
-            if any(c["name"] == drink_name for c in self.cocktail_list):
-                attempts += 1
-                continue
-
-            ingredients = {}
-            all_ingredients_present = True
-            for i in range(1, 16):
-                ingredient = drink_information.get(f"strIngredient{i}")
-                measure = drink_information.get(f"strMeasure{i}")
-
-                if ingredient and ingredient.strip():
-                    ingredient_lower = ingredient.lower()
-                    if ingredient_lower not in self.ingredients:
-                        all_ingredients_present = False
-                        break
-                    ingredients[ingredient_lower] = (
-                        measure.strip() if measure and measure.strip() else "0"
-                    )
-
-            if all_ingredients_present:
-                return {"name": drink_name, "ingredients": ingredients}
-
-            attempts += 1
-
-        return None
+        # Answer from the offline catalog once it has been synced
+        if self.catalog.count():
+            cocktails = self.find_makeable_cocktails()
+            return random.choice(cocktails) if cocktails else None
+
+        if workers is None:
+            workers = self.search_workers
+
+        if workers <= 1:
+            for _ in range(max_attempts):
+                cocktail = self.validate_cocktail(self.get_random_cocktail())
+                if cocktail:
+                    return cocktail
+            return None
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            submitted = 0
+            pending = set()
+            while True:
+                # Keep the pool full until max_attempts requests have been sent
+                while submitted < max_attempts and len(pending) < workers:
+                    pending.add(executor.submit(self.get_random_cocktail))
+                    submitted += 1
+                if not pending:
+                    return None
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    cocktail = self.validate_cocktail(future.result())
+                    if cocktail:
+                        return cocktail
+        finally:
+            # Drop queued requests and don't wait for the ones still in flight
+            executor.shutdown(wait=False, cancel_futures=True)
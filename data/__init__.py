@@ -1 +1,2 @@
 from .cocktails_data import cocktail_list
+from .recipe_store import recipe_store, get_recipe_store
@@ -0,0 +1,179 @@
+import json
+import os
+import threading
+import time
+
+
+class calibration_journal:
+    def __init__(
+        self, path="data/calibration.jsonl", defaults=None, flow_defaults=None
+    ):
+        """
+        Initialize the append-only calibration journal.
+
+        Every save appends one versioned JSON line holding the per-pump records
+        (tube fill time and flow rate) of that calibration. A line is only
+        trusted once it is complete, so a crash mid-write leaves the previous
+        calibration in effect.
+
+        Args:
+            path (str): The path of the journal file.
+            defaults (list): The tube fill times used before any calibration.
+            flow_defaults (list): The pump flow rates in ml/sec used before any
+                calibration.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.listeners = []
+        self.version = 0
+        self.fill_times = list(defaults or [])
+        self.flow_rates = list(flow_defaults or [])
+        self.load()
+
+    def load(self) -> None:
+        """
+        Replay the journal to get the latest fill time and flow rate of every pump.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r") as file:
+            for line in file:
+                if not line.endswith("\n"):
+                    break  # Torn write from a crash
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self.apply_record(record)
+
+    def apply_record(self, record) -> None:
+        """
+        Apply a journal record to the in-memory fill times and flow rates.
+
+        Args:
+            record (dict): The record with its version and per-pump entries.
+
+        Returns:
+            None
+        """
+        for entry in record["pumps"]:
+            pump = entry["pump"]
+            for key, values in (
+                ("fill_time", self.fill_times),
+                ("flow_rate", self.flow_rates),
+            ):
+                if entry.get(key) is None:
+                    continue
+                if key == "flow_rate" and entry[key] <= 0:
+                    continue  # A bad measurement would stop every pour
+                if pump >= len(values):
+                    # Pumps without a value yet copy the last one (or 0)
+                    values.extend(
+                        [values[-1] if values else 0] * (pump + 1 - len(values))
+                    )
+                values[pump] = entry[key]
+        self.version = record["version"]
+
+    def save(self, fill_times, relay_pins=None, flow_rates=None) -> int:
+        """
+        Append a calibration to the journal and notify the listeners.
+
+        Args:
+            fill_times (dict): The new fill time in seconds of each pump index.
+            relay_pins (list): The GPIO pins of the pumps, recorded for reference.
+            flow_rates (dict): The new flow rate in ml/sec of each pump index.
+
+        Returns:
+            int: The version of the saved calibration.
+
+        Raises:
+            ValueError: If a flow rate is not positive.
+        """
+        flow_rates = flow_rates or {}
+        for pump, flow_rate in flow_rates.items():
+            if flow_rate is not None and flow_rate <= 0:
+                raise ValueError(
+                    f"Flow rate of pump {pump} must be positive, got {flow_rate}"
+                )
+        with self.lock:
+            record = {
+                "version": self.version + 1,
+                "time": time.time(),
+                "pumps": [
+                    {
+                        "pump": pump,
+                        "relay_pin": relay_pins[pump] if relay_pins else None,
+                        "fill_time": fill_times.get(pump),
+                        "flow_rate": flow_rates.get(pump),
+                    }
+                    for pump in sorted(set(fill_times) | set(flow_rates))
+                ],
+            }
+            line = json.dumps(record) + "\n"
+
+            # Start on a fresh line if the last write was torn
+            if os.path.exists(self.path) and os.path.getsize(self.path):
+                with open(self.path, "rb") as file:
+                    file.seek(-1, os.SEEK_END)
+                    if file.read(1) != b"\n":
+                        line = "\n" + line
+
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line.encode())
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            self.apply_record(record)
+            version = self.version
+            fill_times, flow_rates = list(self.fill_times), list(self.flow_rates)
+
+        for listener in self.listeners:
+            listener(version, fill_times, flow_rates)
+        return version
+
+    def subscribe(self, listener) -> None:
+        """
+        Register a function called with the new calibration after every save.
+
+        The function gets the version, the fill times and the flow rates.
+
+        Args:
+            listener (function): The function to call.
+
+        Returns:
+            None
+        """
+        self.listeners.append(listener)
+
+    def history(self) -> list:
+        """
+        Get every complete record in the journal.
+
+        Args:
+            None
+
+        Returns:
+            list: The records, oldest first.
+        """
+        records = []
+        if os.path.exists(self.path):
+            with open(self.path, "r") as file:
+                for line in file:
+                    if not line.endswith("\n"):
+                        break
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        continue
+        return records
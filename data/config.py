@@ -1 +1,26 @@
 TUBE_FILL_TIMES = [5.88, 6.14, 4.95, 4.51]
+
+# Flow rate of each pump in ml/sec for water-thin liquids (roughly 1.6 from testing)
+PUMP_FLOW_RATES = [1.6, 1.6, 1.6, 1.6]
+
+# Flow rate of each viscosity class relative to a thin liquid
+VISCOSITY_FACTORS = {
+    "thin": 1.0,
+    "medium": 0.8,
+    "thick": 0.6,
+    "syrup": 0.45,
+}
+
+# Viscosity class of the ingredients that don't pour like water (default "thin")
+INGREDIENT_VISCOSITY = {
+    "coffee liqueur": "medium",
+    "creme de violette": "medium",
+    "maraschino liqueur": "medium",
+    "orange juice": "medium",
+    "light cream": "medium",
+    "egg white": "thick",
+    "heavy cream": "thick",
+    "whipping cream": "thick",
+    "sugar syrup": "syrup",
+    "honey": "syrup",
+}
@@ -0,0 +1,167 @@
+class ingredient_index:
+    def __init__(self):
+        """
+        Initialize an inverted index from ingredients to cocktails.
+
+        Ingredients are interned to bit positions and each cocktail is stored
+        as a bitmask of its ingredients. Each ingredient also keeps a bitset of
+        the cocktail rows that use it, so finding every makeable cocktail is a
+        handful of OR/AND operations on Python integers.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.ingredient_ids = {}  # ingredient -> bit position
+        self.postings = []  # ingredient id -> bitset of cocktail rows
+        self.keys = []  # cocktail row -> cocktail key
+        self.masks = []  # cocktail row -> bitmask of ingredient ids
+        self.rows = {}  # cocktail key -> cocktail row
+        self.all_rows = 0  # bitset of rows holding a cocktail
+
+    def intern(self, ingredient) -> int:
+        """
+        Get the ID of an ingredient, assigning a new one if needed.
+
+        Args:
+            ingredient (str): The ingredient name.
+
+        Returns:
+            int: The ingredient ID.
+        """
+        ingredient = ingredient.strip().lower()
+        ingredient_id = self.ingredient_ids.get(ingredient)
+        if ingredient_id is None:
+            ingredient_id = len(self.postings)
+            self.ingredient_ids[ingredient] = ingredient_id
+            self.postings.append(0)
+        return ingredient_id
+
+    def mask(self, ingredients) -> int:
+        """
+        Encode a set of ingredients as a bitmask, ignoring unknown ingredients.
+
+        Args:
+            ingredients (iterable): The ingredient names.
+
+        Returns:
+            int: The bitmask of ingredient IDs.
+        """
+        mask = 0
+        for ingredient in ingredients:
+            ingredient_id = self.ingredient_ids.get(ingredient.strip().lower())
+            if ingredient_id is not None:
+                mask |= 1 << ingredient_id
+        return mask
+
+    def add(self, key, ingredients) -> None:
+        """
+        Add a cocktail to the index, replacing any cocktail with the same key.
+
+        Args:
+            key: The cocktail key, e.g. its name or drink ID.
+            ingredients (iterable): The ingredient names of the cocktail.
+
+        Returns:
+            None
+        """
+        self.remove(key)
+        row = len(self.keys)
+        mask = 0
+        for ingredient in ingredients:
+            ingredient_id = self.intern(ingredient)
+            mask |= 1 << ingredient_id
+            self.postings[ingredient_id] |= 1 << row
+        self.keys.append(key)
+        self.masks.append(mask)
+        self.rows[key] = row
+        self.all_rows |= 1 << row
+
+    def remove(self, key) -> None:
+        """
+        Remove a cocktail from the index.
+
+        Args:
+            key: The cocktail key.
+
+        Returns:
+            None
+        """
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        bit = 1 << row
+        mask = self.masks[row]
+        while mask:
+            low = mask & -mask
+            self.postings[low.bit_length() - 1] &= ~bit
+            mask ^= low
+        self.masks[row] = 0
+        self.all_rows &= ~bit
+
+    def can_make(self, key, ingredients) -> bool:
+        """
+        Check whether a cocktail can be made from the given ingredients.
+
+        Args:
+            key: The cocktail key.
+            ingredients (iterable): The available ingredient names.
+
+        Returns:
+            bool: True if every ingredient of the cocktail is available.
+        """
+        row = self.rows.get(key)
+        if row is None:
+            return False
+        return self.masks[row] & ~self.mask(ingredients) == 0
+
+    def makeable(self, ingredients) -> list:
+        """
+        Find every cocktail that can be made from the given ingredients.
+
+        Args:
+            ingredients (iterable): The available ingredient names.
+
+        Returns:
+            list: The keys of the makeable cocktails.
+        """
+        available = self.mask(ingredients)
+        missing = 0
+        for ingredient_id, posting in enumerate(self.postings):
+            if not available >> ingredient_id & 1:
+                missing |= posting
+        return self.keys_of(self.all_rows & ~missing)
+
+    def cocktails_with(self, ingredient) -> list:
+        """
+        Find every cocktail that uses an ingredient.
+
+        Args:
+            ingredient (str): The ingredient name.
+
+        Returns:
+            list: The keys of the cocktails using the ingredient.
+        """
+        ingredient_id = self.ingredient_ids.get(ingredient.strip().lower())
+        if ingredient_id is None:
+            return []
+        return self.keys_of(self.postings[ingredient_id])
+
+    def keys_of(self, rows) -> list:
+        """
+        Get the cocktail keys of a bitset of rows.
+
+        Args:
+            rows (int): The bitset of cocktail rows.
+
+        Returns:
+            list: The cocktail keys in row order.
+        """
+        keys = []
+        while rows:
+            low = rows & -rows
+            keys.append(self.keys[low.bit_length() - 1])
+            rows ^= low
+        return keys
@@ -0,0 +1,177 @@
+import re
+from functools import lru_cache
+
+PART_OZ = 1.0  # ounces per part when a recipe mixes parts with real measures
+SERVING_OZ = 4.0  # total ounces of a recipe measured only in parts
+JUICE_OZ = 1.0  # ounces of juice in one fruit ("Juice of 1")
+
+# Ounces in one of each unit, by every spelling seen in CocktailDB measures
+UNIT_OZ = {
+    "oz": 1.0,
+    "ounce": 1.0,
+    "ounces": 1.0,
+    "cl": 0.33814,
+    "ml": 1 / 29.574,
+    "l": 33.814,
+    "tsp": 1 / 6,
+    "teaspoon": 1 / 6,
+    "teaspoons": 1 / 6,
+    "tbsp": 0.5,
+    "tblsp": 0.5,
+    "tablespoon": 0.5,
+    "tablespoons": 0.5,
+    "dash": 1 / 32,
+    "dashes": 1 / 32,
+    "drop": 1 / 576,
+    "drops": 1 / 576,
+    "splash": 0.25,
+    "shot": 1.5,
+    "shots": 1.5,
+    "jigger": 1.5,
+    "jiggers": 1.5,
+    "cup": 8.0,
+    "cups": 8.0,
+    "pint": 16.0,
+    "pints": 16.0,
+}
+PART_UNITS = {"part", "parts"}
+# Units that mean one of themselves without a number ("Dash", "a splash of")
+SINGLE_UNITS = {"dash", "dashes", "splash"}
+
+UNICODE_FRACTIONS = {
+    "½": " 1/2",
+    "¼": " 1/4",
+    "¾": " 3/4",
+    "⅓": " 1/3",
+    "⅔": " 2/3",
+    "⅛": " 1/8",
+}
+
+# "1", "1.5", "1/2", "1 1/2", optionally a range such as "1-2" or "1 to 2"
+NUMBER = r"(?:\d+\s+\d+/\d+|\d+/\d+|\d+(?:\.\d+)?|\.\d+)"
+QUANTITY = re.compile(rf"^({NUMBER})(?:\s*(?:-|to)\s*({NUMBER}))?\s*(.*)$")
+
+
+def parse_number(text) -> float:
+    """
+    Parse a whole, decimal, fraction or mixed number such as "1 1/2".
+
+    Args:
+        text (str): The number.
+
+    Returns:
+        float: The value.
+    """
+    total = 0.0
+    for part in text.split():
+        if "/" in part:
+            numerator, denominator = part.split("/")
+            total += int(numerator) / int(denominator) if int(denominator) else 0
+        else:
+            total += float(part)
+    return total
+
+
+@lru_cache(maxsize=4096)
+def parse_measure(measure):
+    """
+    Parse a CocktailDB strMeasure string.
+
+    Results are memoized, since a catalog repeats the same few hundred
+    strings ("1 oz", "1/2 oz", "2 cl", ...) across thousands of ingredients.
+
+    Args:
+        measure (str): The measure, e.g. "1 1/2 oz", "2 cl", "Dash" or
+            "Juice of 1".
+
+    Returns:
+        tuple: The amount and its unit ("oz" or "part"), or None if the
+            measure is not a pourable amount (e.g. "Garnish" or "Fill with").
+    """
+    if not measure:
+        return None
+    text = measure.strip().lower()
+    for fraction, replacement in UNICODE_FRACTIONS.items():
+        text = text.replace(fraction, replacement)
+    text = text.strip()
+
+    juice = text.startswith("juice of")
+    if juice:
+        text = text[len("juice of") :].strip()
+
+    match = QUANTITY.match(text)
+    if not match:
+        words = text.replace(".", " ").split()
+        if words and words[0] in ("a", "an"):
+            words = words[1:]
+        if words and words[0] in SINGLE_UNITS and not juice:
+            return (UNIT_OZ[words[0]], "oz")
+        return None
+    amount = parse_number(match.group(1))
+    if match.group(2):
+        amount = (amount + parse_number(match.group(2))) / 2  # Middle of a range
+    if amount <= 0:
+        return None
+    if juice:
+        return (amount * JUICE_OZ, "oz")
+
+    words = match.group(3).replace(".", " ").split()
+    unit = words[0] if words else ""
+    if unit == "fl" and len(words) > 1:
+        unit = words[1]
+    if unit in PART_UNITS:
+        return (amount, "part")
+    if unit in UNIT_OZ:
+        return (amount * UNIT_OZ[unit], "oz")
+    return None  # A count of pieces (e.g. "2" limes) is not poured
+
+
+def measures_to_oz(measures) -> dict:
+    """
+    Convert the measures of one recipe to ounces.
+
+    Relative parts become SERVING_OZ of drink in total when the whole recipe
+    is in parts, and PART_OZ each when it also has real measures. Numbers
+    are kept as they are, and anything that can't be poured becomes 0.
+
+    Args:
+        measures (dict): The measure of each ingredient, as a string or number.
+
+    Returns:
+        dict: The amount of each ingredient in ounces, in the same order.
+    """
+    parsed = {}
+    for ingredient, measure in measures.items():
+        if isinstance(measure, (int, float)):
+            parsed[ingredient] = (float(measure), "oz")
+        else:
+            parsed[ingredient] = parse_measure(str(measure))
+
+    parts = sum(p[0] for p in parsed.values() if p and p[1] == "part")
+    if parts and all(p is None or p[1] == "part" for p in parsed.values()):
+        part_oz = SERVING_OZ / parts
+    else:
+        part_oz = PART_OZ
+
+    ounces = {}
+    for ingredient, value in parsed.items():
+        if value is None:
+            ounces[ingredient] = 0.0
+        elif value[1] == "part":
+            ounces[ingredient] = round(value[0] * part_oz, 3)
+        else:
+            ounces[ingredient] = round(value[0], 3)
+    return ounces
+
+
+def drop_unpoured(ounces) -> dict:
+    """
+    Leave out the ingredients of a recipe that are not poured (0 oz or less).
+
+    Args:
+        ounces (dict): The amount of each ingredient in ounces.
+
+    Returns:
+        dict: The poured ingredients, in the same order.
+    """
+    return {ingredient: amount for ingredient, amount in ounces.items() if amount > 0}
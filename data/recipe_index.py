@@ -0,0 +1,167 @@
+import bisect
+import unicodedata
+
+
+def normalize_name(name) -> str:
+    """
+    Normalize a cocktail name for lookups.
+
+    Case-folds, strips accents and collapses whitespace, so "Piña  Colada"
+    and "pina colada" find the same recipe.
+
+    Args:
+        name (str): The cocktail name.
+
+    Returns:
+        str: The normalized name.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+def trigrams(text) -> set:
+    """
+    Get the character trigrams of a string, padded so short words still match.
+
+    Args:
+        text (str): The normalized text.
+
+    Returns:
+        set: The trigrams.
+    """
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class recipe_index:
+    def __init__(self, cocktails=()):
+        """
+        Initialize the in-memory recipe index.
+
+        Recipes are keyed by normalized name for O(1) lookups. A sorted list of
+        every word in every name answers prefix searches with a binary search,
+        and a trigram index finds names with typos.
+
+        Args:
+            cocktails (iterable): The cocktails to index.
+
+        Returns:
+            None
+        """
+        self.recipes = {}  # normalized name -> cocktail
+        self.words = []  # sorted (word, normalized name) pairs
+        self.trigram_names = {}  # trigram -> set of normalized names
+        for cocktail in cocktails:
+            self.add(cocktail)
+
+    def __len__(self):
+        return len(self.recipes)
+
+    def get(self, name):
+        """
+        Get a cocktail by name.
+
+        Args:
+            name (str): The cocktail name in any case or spacing.
+
+        Returns:
+            dict: The cocktail or None if it is not found.
+        """
+        return self.recipes.get(normalize_name(name))
+
+    def add(self, cocktail) -> None:
+        """
+        Add a cocktail, replacing any cocktail with the same normalized name.
+
+        Args:
+            cocktail (dict): The cocktail with its name and ingredients.
+
+        Returns:
+            None
+        """
+        key = normalize_name(cocktail["name"])
+        self.remove(key)
+        self.recipes[key] = cocktail
+        for word in set(key.split()):
+            bisect.insort(self.words, (word, key))
+        for trigram in trigrams(key):
+            self.trigram_names.setdefault(trigram, set()).add(key)
+
+    def remove(self, name) -> None:
+        """
+        Remove a cocktail from the index.
+
+        Args:
+            name (str): The cocktail name.
+
+        Returns:
+            None
+        """
+        key = normalize_name(name)
+        if self.recipes.pop(key, None) is None:
+            return
+        for word in set(key.split()):
+            i = bisect.bisect_left(self.words, (word, key))
+            del self.words[i]
+        for trigram in trigrams(key):
+            self.trigram_names[trigram].discard(key)
+
+    def prefix_search(self, prefix) -> list:
+        """
+        Find the cocktails with a word starting with the given prefix.
+
+        Args:
+            prefix (str): The typed prefix.
+
+        Returns:
+            list: The matching cocktail names, names starting with the prefix first.
+        """
+        prefix = normalize_name(prefix)
+        if not prefix:
+            return sorted(self.recipes)
+
+        # Find names with a word starting with the first typed word, then
+        # require every other typed word to start a word of the name too
+        typed = prefix.split()
+        matches = set()
+        i = bisect.bisect_left(self.words, (typed[0],))
+        while i < len(self.words) and self.words[i][0].startswith(typed[0]):
+            key = self.words[i][1]
+            words = key.split()
+            if all(any(w.startswith(t) for w in words) for t in typed[1:]):
+                matches.add(key)
+            i += 1
+        return sorted(matches, key=lambda key: (not key.startswith(prefix), key))
+
+    def search(self, query, limit=20) -> list:
+        """
+        Search cocktails for type-ahead, falling back to fuzzy matches for typos.
+
+        Args:
+            query (str): The typed text.
+            limit (int): The maximum number of results.
+
+        Returns:
+            list: The matching cocktail names, best matches first.
+        """
+        results = self.prefix_search(query)[:limit]
+        if len(results) >= limit or len(normalize_name(query)) < 3:
+            return results
+
+        query_trigrams = trigrams(normalize_name(query))
+        scores = {}
+        for trigram in query_trigrams:
+            for key in self.trigram_names.get(trigram, ()):
+                scores[key] = scores.get(key, 0) + 1
+
+        found = set(results)
+        fuzzy = sorted(
+            (
+                (-score / len(query_trigrams | trigrams(key)), key)
+                for key, score in scores.items()
+                if key not in found
+            )
+        )
+        results.extend(key for score, key in fuzzy if -score >= 0.3)
+        return results[:limit]
@@ -0,0 +1,388 @@
+import sqlite3
+import threading
+from .cocktails_data import cocktail_list
+from .recipe_index import recipe_index, normalize_name
+from .measures import measures_to_oz, drop_unpoured
+
+SCHEMA_VERSION = 3
+
+
+class recipe_store:
+    def __init__(self, path="data/recipes.db", seed=None):
+        """
+        Initialize the SQLite recipe store.
+
+        Cocktails are indexed by name and ingredient. On first use the store is
+        migrated from the seed list (the cocktail_list in cocktails_data.py).
+        Name lookups and searches are served from an in-memory recipe_index
+        that is kept in step with every save. The store also counts how often
+        each cocktail was poured, and tells its listeners about every save
+        and pour.
+
+        Args:
+            path (str): The path of the SQLite database.
+            seed (list): The cocktails to migrate into an empty store.
+
+        Returns:
+            None
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.listeners = []
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        if version < SCHEMA_VERSION:
+            self.migrate(seed or [], version)
+        self.index = recipe_index(self.load_cocktails())
+
+    def migrate(self, seed, version=0) -> None:
+        """
+        Upgrade the database to SCHEMA_VERSION in one transaction.
+
+        Version 1 creates the schema and imports the seed cocktails. Version 2
+        converts measures saved as strings (e.g. "1 1/2 oz") to ounces and
+        drops the ingredients that are not poured (e.g. "Garnish"). Version 3
+        adds the pour counts.
+
+        Args:
+            seed (list): The cocktails to import into a new database.
+            version (int): The schema version of the database.
+
+        Returns:
+            None
+        """
+        with self.lock, self.connection:
+            self.connection.execute("BEGIN")
+            if version < 1:
+                self.create_schema(seed)
+            if version < 2:
+                self.normalize_measures()
+            if version < 3:
+                self.connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS pour_counts (
+                        name TEXT PRIMARY KEY,
+                        count INTEGER NOT NULL
+                    )
+                    """
+                )
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def create_schema(self, seed) -> None:
+        """
+        Create the tables and import the seed cocktails inside the migration.
+
+        Args:
+            seed (list): The cocktails to import.
+
+        Returns:
+            None
+        """
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cocktails (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE
+            )
+            """
+        )
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cocktail_ingredients (
+                cocktail_id INTEGER NOT NULL
+                    REFERENCES cocktails (id) ON DELETE CASCADE,
+                position INTEGER NOT NULL,
+                ingredient TEXT NOT NULL,
+                amount,
+                PRIMARY KEY (cocktail_id, position)
+            )
+            """
+        )
+        self.connection.execute(
+            """
+            CREATE INDEX IF NOT EXISTS cocktail_ingredients_ingredient
+                ON cocktail_ingredients (ingredient)
+            """
+        )
+        for cocktail in seed:
+            self.insert(cocktail)
+
+    def normalize_measures(self) -> None:
+        """
+        Convert every measure saved as a string to ounces inside the migration.
+
+        Ingredients that are not poured (0 oz or less) are deleted.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        rows = self.connection.execute(
+            "SELECT cocktail_id, position, ingredient, amount FROM cocktail_ingredients"
+            " ORDER BY cocktail_id, position"
+        ).fetchall()
+        recipes = {}
+        for cocktail_id, position, ingredient, amount in rows:
+            recipes.setdefault(cocktail_id, {})[(position, ingredient)] = amount
+        for cocktail_id, measures in recipes.items():
+            if all(isinstance(a, (int, float)) for a in measures.values()):
+                continue
+            ounces = measures_to_oz(measures)
+            self.connection.executemany(
+                "UPDATE cocktail_ingredients SET amount = ?"
+                " WHERE cocktail_id = ? AND position = ?",
+                [
+                    (amount, cocktail_id, position)
+                    for (position, ingredient), amount in ounces.items()
+                ],
+            )
+        self.connection.execute("DELETE FROM cocktail_ingredients WHERE amount <= 0")
+
+    def insert(self, cocktail) -> None:
+        """
+        Insert or replace a cocktail. Must be called inside a transaction.
+
+        Args:
+            cocktail (dict): The cocktail with its name and ingredients.
+
+        Returns:
+            None
+        """
+        name = normalize_name(cocktail["name"])
+        self.connection.execute("DELETE FROM cocktails WHERE name = ?", (name,))
+        cursor = self.connection.execute(
+            "INSERT INTO cocktails (name) VALUES (?)", (name,)
+        )
+        self.connection.executemany(
+            "INSERT INTO cocktail_ingredients VALUES (?, ?, ?, ?)",
+            [
+                (cursor.lastrowid, position, ingredient, amount)
+                for position, (ingredient, amount) in enumerate(
+                    cocktail["ingredients"].items()
+                )
+            ],
+        )
+
+    def save_cocktail(self, cocktail) -> None:
+        """
+        Save a cocktail in a single transaction, replacing one with the same name.
+
+        Measures given as strings (e.g. "1 1/2 oz") are stored in ounces, and
+        ingredients that are not poured (e.g. "Garnish") are left out.
+
+        Args:
+            cocktail (dict): The cocktail with its name and ingredients.
+
+        Returns:
+            None
+        """
+        cocktail = {
+            "name": normalize_name(cocktail["name"]),
+            "ingredients": drop_unpoured(measures_to_oz(cocktail["ingredients"])),
+        }
+        with self.lock:
+            with self.connection:
+                self.insert(cocktail)
+            self.index.add(cocktail)
+        self.notify("saved", cocktail["name"])
+
+    def record_pour(self, name) -> None:
+        """
+        Count one pour of a cocktail.
+
+        Args:
+            name (str): The name of the cocktail in any case or spacing.
+
+        Returns:
+            None
+        """
+        name = normalize_name(name)
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT INTO pour_counts VALUES (?, 1)"
+                " ON CONFLICT (name) DO UPDATE SET count = count + 1",
+                (name,),
+            )
+        self.notify("poured", name)
+
+    def pour_counts(self) -> dict:
+        """
+        Get how many times each cocktail was poured.
+
+        Args:
+            None
+
+        Returns:
+            dict: The pour count of each cocktail name that was poured.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                "SELECT name, count FROM pour_counts"
+            ).fetchall()
+        return dict(rows)
+
+    def subscribe(self, listener) -> None:
+        """
+        Register a function called after every save and pour.
+
+        The function gets the event ("saved" or "poured") and the cocktail
+        name, on the thread that changed the store.
+
+        Args:
+            listener (function): The function to call.
+
+        Returns:
+            None
+        """
+        self.listeners.append(listener)
+
+    def notify(self, event, name) -> None:
+        """
+        Call every listener with a change to the store.
+
+        Args:
+            event (str): "saved" or "poured".
+            name (str): The normalized cocktail name.
+
+        Returns:
+            None
+        """
+        for listener in self.listeners:
+            listener(event, name)
+
+    def load_cocktails(self) -> list:
+        """
+        Read every cocktail from the database in the order they were saved.
+
+        Args:
+            None
+
+        Returns:
+            list: The cocktails with their names and ingredients.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT cocktails.name, ingredient, amount FROM cocktails
+                LEFT JOIN cocktail_ingredients ON cocktail_id = cocktails.id
+                ORDER BY cocktails.id, position
+                """
+            ).fetchall()
+        cocktails = {}
+        for name, ingredient, amount in rows:
+            ingredients = cocktails.setdefault(name, {})
+            if ingredient is not None:
+                ingredients[ingredient] = amount
+        return [{"name": n, "ingredients": i} for n, i in cocktails.items()]
+
+    def get_cocktail(self, name):
+        """
+        Get a cocktail by name.
+
+        Args:
+            name (str): The name of the cocktail in any case or spacing.
+
+        Returns:
+            dict: The cocktail or None if it is not found.
+        """
+        cocktail = self.index.get(name)
+        if cocktail is None:
+            return None
+        return {"name": cocktail["name"], "ingredients": dict(cocktail["ingredients"])}
+
+    def has_cocktail(self, name) -> bool:
+        """
+        Check whether a cocktail is in the store.
+
+        Args:
+            name (str): The name of the cocktail in any case or spacing.
+
+        Returns:
+            bool: True if the cocktail exists.
+        """
+        return self.index.get(name) is not None
+
+    def all_cocktails(self) -> list:
+        """
+        Get every cocktail in the order they were saved.
+
+        Args:
+            None
+
+        Returns:
+            list: The cocktails with their names and ingredients.
+        """
+        return [
+            {"name": c["name"], "ingredients": dict(c["ingredients"])}
+            for c in list(self.index.recipes.values())
+        ]
+
+    def names(self) -> set:
+        """
+        Get the names of every cocktail.
+
+        Args:
+            None
+
+        Returns:
+            set: The cocktail names.
+        """
+        return set(self.index.recipes)
+
+    def search(self, query, limit=20) -> list:
+        """
+        Search cocktail names by prefix, falling back to fuzzy matches.
+
+        Args:
+            query (str): The typed text.
+            limit (int): The maximum number of results.
+
+        Returns:
+            list: The matching cocktail names, best matches first.
+        """
+        return self.index.search(query, limit)
+
+    def find_by_ingredient(self, ingredient) -> list:
+        """
+        Find the cocktails that use an ingredient.
+
+        Args:
+            ingredient (str): The ingredient name (case-insensitive).
+
+        Returns:
+            list: The names of the cocktails using the ingredient.
+        """
+        with self.lock:
+            rows = self.connection.execute(
+                """
+                SELECT DISTINCT name FROM cocktails
+                JOIN cocktail_ingredients ON cocktail_id = cocktails.id
+                WHERE ingredient = ?
+                ORDER BY name
+                """,
+                (ingredient.strip().lower(),),
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+shared_store = None
+
+
+def get_recipe_store() -> recipe_store:
+    """
+    Get the recipe store shared by the whole application.
+
+    Args:
+        None
+
+    Returns:
+        recipe_store: The shared store, migrated from cocktail_list on first use.
+    """
+    global shared_store
+    if shared_store is None:
+        shared_store = recipe_store(seed=cocktail_list)
+    return shared_store
@@ -0,0 +1,220 @@
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QColor
+from gui.theme import DISABLED_TEXT
+from data.ingredient_index import ingredient_index
+
+# Item data roles of the cocktail list model
+NAME_ROLE = Qt.ItemDataRole.UserRole
+MAKEABLE_ROLE = Qt.ItemDataRole.UserRole + 1
+POUR_COUNT_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+class CocktailListModel(QAbstractListModel):
+    # Emitted by the store listener, delivered on the GUI thread
+    store_changed = pyqtSignal(str, str)
+
+    def __init__(self, recipes, parent=None):
+        """
+        Initialize the model over every cocktail in the recipe store.
+
+        The model is built once and kept in step with the store: a saved
+        recipe inserts or updates one row and a pour updates one pour count,
+        so showing the picker again costs nothing.
+
+        Args:
+            recipes (recipe_store): The recipe store.
+            parent (QObject): The parent object of the model.
+
+        Returns:
+            None
+        """
+        super().__init__(parent)
+        self.recipes = recipes
+        self.cocktails = []  # row -> cocktail, in the order they were saved
+        self.rows = {}  # cocktail name -> row
+        self.ingredient_index = ingredient_index()
+        self.stock = set()
+        self.makeable = set()
+        for cocktail in recipes.all_cocktails():
+            self.rows[cocktail["name"]] = len(self.cocktails)
+            self.cocktails.append(cocktail)
+            self.ingredient_index.add(cocktail["name"], cocktail["ingredients"])
+        self.pour_counts = recipes.pour_counts()
+        self.missing_brush = QColor(DISABLED_TEXT)
+        self.store_changed.connect(self.apply_store_change)
+        recipes.subscribe(self.store_changed.emit)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.cocktails)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Return the data of a row.
+
+        Args:
+            index (QModelIndex): The row.
+            role (Qt.ItemDataRole): The requested role.
+
+        Returns:
+            The display text, the grey text color of a cocktail that can't be
+            made yet, or the name, makeable flag or pour count of the
+            cocktail for the custom roles, or None.
+        """
+        if not index.isValid():
+            return None
+        cocktail = self.cocktails[index.row()]
+        name = cocktail["name"]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if name in self.makeable:
+                return name.title()
+            missing = [i for i in cocktail["ingredients"] if i not in self.stock]
+            return f"{name.title()} (missing: {', '.join(missing)})"
+        if role == Qt.ItemDataRole.ForegroundRole and name not in self.makeable:
+            return self.missing_brush
+        if role == NAME_ROLE:
+            return name
+        if role == MAKEABLE_ROLE:
+            return name in self.makeable
+        if role == POUR_COUNT_ROLE:
+            return self.pour_counts.get(name, 0)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        # Cocktails missing ingredients stay selectable: greyed out, sorted
+        # last, and poured once the operator attaches the missing lines
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def set_stock(self, stock) -> None:
+        """
+        Set the stocked ingredients and refresh the makeable state of every row.
+
+        Args:
+            stock (set): The stocked ingredient names.
+
+        Returns:
+            None
+        """
+        self.stock = set(stock)
+        makeable = set(self.ingredient_index.makeable(self.stock))
+        changed = makeable != self.makeable
+        self.makeable = makeable
+        if changed and self.cocktails:
+            # One signal for the whole list, so the proxy re-sorts only once
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self.cocktails) - 1, 0)
+            )
+
+    def apply_store_change(self, event, name) -> None:
+        """
+        Apply a save or pour reported by the recipe store.
+
+        Args:
+            event (str): "saved" or "poured".
+            name (str): The cocktail name.
+
+        Returns:
+            None
+        """
+        if event == "poured":
+            self.pour_counts[name] = self.pour_counts.get(name, 0) + 1
+            self.emit_row_changed(name)
+            return
+
+        cocktail = self.recipes.get_cocktail(name)
+        if cocktail is None:
+            return
+        self.ingredient_index.add(name, cocktail["ingredients"])
+        if self.ingredient_index.can_make(name, self.stock):
+            self.makeable.add(name)
+        else:
+            self.makeable.discard(name)
+        if name in self.rows:
+            self.cocktails[self.rows[name]] = cocktail
+            self.emit_row_changed(name)
+            return
+        row = len(self.cocktails)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows[name] = row
+        self.cocktails.append(cocktail)
+        self.endInsertRows()
+
+    def emit_row_changed(self, name) -> None:
+        row = self.rows.get(name)
+        if row is not None:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+
+class CocktailFilterModel(QSortFilterProxyModel):
+    def __init__(self, recipes, parent=None):
+        """
+        Initialize the live search, "makeable now" filter and sort of the picker.
+
+        Makeable cocktails come first, then the rest in the order they were
+        saved, or by pour count when sorting by popularity.
+
+        Args:
+            recipes (recipe_store): The recipe store, whose search ranks names.
+            parent (QObject): The parent object of the model.
+
+        Returns:
+            None
+        """
+        super().__init__(parent)
+        self.recipes = recipes
+        self.matches = None  # names matching the search, or None for all
+        self.makeable_only = False
+        self.by_popularity = False
+        self.setDynamicSortFilter(True)
+        self.sort(0)
+
+    def set_search(self, text) -> None:
+        """
+        Filter the cocktails by the typed text.
+
+        Args:
+            text (str): The search text.
+
+        Returns:
+            None
+        """
+        if text.strip():
+            limit = self.sourceModel().rowCount()
+            self.matches = set(self.recipes.search(text, limit=limit))
+        else:
+            self.matches = None
+        self.invalidateFilter()
+
+    def set_makeable_only(self, makeable_only) -> None:
+        self.makeable_only = makeable_only
+        self.invalidateFilter()
+
+    def set_by_popularity(self, by_popularity) -> None:
+        self.by_popularity = by_popularity
+        self.invalidate()
+
+    def filterAcceptsRow(self, source_row, source_parent) -> bool:
+        index = self.sourceModel().index(source_row, 0, source_parent)
+        if self.makeable_only and not index.data(MAKEABLE_ROLE):
+            return False
+        return self.matches is None or index.data(NAME_ROLE) in self.matches
+
+    def lessThan(self, left, right) -> bool:
+        left_makeable = left.data(MAKEABLE_ROLE)
+        right_makeable = right.data(MAKEABLE_ROLE)
+        if left_makeable != right_makeable:
+            return left_makeable
+        if self.by_popularity:
+            left_count = left.data(POUR_COUNT_ROLE)
+            right_count = right.data(POUR_COUNT_ROLE)
+            if left_count != right_count:
+                return left_count > right_count
+        return left.row() < right.row()
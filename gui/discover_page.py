@@ -1,4 +1,3 @@
-import json
 import threading
 from PyQt6.QtWidgets import (
     QWidget,
@@ -9,7 +8,8 @@ from PyQt6.QtWidgets import (
     QLineEdit,
 )
 from PyQt6.QtCore import QMetaObject, Q_ARG, Qt, pyqtSlot
-from PyQt6.QtGui import QFontDatabase, QFont
+from PyQt6.QtGui import QFont
+from gui.theme import load_fonts
 from cocktaildb import cocktaildb
 from .numpad import Numpad
 
@@ -27,34 +27,26 @@ class DiscoverPage(QWidget):
         """
         super().__init__(parent)
 
-        # Load custom fonts
-        font_id = QFontDatabase.addApplicationFont("media/fonts/InterVariable.ttf")
-        consolas_font_id = QFontDatabase.addApplicationFont("media/fonts/Consolas.ttf")
-        if font_id == -1 or consolas_font_id == -1:
-            print("Failed to load fonts")
-        else:
-            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            consolas_font_family = QFontDatabase.applicationFontFamilies(
-                consolas_font_id
-            )[0]
-            print(f"Loaded font families: {font_family}, {consolas_font_family}")
-            self.setFont(QFont(font_family))
+        # Custom fonts, registered once for the whole application
+        font_family = load_fonts()[0]
+        self.setFont(QFont(font_family))
 
         self.layout = QVBoxLayout(self)
 
         self.label = QLabel("CocktailDB API")
-        self.label.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 22px; font-weight: bold; color: #F0F6FC;"
-        )
+        self.label.setProperty("role", "page-title")
         self.layout.addWidget(self.label)
 
         self.discover_button = QPushButton("Find Random Cocktail")
-        self.discover_button.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 20px; font-weight: bold; padding: 5px; border: 1px solid #3D444D; background-color: #151B23; color: #F0F6FC;"
-        )
+        self.discover_button.setProperty("role", "nav")
         self.discover_button.clicked.connect(self.discover_cocktail)
         self.layout.addWidget(self.discover_button)
 
+        self.sync_button = QPushButton("Sync Catalog")
+        self.sync_button.setProperty("role", "nav")
+        self.sync_button.clicked.connect(self.sync_catalog)
+        self.layout.addWidget(self.sync_button)
+
         self.cocktail_display = QVBoxLayout()
         self.layout.addLayout(self.cocktail_display)
 
@@ -103,6 +95,60 @@ class DiscoverPage(QWidget):
             Q_ARG(object, new_cocktail),
         )
 
+    def sync_catalog(self):
+        """
+        Mirror the CocktailDB catalog locally so discovery works offline.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.clear_cocktail_display()
+        self.cocktail_display.addWidget(QLabel("Syncing the cocktail catalog..."))
+        self.sync_button.setEnabled(False)
+        threading.Thread(target=self.sync_catalog_in_thread).start()
+
+    def sync_catalog_in_thread(self):
+        """
+        Sync the catalog in a separate thread.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        try:
+            result = f"Synced {self.cocktail_db.sync_catalog()} cocktails."
+        except Exception as e:
+            result = f"Catalog sync failed: {e}"
+        QMetaObject.invokeMethod(
+            self,
+            "handle_catalog_synced",
+            Qt.ConnectionType.QueuedConnection,
+            Q_ARG(object, result),
+        )
+
+    @pyqtSlot(object)
+    def handle_catalog_synced(self, result):
+        """
+        Show the result of the catalog sync.
+
+        Args:
+            result: The message describing the sync result
+
+        Returns:
+            None
+        """
+        self.sync_button.setEnabled(True)
+        self.clear_cocktail_display()
+        result_label = QLabel(result)
+        result_label.setProperty("role", "body")
+        result_label.setWordWrap(True)
+        self.cocktail_display.addWidget(result_label)
+
     @pyqtSlot(object)
     def handle_discovered_cocktail(self, new_cocktail):
         """
@@ -134,23 +180,18 @@ class DiscoverPage(QWidget):
 
         cocktail_text = f"Name: {cocktail['name'].title()}\nIngredients:\n"
         cocktail_label = QLabel(cocktail_text)
-        cocktail_label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 20px; color: #F0F6FC;"
-        )
+        cocktail_label.setProperty("role", "body")
         self.cocktail_display.addWidget(cocktail_label)
 
         self.ingredient_inputs = {}
         for ingredient, measure in cocktail["ingredients"].items():
             ingredient_layout = QHBoxLayout()
-            ingredient_label = QLabel(f"{ingredient}: {measure}")
-            ingredient_label.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 18px; color: #F0F6FC;"
-            )
+            ingredient_label = QLabel(f"{ingredient}: {measure:g} oz")
             measure_input = QLineEdit()
             measure_input.setPlaceholderText("Enter value in oz")
-            measure_input.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 18px; padding: 5px; border: 1px solid #3D444D; background-color: #151B23; color: #F0F6FC;"
-            )
+            if measure:
+                measure_input.setText(f"{measure:g}")
+            measure_input.setProperty("role", "compact")
             measure_input.mousePressEvent = self.create_mouse_press_event(
                 measure_input.mousePressEvent, measure_input
             )
@@ -160,9 +201,7 @@ class DiscoverPage(QWidget):
             self.ingredient_inputs[ingredient] = measure_input
 
         save_button = QPushButton("Save Cocktail")
-        save_button.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 18px; padding: 5px; border: 1px solid #3D444D; background-color: #151B23; color: #F0F6FC;"
-        )
+        save_button.setProperty("role", "compact")
         save_button.clicked.connect(lambda: self.save_cocktail(cocktail))
         self.cocktail_display.addWidget(save_button)
 
@@ -178,9 +217,7 @@ class DiscoverPage(QWidget):
         """
         self.clear_cocktail_display()
         no_cocktail_label = QLabel("No cocktail was found.")
-        no_cocktail_label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 20px; color: #F0F6FC;"
-        )
+        no_cocktail_label.setProperty("role", "body")
         self.cocktail_display.addWidget(no_cocktail_label)
 
     def create_mouse_press_event(self, original_event, widget):
@@ -315,18 +352,15 @@ class DiscoverPage(QWidget):
             if measure:
                 try:
                     measure_value = float(measure)
-                    if measure_value != 0:
+                    if measure_value > 0:
                         updated_ingredients[ingredient] = measure_value
                 except ValueError:
                     continue
 
         cocktail["ingredients"] = updated_ingredients
 
-        # Add the cocktail to the cocktail list
-        self.cocktail_db.cocktail_list.append(cocktail)
-
-        # Save the modified cocktail list to cocktails_data.py
-        self.write_updated_cocktail_list()
+        # Save the cocktail to the recipe store
+        self.cocktail_db.recipes.save_cocktail(cocktail)
 
         # Clear the display
         self.clear_cocktail_display()
@@ -373,17 +407,3 @@ class DiscoverPage(QWidget):
                 sub_layout = item.layout()
                 if sub_layout is not None:
                     self.clear_layout(sub_layout)
-
-    def write_updated_cocktail_list(self) -> None:
-        """ "
-        Write the updated cocktail list to cocktails_data.py.
-
-        Args:
-            None
-
-        Returns:
-            None
-        """
-        with open("data/cocktails_data.py", "w") as file:
-            file.write("cocktail_list = ")
-            file.write(json.dumps(self.cocktail_db.cocktail_list, indent=4))
@@ -1,4 +1,4 @@
-import threading
+import os
 import time
 from PyQt6.QtWidgets import (
     QWidget,
@@ -7,45 +7,71 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QStackedWidget,
     QHBoxLayout,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
+    QLineEdit,
+    QProgressBar,
+    QApplication,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QFontDatabase, QFont
-from data.cocktails_data import cocktail_list
-from hardware.bartender import bartender
-
-
-# TODO: Developer Notes
-#
-# 1. Figure out why all ingredients dont start dispensing at the same time on "Make Cocktail" function.
-#   - Worked correctly first time making moscow mule after startup, then after cleaning tubes and trying again,
-#     it started dispensing one, then waited and then started the other two.
-#
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QFont
+from gui.theme import load_fonts
+from gui.cocktail_picker import CocktailListModel, CocktailFilterModel, NAME_ROLE
+from gui.hardware_worker import HardwareWorker
+from gui.ingredients_page import INGREDIENTS_CSV, load_ingredients_from_csv
+from hardware.executor import ACCEPTED, BUSY, FULL
+from hardware.loadout import covered_recipes
+from hardware.bartender import bartender, RELAY_PINS
+from data.recipe_store import get_recipe_store
+
+# Shown when the hardware executor refuses a job
+REJECTED_MESSAGES = {
+    BUSY: "The pumps are busy. Try again when they stop.",
+    FULL: "Too many jobs are waiting. Try again later.",
+}
 
 
 class FunctionsPage(QWidget):
+    CALIBRATION_SCREENS = ("calibrate_confirm", "calibrate_pump", "calibration_summary")
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        # Load custom fonts
-        font_id = QFontDatabase.addApplicationFont("media/fonts/InterVariable.ttf")
-        consolas_font_id = QFontDatabase.addApplicationFont("media/fonts/Consolas.ttf")
-        font_family = (
-            QFontDatabase.applicationFontFamilies(font_id)[0]
-            if font_id != -1
-            else "Arial"
-        )
-        consolas_font_family = (
-            QFontDatabase.applicationFontFamilies(consolas_font_id)[0]
-            if consolas_font_id != -1
-            else "Consolas"
-        )
+        # Custom fonts, registered once for the whole application
+        font_family = load_fonts()[0]
         self.setFont(QFont(font_family))
 
-        self.bartender = bartender()
+        # The bartender sets up the GPIO, so it is created on the first
+        # hardware action rather than when the page is shown
+        self._bartender = None
+        self.relay_pins = list(RELAY_PINS)
+        self.screens = {}  # Pooled screens of the dynamic area, built on first use
+        self.pouring = False
+        self.serving = False  # An order is staged or pouring, from swaps to last phase
+        self.pour_widget = None
+        self.queue_label = None
+        self.current_cocktail = None
+        self.current_phases = []  # (assignment, swaps) of each phase being served
+        self.current_phase = 0
+        self.running_job = None
+        self.progress_bars = {}  # job name -> pump index -> progress bar
+
+        # Every pour, test and cleaning runs on one hardware thread
+        self.worker = HardwareWorker(self.relay_pins, self)
+        self.worker.pump_progress.connect(self.update_progress)
+        self.worker.job_started.connect(self.handle_job_started)
+        self.worker.job_finished.connect(self.handle_job_finished)
+        self.worker.job_failed.connect(self.handle_job_failed)
+        QApplication.instance().aboutToQuit.connect(self.stop_hardware)
         self.calibration_index = 0
-        self.calibration_times = [0] * len(self.bartender.relay_pins)
+        self.calibration_times = [0] * len(self.relay_pins)
+        self.calibration_timer = QTimer(self)
+        self.calibration_timer.setInterval(50)
+        self.calibration_timer.timeout.connect(self.update_calibration_timer)
+        self.calibration_start = 0.0
+        self._timer_running = False
+        self.suggested_loadout = {}
+        self.cocktail_model = None  # Built with the cocktail list screen
+        self.stock_mtime = None
 
         # Main layout
         self.layout = QVBoxLayout(self)
@@ -55,15 +81,15 @@ class FunctionsPage(QWidget):
         self.clean_tubes_btn = QPushButton("Clean Tubes")
         self.make_cocktail_btn = QPushButton("Make Cocktail")
         self.calibrate_pumps_btn = QPushButton("Calibrate Pumps")
+        self.pump_loadout_btn = QPushButton("Pump Loadout")
         for btn in [
             self.test_relays_btn,
             self.clean_tubes_btn,
             self.make_cocktail_btn,
             self.calibrate_pumps_btn,
+            self.pump_loadout_btn,
         ]:
-            btn.setStyleSheet(
-                f"font-family: '{font_family}'; font-size: 20px; font-weight: bold; background-color: #151B23; color: #F0F6FC; border: 1px solid #3D444D; padding: 5px;"
-            )
+            btn.setProperty("role", "nav")
             self.layout.addWidget(btn)
 
         # Dynamic area below buttons
@@ -78,293 +104,484 @@ class FunctionsPage(QWidget):
         self.clean_tubes_btn.clicked.connect(self.clean_tubes)
         self.make_cocktail_btn.clicked.connect(self.show_cocktail_list)
         self.calibrate_pumps_btn.clicked.connect(self.calibrate_pumps_confirm)
+        self.pump_loadout_btn.clicked.connect(self.show_pump_loadout)
+
+    @property
+    def bartender(self):
+        if self._bartender is None:
+            self._bartender = bartender()
+        return self._bartender
+
+    @bartender.setter
+    def bartender(self, value):
+        self._bartender = value
 
     def reset_dynamic_area(self):
+        self.end_calibration()
         self.dynamic_area.setCurrentWidget(self.empty_widget)
 
-    # --- Test Relays ---
-    def test_relays(self):
-        message = QLabel("")
-        message.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 18px; color: #F0F6FC;"
-        )
+    def show_screen(self, name):
+        """
+        Show a pooled screen of the dynamic area, building it on first use.
+
+        Screens are built once by their build_<name>_screen method and re-bound
+        to new data each time they are shown, so the stack never grows.
+
+        Args:
+            name (str): The screen name, e.g. "phase".
+
+        Returns:
+            QWidget: The screen.
+        """
+        if name not in self.CALIBRATION_SCREENS:
+            self.end_calibration()  # Leaving the calibration screens
+        if name not in self.screens:
+            screen = getattr(self, f"build_{name}_screen")()
+            self.dynamic_area.addWidget(screen)
+            self.screens[name] = screen
+        screen = self.screens[name]
+        self.dynamic_area.setCurrentWidget(screen)
+        return screen
+
+    def add_pump_labels(self, layout, role=None):
+        labels = []
+        for _ in self.relay_pins:
+            label = QLabel("")
+            if role:
+                label.setProperty("role", role)
+            label.setWordWrap(True)
+            layout.addWidget(label)
+            labels.append(label)
+        return labels
+
+    def add_yes_no_buttons(self, layout, yes_text="Yes", no_text="No"):
+        btn_layout = QHBoxLayout()
+        yes_btn = QPushButton(yes_text)
+        no_btn = QPushButton(no_text)
+        for btn in [yes_btn, no_btn]:
+            btn.setFixedHeight(40)
+            btn.setFixedWidth(100)
+        btn_layout.addWidget(yes_btn)
+        btn_layout.addWidget(no_btn)
+        layout.addLayout(btn_layout)
+        return yes_btn, no_btn
+
+    def add_progress_rows(self, layout):
+        labels, bars = [], []
+        for _ in self.relay_pins:
+            label = QLabel("")
+            label.setWordWrap(True)
+            layout.addWidget(label)
+            labels.append(label)
+            bar = QProgressBar()
+            bar.setRange(0, 1000)
+            bar.hide()
+            layout.addWidget(bar)
+            bars.append(bar)
+        return labels, bars
+
+    def bind_progress_bars(self, name, bars, steps) -> None:
+        """
+        Show one progress bar per step of a plan and route its pump's progress to it.
+
+        Args:
+            name (str): The name of the job running the plan.
+            bars (list): The progress bars of the screen.
+            steps (list): The plan steps, each with its pump and duration.
+
+        Returns:
+            None
+        """
+        self.progress_bars[name] = {}
+        for i, bar in enumerate(bars):
+            if i >= len(steps):
+                bar.hide()
+                continue
+            bar.setValue(0)
+            bar.setFormat(f"{steps[i]['duration']:.1f}s left")
+            bar.show()
+            self.progress_bars[name][steps[i]["pump"]] = bar
+
+    def handle_job_started(self, name):
+        self.running_job = name
+
+    def update_progress(self, pump_index, done, total):
+        if self.running_job == "test_relays" and done < total:
+            relay_pin = self.relay_pins[pump_index]
+            self.show_message(f"Testing relay corresponding to GPIO {relay_pin}.")
+            return
+        bar = self.progress_bars.get(self.running_job, {}).get(pump_index)
+        if bar is None:
+            return
+        bar.setValue(int(1000 * done / total) if total else 1000)
+        bar.setFormat(f"{total - done:.1f}s left" if done < total else "Done")
+
+    def handle_job_finished(self, name, result):
+        self.running_job = None
+        if name == "pour":
+            self.finish_pour()
+        elif self.dynamic_area.currentWidget() in (
+            self.screens.get("message"),
+            self.screens.get("cleaning"),
+        ):
+            self.reset_dynamic_area()
+
+    def handle_job_failed(self, name, error):
+        self.running_job = None
+        if name == "pour":
+            self.pouring = False
+            self.serving = False
+        self.show_message(f"{name.replace('_', ' ').capitalize()} failed: {error}")
+
+    def rejection_message(self, status):
+        return REJECTED_MESSAGES.get(status, f"The pumps can't run now ({status}).")
+
+    def stop_hardware(self):
+        self.worker.stop(wait=False)  # Drops the queued jobs
+        if self._bartender is not None:
+            self._bartender.scheduler.stop()  # Ends a running pour early
+        self.worker.stop()
+
+    def build_message_screen(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
-        layout.addWidget(message)
-        self.dynamic_area.addWidget(widget)
-        self.dynamic_area.setCurrentWidget(widget)
-
-        def run_test():
-            for i, pin in enumerate(self.bartender.relay_pins):
-                QTimer.singleShot(
-                    0,
-                    lambda p=pin: message.setText(
-                        f"Testing relay corresponding to GPIO {p}."
-                    ),
-                )
+        widget.message = QLabel("")
+        layout.addWidget(widget.message)
+        return widget
+
+    def show_message(self, text):
+        self.show_screen("message").message.setText(text)
+
+    # --- Test Relays ---
+    def test_relays(self):
+        relay_pins = list(self.relay_pins)
+
+        def run_test(worker):
+            for i, pin in enumerate(relay_pins):
+                worker.pump_progress.emit(i, 0.0, 1.0)
                 self.bartender.pump.turn_on(pin, 1)
-            QTimer.singleShot(0, self.reset_dynamic_area)
+                worker.pump_progress.emit(i, 1.0, 1.0)
 
-        threading.Thread(target=run_test).start()
+        status = self.worker.submit("test_relays", relay_pins, run_test)
+        self.show_message("" if status == ACCEPTED else self.rejection_message(status))
 
     # --- Clean Tubes ---
-    def clean_tubes(self):
-        # --- Pump selection UI ---
+    def build_clean_select_screen(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         label = QLabel("Select Pumps to Clean")
-        label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 20px; font-weight: bold; color: #F0F6FC;"
-        )
+        label.setProperty("role", "heading")
         layout.addWidget(label)
 
         # Create toggleable buttons for each pump
-        pump_buttons = []
-        selected_pumps = set(
-            range(len(self.bartender.relay_pins))
-        )  # All selected by default
-
-        for i, relay_pin in enumerate(self.bartender.relay_pins):
+        widget.pump_buttons = []
+        for i, relay_pin in enumerate(self.relay_pins):
             btn = QPushButton(f"Pump {i+1} (GPIO {relay_pin})")
             btn.setCheckable(True)
-            btn.setChecked(True)
-            btn.setStyleSheet(
-                """
-                QPushButton {
-                    font-family: 'Consolas';
-                    font-size: 18px;
-                    padding: 5px;
-                    border: 1px solid #3D444D;
-                    background-color: #238636;
-                    color: #F0F6FC;
-                }
-                QPushButton:checked {
-                    background-color: #238636;
-                    color: #F0F6FC;
-                }
-                QPushButton:!checked {
-                    background-color: #151B23;
-                    color: #F0F6FC;
-                }
-                """
-            )
-
-            # Toggle selection
-            def make_toggle(idx):
-                return lambda checked: (
-                    selected_pumps.add(idx) if checked else selected_pumps.discard(idx)
-                )
-
-            btn.toggled.connect(make_toggle(i))
+            btn.setProperty("role", "toggle")
             layout.addWidget(btn)
-            pump_buttons.append(btn)
+            widget.pump_buttons.append(btn)
 
         # Start Cleaning button
         start_btn = QPushButton("Start Cleaning")
-        start_btn.setStyleSheet(
-            """
-            QPushButton {
-                font-family: 'Consolas';
-                font-size: 20px;
-                font-weight: bold;
-                padding: 5px;
-                border: 1px solid #3D444D;
-                background-color: #151B23;
-                color: #F0F6FC;
-            }
-            QPushButton:pressed {
-                background-color: #238636;
-            }
-            """
-        )
+        start_btn.clicked.connect(self.start_cleaning)
         layout.addWidget(start_btn)
-        self.dynamic_area.addWidget(widget)
-        self.dynamic_area.setCurrentWidget(widget)
-
-        def start_cleaning():
-            # Only clean selected pumps
-            margin = 1  # seconds
-            info_lines = []
-            pumps_to_clean = sorted(selected_pumps)
-            if not pumps_to_clean:
-                # If none selected, do nothing or show a message
-                return
-            for i in pumps_to_clean:
-                relay_pin = self.bartender.relay_pins[i]
-                clean_time = self.bartender.tube_fill_times[i] + margin
-                info_lines.append(
-                    f"Pump {i+1} (GPIO {relay_pin}): Cleaning for {clean_time:.2f} seconds"
-                )
-            # Show cleaning message
-            cleaning_widget = QWidget()
-            cleaning_layout = QVBoxLayout(cleaning_widget)
-            message = QLabel("Cleaning Tubes...\n" + "\n".join(info_lines))
-            message.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 18px; color: #F0F6FC;"
+        return widget
+
+    def clean_tubes(self):
+        screen = self.show_screen("clean_select")
+        for btn in screen.pump_buttons:
+            btn.setChecked(True)  # All selected by default
+
+    def start_cleaning(self):
+        # Only clean selected pumps
+        margin = 1  # seconds
+        info_lines = []
+        pumps_to_clean = [
+            i
+            for i, btn in enumerate(self.screens["clean_select"].pump_buttons)
+            if btn.isChecked()
+        ]
+        if not pumps_to_clean:
+            # If none selected, do nothing or show a message
+            return
+        for i in pumps_to_clean:
+            relay_pin = self.relay_pins[i]
+            clean_time = self.bartender.tube_fill_times[i] + margin
+            info_lines.append(
+                f"Pump {i+1} (GPIO {relay_pin}): Cleaning for {clean_time:.2f} seconds"
             )
-            cleaning_layout.addWidget(message)
-            self.dynamic_area.addWidget(cleaning_widget)
-            self.dynamic_area.setCurrentWidget(cleaning_widget)
-
-            def run_clean():
-                threads = []
-                for i in pumps_to_clean:
-                    relay_pin = self.bartender.relay_pins[i]
-                    clean_time = self.bartender.tube_fill_times[i] + margin
-                    thread = threading.Thread(
-                        target=self.bartender.pump.turn_on, args=(relay_pin, clean_time)
-                    )
-                    threads.append(thread)
-                    thread.start()
-                for thread in threads:
-                    thread.join()
-                QTimer.singleShot(0, self.reset_dynamic_area)
-
-            threading.Thread(target=run_clean).start()
-
-        start_btn.clicked.connect(start_cleaning)
+        plan = [
+            {
+                "pump": i,
+                "relay_pin": self.relay_pins[i],
+                "duration": self.bartender.tube_fill_times[i] + margin,
+            }
+            for i in pumps_to_clean
+        ]
+
+        status = self.worker.submit(
+            "clean_tubes",
+            [step["relay_pin"] for step in plan],
+            lambda worker: worker.run_plan(self.bartender, plan),
+        )
+        if status != ACCEPTED:
+            self.show_message(self.rejection_message(status))
+            return
+
+        # Show the cleaning progress of each pump
+        screen = self.show_screen("cleaning")
+        for i, label in enumerate(screen.pump_labels):
+            label.setText(info_lines[i] if i < len(info_lines) else "")
+            label.setVisible(i < len(info_lines))
+        self.bind_progress_bars("clean_tubes", screen.progress_bars, plan)
+
+    def build_cleaning_screen(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        label = QLabel("Cleaning Tubes...")
+        label.setProperty("role", "heading")
+        layout.addWidget(label)
+        widget.pump_labels, widget.progress_bars = self.add_progress_rows(layout)
+        layout.addStretch()
+        return widget
 
     # --- Make Cocktail ---
-    def show_cocktail_list(self):
+    def build_cocktail_list_screen(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         label = QLabel("Select a cocktail:")
-        label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 22px; font-weight: bold; color: #F0F6FC;"
-        )
+        label.setProperty("role", "title")
         layout.addWidget(label)
-        list_widget = QListWidget()
-        list_widget.setStyleSheet(
-            """
-            QListWidget {
-                background-color: #151B23;
-                border: 1px solid #3D444D;
-            }
-            QListWidget::item {
-                font-family: 'Consolas';
-                font-size: 20px;
-                padding: 8px;
-                color: #F0F6FC;
-                background-color: #151B23;
-                border-bottom: 1px solid #3D444D;
-            }
-            QListWidget::item:selected {
-                background-color: #238636;
-                color: #FFFFFF;
-            }
-            """
-        )
-        for cocktail in cocktail_list:
-            item = QListWidgetItem(cocktail["name"].title())
-            list_widget.addItem(item)
-        layout.addWidget(list_widget)
-        self.dynamic_area.addWidget(widget)
-        self.dynamic_area.setCurrentWidget(widget)
+        widget.search_input = QLineEdit()
+        widget.search_input.setPlaceholderText("Search cocktails")
+        layout.addWidget(widget.search_input)
+
+        toggle_layout = QHBoxLayout()
+        widget.makeable_btn = QPushButton("Makeable Now")
+        widget.popular_btn = QPushButton("Popular First")
+        for btn in [widget.makeable_btn, widget.popular_btn]:
+            btn.setCheckable(True)
+            btn.setProperty("role", "toggle")
+            toggle_layout.addWidget(btn)
+        layout.addLayout(toggle_layout)
+
+        # The model follows the recipe store, so the list is never rebuilt
+        self.cocktail_model = CocktailListModel(get_recipe_store(), self)
+        proxy = CocktailFilterModel(get_recipe_store(), self)
+        proxy.setSourceModel(self.cocktail_model)
+        widget.search_input.textChanged.connect(proxy.set_search)
+        widget.makeable_btn.toggled.connect(proxy.set_makeable_only)
+        widget.popular_btn.toggled.connect(proxy.set_by_popularity)
+
+        widget.list_view = QListView()
+        widget.list_view.setProperty("role", "cocktails")
+        widget.list_view.setModel(proxy)
+        widget.list_view.setUniformItemSizes(True)
+        widget.list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        widget.list_view.clicked.connect(self.select_cocktail)
+        layout.addWidget(widget.list_view)
+        return widget
 
-        def on_item_clicked(item):
-            cocktail_name = item.text().lower()
-            self.dynamic_area.removeWidget(widget)
-            self.make_cocktail(cocktail_name)
+    def show_cocktail_list(self):
+        screen = self.show_screen("cocktail_list")
+        screen.search_input.clear()
+        screen.list_view.scrollToTop()
 
-        list_widget.itemClicked.connect(on_item_clicked)
+        # List the cocktails that can be made with the stocked ingredients first,
+        # followed by the rest greyed out with their missing ingredients
+        mtime = os.path.getmtime(INGREDIENTS_CSV)
+        if mtime != self.stock_mtime:
+            self.stock_mtime = mtime
+            self.cocktail_model.set_stock(set(load_ingredients_from_csv()))
 
-    def make_cocktail(self, cocktail_name):
-        widget = QWidget()
-        layout = QVBoxLayout(widget)
-        self.dynamic_area.addWidget(widget)
-        self.dynamic_area.setCurrentWidget(widget)
+    def select_cocktail(self, index):
+        self.make_cocktail(index.data(NAME_ROLE))
 
-        cocktail = next((c for c in cocktail_list if c["name"] == cocktail_name), None)
+    def make_cocktail(self, cocktail_name):
+        cocktail = self.bartender.recipes.get_cocktail(cocktail_name)
         if not cocktail:
-            layout.addWidget(QLabel("Cocktail not found."))
+            self.show_message("Cocktail not found.")
             QTimer.singleShot(2000, self.reset_dynamic_area)
             return
 
-        # --- Intermediate screen: show pump assignments ---
-        info_label = QLabel("Attach ingredients to the correct pump lines:")
-        info_label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 20px; font-weight: bold; color: #F0F6FC;"
+        self.bartender.orders.submit(cocktail)
+        if self.serving:
+            # Served once the order on the pour screen is finished, even if
+            # its pour hasn't started yet
+            self.queue_label.setText(
+                f"{len(self.bartender.orders)} order(s) queued, "
+                f"next: {cocktail['name'].title()}"
+            )
+            if not self.pouring:
+                self.show_upcoming(self.pour_widget)
+            self.dynamic_area.setCurrentWidget(self.pour_widget)
+            return
+        self.serve_next_order()
+
+    def serve_next_order(self):
+        # The loadout is only updated as each phase starts pouring
+        next_order = self.bartender.orders.next_order(commit=False)
+        if next_order is None:
+            self.serving = False
+            self.reset_dynamic_area()
+            return
+        order, phases = next_order
+        self.serving = True
+        self.current_phases = phases
+        self.show_phase(order["cocktail"], 0)
+
+    def build_phase_screen(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        widget.info_label = QLabel("")
+        widget.info_label.setProperty("role", "heading")
+        widget.info_label.setWordWrap(True)
+        layout.addWidget(widget.info_label)
+
+        # One label per pump, showing its line before the pour and its
+        # dispensing status and progress during it
+        widget.pump_labels, widget.progress_bars = self.add_progress_rows(layout)
+
+        # Preview of the swaps the rest of the queue will need
+        widget.upcoming_label = QLabel("")
+        widget.upcoming_label.setProperty("role", "hint")
+        widget.upcoming_label.setWordWrap(True)
+        layout.addWidget(widget.upcoming_label)
+
+        widget.start_btn = QPushButton("Start Pour")
+        widget.start_btn.clicked.connect(self.start_pour)
+        layout.addWidget(widget.start_btn)
+
+        widget.cancel_btn = QPushButton("Cancel Order")
+        widget.cancel_btn.clicked.connect(self.cancel_order)
+        layout.addWidget(widget.cancel_btn)
+
+        widget.queue_label = QLabel("")
+        widget.queue_label.setProperty("role", "hint")
+        widget.queue_label.setWordWrap(True)
+        layout.addWidget(widget.queue_label)
+        layout.addStretch()
+        return widget
+
+    def show_phase(self, cocktail, phase):
+        assignment, swaps = self.current_phases[phase]
+        screen = self.show_screen("phase")
+
+        # --- Intermediate screen: show the line swaps for this phase ---
+        title = cocktail["name"].title()
+        if len(self.current_phases) > 1:
+            title += f" (phase {phase + 1} of {len(self.current_phases)})"
+        screen.info_label.setText(
+            f"{title}: attach ingredients to the correct pump lines:"
         )
-        info_label.setWordWrap(True)
-        layout.addWidget(info_label)
-
-        pump_labels = []
-        for i, (ingredient, amount) in enumerate(cocktail["ingredients"].items()):
-            if i >= len(self.bartender.relay_pins):
-                break
-            relay_pin = self.bartender.relay_pins[i]
-            pump_label = QLabel(
-                f"Pump {i+1} (GPIO {relay_pin}): {ingredient.title()} ({amount} oz)"
+        screen.info_label.show()
+        for bar in screen.progress_bars:
+            bar.hide()
+
+        swapped = {pump_index: old for pump_index, old, new in swaps}
+        lines = sorted(assignment.items(), key=lambda a: a[1])
+        for i, pump_label in enumerate(screen.pump_labels):
+            if i >= len(lines):
+                pump_label.hide()
+                continue
+            ingredient, pump_index = lines[i]
+            relay_pin = self.relay_pins[pump_index]
+            amount = cocktail["ingredients"][ingredient]
+            if pump_index not in swapped:
+                action = "keep"
+            elif swapped[pump_index] is None:
+                action = "attach"
+            else:
+                action = f"swap {swapped[pump_index].title()} for"
+            pump_label.setText(
+                f"Pump {pump_index+1} (GPIO {relay_pin}): {action} {ingredient.title()} ({amount} oz)"
             )
-            pump_label.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 18px; color: #F0F6FC;"
+            pump_label.show()
+
+        self.current_cocktail = cocktail
+        self.current_phase = phase
+        self.show_upcoming(screen)
+        screen.start_btn.show()
+        screen.cancel_btn.show()
+
+        # New orders queue behind this one until its last phase is poured
+        screen.queue_label.setText("")
+        screen.queue_label.show()
+        self.queue_label = screen.queue_label
+        self.pour_widget = screen
+
+    def show_upcoming(self, screen):
+        # Plan from the loadout this order's swaps will leave behind
+        upcoming = self.bartender.orders.swap_plan(
+            self.current_phases[self.current_phase :]
+        )
+        screen.upcoming_label.setText(
+            "Up next: "
+            + ", ".join(
+                f"{o['cocktail']['name'].title()} ({len(s)} swap(s))"
+                for o, s in upcoming
             )
-            pump_label.setWordWrap(True)
-            layout.addWidget(pump_label)
-            pump_labels.append(pump_label)
-
-        start_btn = QPushButton("Start Pour")
-        start_btn.setStyleSheet(
-            """
-            QPushButton {
-                font-family: 'Consolas';
-                font-size: 20px;
-                font-weight: bold;
-                padding: 5px;
-                border: 1px solid #3D444D;
-                background-color: #151B23;
-                color: #F0F6FC;
-            }
-            QPushButton:pressed {
-                background-color: #238636;
-            }
-            """
         )
-        layout.addWidget(start_btn)
+        screen.upcoming_label.setVisible(bool(upcoming) and self.current_phase == 0)
+
+    def start_pour(self):
+        screen = self.screens["phase"]
+        assignment, swaps = self.current_phases[self.current_phase]
+        plan = self.bartender.pour_plan(self.current_cocktail, assignment)
+
+        # A pour waits for a running test or cleaning rather than being refused
+        status = self.worker.submit(
+            "pour",
+            [step["relay_pin"] for step in plan],
+            lambda worker: worker.run_plan(self.bartender, plan),
+            conflict="queue",
+        )
+        if status != ACCEPTED:
+            screen.queue_label.setText(self.rejection_message(status))
+            screen.queue_label.show()
+            return
+        self.bartender.orders.commit_swaps(swaps)  # The operator made them
+        screen.info_label.hide()
+        screen.upcoming_label.hide()
+        screen.start_btn.hide()
+        screen.cancel_btn.hide()
+
+        # --- Pouring status screen ---
+        for i, pump_label in enumerate(screen.pump_labels):
+            if i >= len(plan):
+                pump_label.hide()
+                continue
+            step = plan[i]
+            pump_label.setText(
+                f"Pump {step['pump']+1} - Dispensing {step['amount']} oz of {step['ingredient'].title()}"
+            )
+            pump_label.show()
+        self.bind_progress_bars("pour", screen.progress_bars, plan)
 
-        def start_pour():
-            # Remove all widgets from layout
-            for i in reversed(range(layout.count())):
-                widget_to_remove = layout.itemAt(i).widget()
-                if widget_to_remove:
-                    widget_to_remove.setParent(None)
-
-            # --- Pouring status screen ---
-            pour_labels = []
-            threads = []
-            for i, (ingredient, amount) in enumerate(cocktail["ingredients"].items()):
-                if i >= len(self.bartender.relay_pins):
-                    break
-                relay_pin = self.bartender.relay_pins[i]
-                time_to_pour = self.bartender.convert_oz_to_sec(amount, i)
-                msg = (
-                    f"Pump {i+1} - Dispensing {amount} oz of {ingredient.title()} "
-                    f"ETA: {time_to_pour:.1f}s"
-                )
-                label = QLabel(msg)
-                label.setStyleSheet(
-                    "font-family: 'Consolas'; font-size: 18px; color: #F0F6FC;"
-                )
-                label.setWordWrap(True)
-                layout.addWidget(label)
-                pour_labels.append(label)
-                thread = threading.Thread(
-                    target=self.bartender.pump.turn_on, args=(relay_pin, time_to_pour)
-                )
-                threads.append(thread)
-                thread.start()
-
-            def finish():
-                for t in threads:
-                    t.join()
-                QTimer.singleShot(0, self.reset_dynamic_area)
-
-            threading.Thread(target=finish).start()
-
-        start_btn.clicked.connect(start_pour)
+        screen.queue_label.setText("")
+        self.pouring = True
+
+    def cancel_order(self):
+        if self.pouring:
+            return
+        # Drop the staged order; the loadout only holds the swaps of the
+        # phases already poured, so the remaining ones are simply discarded
+        self.serving = False
+        self.current_phases = []
+        self.serve_next_order()
+
+    def finish_pour(self):
+        if self.current_phase + 1 < len(self.current_phases):
+            # Prompt the operator to swap lines for the next phase
+            self.show_phase(self.current_cocktail, self.current_phase + 1)
+            return
+        self.bartender.recipes.record_pour(self.current_cocktail["name"])
+        self.pouring = False
+        self.serve_next_order()
 
     # --- Calibrate Pumps ---
-    def calibrate_pumps_confirm(self):
+    def build_calibrate_confirm_screen(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setSpacing(10)  # Reduce vertical spacing between widgets
@@ -373,69 +590,40 @@ class FunctionsPage(QWidget):
         )  # Add top margin to center content vertically
 
         label = QLabel("Are you sure you want to calibrate the pumps?")
-        label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 22px; font-weight: bold; color: #F0F6FC;"
-        )
+        label.setProperty("role", "title")
         label.setWordWrap(True)
         label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         layout.addWidget(label)
 
-        btn_layout = QHBoxLayout()
-        yes_btn = QPushButton("Yes")
-        no_btn = QPushButton("No")
-        for btn in [yes_btn, no_btn]:
-            btn.setStyleSheet(
-                """
-                QPushButton {
-                    font-family: 'Consolas';
-                    font-size: 20px;
-                    font-weight: bold;
-                    padding: 5px;
-                    border: 1px solid #3D444D;
-                    background-color: #151B23;
-                    color: #F0F6FC;
-                }
-                QPushButton:pressed {
-                    background-color: #238636;
-                }
-                """
-            )
-            btn.setFixedHeight(40)
-            btn.setFixedWidth(100)
-        btn_layout.addWidget(yes_btn)
-        btn_layout.addWidget(no_btn)
-        layout.addLayout(btn_layout)
+        yes_btn, no_btn = self.add_yes_no_buttons(layout)
         layout.addStretch()  # Push content towards vertical center
-        self.dynamic_area.addWidget(widget)
-        self.dynamic_area.setCurrentWidget(widget)
-
         yes_btn.clicked.connect(self.start_calibration)
         no_btn.clicked.connect(self.reset_dynamic_area)
+        return widget
+
+    def calibrate_pumps_confirm(self):
+        self.show_screen("calibrate_confirm")
 
     def start_calibration(self):
+        # Calibration drives the relays directly, so it owns all of them
+        if not self.worker.executor.claim("calibration", self.relay_pins):
+            self.show_message(self.rejection_message(BUSY))
+            return
         self.calibration_index = 0
-        self.calibration_times = [0] * len(self.bartender.relay_pins)
+        self.calibration_times = [0] * len(self.relay_pins)
         self.calibrate_next_pump()
 
-    def calibrate_next_pump(self):
-        if self.calibration_index >= len(self.bartender.relay_pins):
-            self.show_calibration_summary()
-            return
-
+    def build_calibrate_pump_screen(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         layout.setSpacing(10)
         layout.setContentsMargins(0, 80, 0, 0)
 
-        pump_num = self.calibration_index + 1
-        total = len(self.bartender.relay_pins)
-        label = QLabel(f"Calibrating Pump {pump_num}/{total}")
-        label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 22px; font-weight: bold; color: #F0F6FC;"
-        )
-        label.setWordWrap(True)
-        label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        layout.addWidget(label)
+        widget.title_label = QLabel("")
+        widget.title_label.setProperty("role", "title")
+        widget.title_label.setWordWrap(True)
+        widget.title_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+        layout.addWidget(widget.title_label)
 
         # Center widget for timer and button
         center_widget = QWidget()
@@ -444,144 +632,153 @@ class FunctionsPage(QWidget):
         center_layout.setAlignment(Qt.AlignmentFlag.AlignHCenter)
 
         # Timer label (always present, but blank when not running)
-        timer_label = QLabel("")
-        timer_label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 20px; color: #F0F6FC;"
+        widget.timer_label = QLabel("")
+        widget.timer_label.setProperty("role", "body")
+        widget.timer_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+        widget.timer_label.setMinimumHeight(30)  # Reserve space for timer
+        center_layout.addWidget(
+            widget.timer_label, alignment=Qt.AlignmentFlag.AlignHCenter
         )
-        timer_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-        timer_label.setMinimumHeight(30)  # Reserve space for timer
-        center_layout.addWidget(timer_label, alignment=Qt.AlignmentFlag.AlignHCenter)
-
-        # Action button (text and function will change)
-        action_btn = QPushButton("Start")
-        action_btn.setStyleSheet(
-            """
-            QPushButton {
-                font-family: 'Consolas';
-                font-size: 20px;
-                font-weight: bold;
-                padding: 5px;
-                border: 1px solid #3D444D;
-                background-color: #151B23;
-                color: #F0F6FC;
-            }
-            QPushButton:pressed {
-                background-color: #238636;
-            }
-            """
+
+        # Action button, starting and stopping the pump
+        widget.action_btn = QPushButton("Start")
+        widget.action_btn.setFixedHeight(40)
+        widget.action_btn.setFixedWidth(100)
+        widget.action_btn.clicked.connect(self.toggle_calibration_timer)
+        center_layout.addWidget(
+            widget.action_btn, alignment=Qt.AlignmentFlag.AlignHCenter
         )
-        action_btn.setFixedHeight(40)
-        action_btn.setFixedWidth(100)
-        center_layout.addWidget(action_btn, alignment=Qt.AlignmentFlag.AlignHCenter)
 
         layout.addWidget(center_widget, alignment=Qt.AlignmentFlag.AlignHCenter)
         layout.addStretch()
-        self.dynamic_area.addWidget(widget)
-        self.dynamic_area.setCurrentWidget(widget)
+        return widget
+
+    def calibrate_next_pump(self):
+        if self.calibration_index >= len(self.relay_pins):
+            self.show_calibration_summary()
+            return
 
+        screen = self.show_screen("calibrate_pump")
+        pump_num = self.calibration_index + 1
+        total = len(self.relay_pins)
+        screen.title_label.setText(f"Calibrating Pump {pump_num}/{total}")
+        screen.timer_label.setText("")  # Leave the label blank, but keep its space
+        screen.action_btn.setText("Start")
         self._timer_running = False
 
-        def start_timer():
-            action_btn.setText("Stop")
-            timer_label.setText("Timer: 0.00s")
-            start_time = time.time()
-            self.bartender.pump.turn_on(
-                self.bartender.relay_pins[self.calibration_index]
-            )
+    def toggle_calibration_timer(self):
+        screen = self.screens["calibrate_pump"]
+        relay_pin = self.relay_pins[self.calibration_index]
+        if not self._timer_running:
+            screen.action_btn.setText("Stop")
+            screen.timer_label.setText("Timer: 0.00s")
+            self.calibration_start = time.time()
+            self.bartender.pump.turn_on(relay_pin)
             self._timer_running = True
+            self.calibration_timer.start()
+            return
+
+        self._timer_running = False
+        self.calibration_timer.stop()
+        self.bartender.pump.turn_off(relay_pin)
+        elapsed = time.time() - self.calibration_start
+        self.calibration_times[self.calibration_index] = round(elapsed, 2)
+        self.calibration_index += 1
+        self.calibrate_next_pump()
 
-            def update_timer():
-                if not self._timer_running:
-                    return
-                elapsed = time.time() - start_time
-                timer_label.setText(f"Timer: {elapsed:.2f}s")
-                if self._timer_running:
-                    QTimer.singleShot(50, update_timer)
-
-            update_timer()
-
-            def stop_timer():
-                self._timer_running = False
-                self.bartender.pump.turn_off(
-                    self.bartender.relay_pins[self.calibration_index]
-                )
-                elapsed = time.time() - start_time
-                self.calibration_times[self.calibration_index] = round(elapsed, 2)
-                self.calibration_index += 1
-                # Reset button and timer for next pump
-                timer_label.setText("")  # Leave the label blank, but keep its space
-                action_btn.setText("Start")
-                action_btn.clicked.disconnect()
-                action_btn.clicked.connect(start_timer)
-                self.calibrate_next_pump()
-
-            # Change button to stop function
-            action_btn.clicked.disconnect()
-            action_btn.clicked.connect(stop_timer)
-
-        # Initial connection: start function
-        action_btn.clicked.connect(start_timer)
+    def end_calibration(self):
+        if self._timer_running:
+            self._timer_running = False
+            self.calibration_timer.stop()
+            self.bartender.pump.turn_off(
+                self.relay_pins[self.calibration_index]
+            )
+        self.worker.executor.release("calibration")
 
-    def show_calibration_summary(self):
+    def update_calibration_timer(self):
+        elapsed = time.time() - self.calibration_start
+        self.screens["calibrate_pump"].timer_label.setText(f"Timer: {elapsed:.2f}s")
+
+    def build_calibration_summary_screen(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
         summary_label = QLabel("Calibration Results:")
-        summary_label.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 22px; font-weight: bold; color: #F0F6FC;"
-        )
+        summary_label.setProperty("role", "title")
         summary_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         layout.addWidget(summary_label)
-        # Show each pump's time
-        for i, t in enumerate(self.calibration_times):
-            pump_label = QLabel(f"Pump {i+1}: {t:.2f}s")
-            pump_label.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 20px; color: #F0F6FC;"
-            )
+        # One label for each pump's time
+        widget.pump_labels = self.add_pump_labels(layout, "body")
+        for pump_label in widget.pump_labels:
             pump_label.setAlignment(Qt.AlignmentFlag.AlignHCenter)
-            layout.addWidget(pump_label)
         # Save prompt
         prompt = QLabel("Would you like to save this calibration?")
-        prompt.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 20px; color: #F0F6FC; margin-top: 10px;"
-        )
+        prompt.setProperty("role", "body")
         prompt.setAlignment(Qt.AlignmentFlag.AlignHCenter)
         layout.addWidget(prompt)
-        btn_layout = QHBoxLayout()
-        yes_btn = QPushButton("Yes")
-        no_btn = QPushButton("No")
-        for btn in [yes_btn, no_btn]:
-            btn.setStyleSheet(
-                """
-                QPushButton {
-                    font-family: 'Consolas';
-                    font-size: 20px;
-                    font-weight: bold;
-                    padding: 5px;
-                    border: 1px solid #3D444D;
-                    background-color: #151B23;
-                    color: #F0F6FC;
-                }
-                QPushButton:pressed {
-                    background-color: #238636;
-                }
-                """
+        yes_btn, no_btn = self.add_yes_no_buttons(layout)
+        yes_btn.clicked.connect(self.save_calibration)
+        no_btn.clicked.connect(self.reset_dynamic_area)
+        return widget
+
+    def show_calibration_summary(self):
+        self.worker.executor.release("calibration")  # Every pump is off
+        screen = self.show_screen("calibration_summary")
+        for i, t in enumerate(self.calibration_times):
+            screen.pump_labels[i].setText(f"Pump {i+1}: {t:.2f}s")
+
+    def save_calibration(self):
+        self.bartender.save_calibration(dict(enumerate(self.calibration_times)))
+        self.reset_dynamic_area()
+
+    # --- Pump Loadout ---
+    def build_pump_loadout_screen(self):
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        label = QLabel("Suggested pump loadout:")
+        label.setProperty("role", "title")
+        layout.addWidget(label)
+        widget.pump_labels = self.add_pump_labels(layout)
+
+        widget.covered_label = QLabel("")
+        widget.covered_label.setProperty("role", "hint")
+        widget.covered_label.setWordWrap(True)
+        layout.addWidget(widget.covered_label)
+
+        apply_btn, cancel_btn = self.add_yes_no_buttons(layout, "Apply", "Cancel")
+        layout.addStretch()
+        widget.apply_btn = apply_btn
+        apply_btn.clicked.connect(self.apply_loadout)
+        cancel_btn.clicked.connect(self.reset_dynamic_area)
+        return widget
+
+    def show_pump_loadout(self):
+        screen = self.show_screen("pump_loadout")
+        assignment = self.bartender.optimize_loadout()
+        self.suggested_loadout = assignment
+        pumps = {pump_index: ingredient for ingredient, pump_index in assignment.items()}
+        for i, relay_pin in enumerate(self.relay_pins):
+            ingredient = pumps.get(i)
+            screen.pump_labels[i].setText(
+                f"Pump {i+1} (GPIO {relay_pin}): {ingredient.title() if ingredient else '-'}"
             )
-            btn.setFixedHeight(40)
-            btn.setFixedWidth(100)
-        btn_layout.addWidget(yes_btn)
-        btn_layout.addWidget(no_btn)
-        layout.addLayout(btn_layout)
-        self.dynamic_area.addWidget(widget)
-        self.dynamic_area.setCurrentWidget(widget)
 
-        def save_and_exit():
-            with open("data/config.py", "w") as file:
-                file.write("TUBE_FILL_TIMES = ")
-                file.write(str(self.calibration_times))
-            self.reset_dynamic_area()
+        cocktails = self.bartender.recipes.all_cocktails()
+        covered = covered_recipes(cocktails, assignment)
+        screen.covered_label.setText(
+            f"Covers {len(covered)} of {len(cocktails)} cocktails without swaps: "
+            + ", ".join(name.title() for name in covered)
+        )
 
-        def discard_and_exit():
-            self.reset_dynamic_area()
+        # The staged order's swaps were planned from the current loadout
+        screen.apply_btn.setEnabled(not self.serving)
+        if self.serving:
+            screen.covered_label.setText(
+                screen.covered_label.text()
+                + "\nFinish or cancel the current order to apply this loadout."
+            )
 
-        yes_btn.clicked.connect(save_and_exit)
-        no_btn.clicked.connect(discard_and_exit)
+    def apply_loadout(self):
+        if self.serving:
+            return
+        self.bartender.apply_loadout(self.suggested_loadout)
+        self.reset_dynamic_area()
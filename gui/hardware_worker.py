@@ -0,0 +1,78 @@
+from PyQt6.QtCore import QObject, pyqtSignal
+from hardware.executor import hardware_executor
+
+
+class HardwareWorker(QObject):
+    # Emitted on the executor thread, delivered on the GUI thread
+    job_started = pyqtSignal(str)  # job name
+    pump_progress = pyqtSignal(int, float, float)  # pump index, seconds done, total
+    job_finished = pyqtSignal(str, object)  # job name, result
+    job_failed = pyqtSignal(str, str)  # job name, error message
+
+    def __init__(self, relay_pins, parent=None):
+        """
+        Initialize the Qt front of the hardware executor.
+
+        Every hardware job runs on the executor's single thread, which owns
+        the relays while a job drives them, and reports back through typed
+        signals.
+
+        Args:
+            relay_pins (list): The GPIO pins of the relays.
+            parent (QObject): The parent object of the worker.
+
+        Returns:
+            None
+        """
+        super().__init__(parent)
+        self.executor = hardware_executor(relay_pins)
+        self.executor.subscribe(self.emit_job_event)
+
+    def submit(self, name, relay_pins, job, conflict="reject") -> str:
+        """
+        Queue a job on the executor.
+
+        Args:
+            name (str): The job name, passed back with its signals.
+            relay_pins (iterable): The relay pins the job switches.
+            job (function): Called with the worker on the executor thread. Its
+                return value is sent with job_finished.
+            conflict (str): "reject" or "queue" when a relay is busy (see
+                hardware_executor.submit).
+
+        Returns:
+            str: The executor's answer, ACCEPTED or the reason for refusing.
+        """
+        return self.executor.submit(name, relay_pins, lambda: job(self), conflict)
+
+    def stop(self, wait=True) -> None:
+        self.executor.stop(wait)
+
+    def emit_job_event(self, event, name, value) -> None:
+        if event == "started":
+            self.job_started.emit(name)
+        elif event == "finished":
+            self.job_finished.emit(name, value)
+        else:
+            self.job_failed.emit(name, str(value))
+
+    def run_plan(self, bartender, plan) -> dict:
+        """
+        Run a pour plan from a job, reporting the progress of each pump.
+
+        Args:
+            bartender (bartender): The bartender running the plan.
+            plan (list): The steps built by bartender.pour_plan.
+
+        Returns:
+            dict: The timing metrics of the run.
+        """
+
+        def progress(elapsed):
+            for step in plan:
+                duration = step["duration"]
+                self.pump_progress.emit(step["pump"], min(elapsed, duration), duration)
+
+        metrics = bartender.run_plan(plan, progress)
+        progress(float("inf"))  # Every pump is off
+        return metrics
@@ -1,14 +1,116 @@
 import csv
+from bisect import bisect_left
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QLabel,
-    QScrollArea,
-    QFrame,
+    QListView,
     QLineEdit,
     QPushButton,
 )
-from PyQt6.QtGui import QFontDatabase, QFont
+from PyQt6.QtGui import QFont, QColor
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from gui.theme import load_fonts, ACCENT
+
+INGREDIENTS_CSV = "data/ingredients.csv"
+
+
+def load_ingredients_from_csv(path=INGREDIENTS_CSV):
+    """
+    Load the ingredients from the ingredients.csv file.
+
+    Args:
+        path (str): The path of the CSV file.
+
+    Returns:
+        list: The sorted, lowercase ingredient names.
+    """
+    ingredients = set()
+    with open(path, "r") as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            ingredients.add(row["ingredient"].lower())
+    return sorted(ingredients)
+
+
+class IngredientListModel(QAbstractListModel):
+    def __init__(self, ingredients, parent=None):
+        """
+        Initialize the model with a sorted list of ingredients, all checked.
+
+        Args:
+            ingredients (list): The sorted ingredient names.
+            parent (QObject): The parent object of the model.
+
+        Returns:
+            None
+        """
+        super().__init__(parent)
+        self.ingredients = list(ingredients)
+        self.selected = set(self.ingredients)  # Every ingredient starts checked
+        self.selected_brush = QColor(ACCENT)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.ingredients)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """
+        Return the name of a row, or its background when it is checked.
+
+        Args:
+            index (QModelIndex): The row.
+            role (Qt.ItemDataRole): The requested role.
+
+        Returns:
+            The data for the role, or None.
+        """
+        if not index.isValid():
+            return None
+        ingredient = self.ingredients[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return ingredient
+        if role == Qt.ItemDataRole.BackgroundRole and ingredient in self.selected:
+            return self.selected_brush
+        return None
+
+    def toggle(self, index) -> None:
+        """
+        Check or uncheck the ingredient of a row and repaint only that row.
+
+        Args:
+            index (QModelIndex): The row.
+
+        Returns:
+            None
+        """
+        ingredient = self.ingredients[index.row()]
+        if ingredient in self.selected:
+            self.selected.remove(ingredient)
+        else:
+            self.selected.add(ingredient)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.BackgroundRole])
+
+    def add_ingredient(self, ingredient) -> bool:
+        """
+        Insert a checked ingredient at its sorted position.
+
+        Args:
+            ingredient (str): The ingredient name.
+
+        Returns:
+            bool: False if the ingredient was already in the list.
+        """
+        row = bisect_left(self.ingredients, ingredient)
+        if row < len(self.ingredients) and self.ingredients[row] == ingredient:
+            return False
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.ingredients.insert(row, ingredient)
+        self.selected.add(ingredient)
+        self.endInsertRows()
+        return True
+
+    def checked(self) -> list:
+        return [i for i in self.ingredients if i in self.selected]
 
 
 class IngredientsPage(QWidget):
@@ -24,85 +126,42 @@ class IngredientsPage(QWidget):
         """
         super().__init__(parent)
 
-        # Load custom fonts
-        font_id = QFontDatabase.addApplicationFont("media/fonts/InterVariable.ttf")
-        consolas_font_id = QFontDatabase.addApplicationFont("media/fonts/Consolas.ttf")
-        if font_id == -1 or consolas_font_id == -1:
-            print("Failed to load fonts")
-        else:
-            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            consolas_font_family = QFontDatabase.applicationFontFamilies(
-                consolas_font_id
-            )[0]
-            print(f"Loaded font families: {font_family}, {consolas_font_family}")
-            self.setFont(QFont(font_family))
+        # Custom fonts, registered once for the whole application
+        font_family = load_fonts()[0]
+        self.setFont(QFont(font_family))
 
         self.layout = QVBoxLayout(self)
         self.label = QLabel("Ingredients")
-        self.label.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 22px; font-weight: bold; color: #F0F6FC;"
-        )
+        self.label.setProperty("role", "page-title")
         self.layout.addWidget(self.label)
 
-        self.ingredients = self.load_ingredients_from_csv()
-
-        self.scroll_area = QScrollArea()
-        self.scroll_area.setWidgetResizable(True)
-        self.checkbox_frame = QFrame()
-        self.checkbox_layout = QVBoxLayout(self.checkbox_frame)
-        self.scroll_area.setWidget(self.checkbox_frame)
-        self.layout.addWidget(self.scroll_area)
-
-        self.checkboxes = {}
-        for ingredient in self.ingredients:
-            checkbox = QLabel(ingredient)
-            checkbox.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 20px; padding: 5px; border: 1px solid #3D444D; background-color: #238636; color: #F0F6FC;"
-            )
-            checkbox.mousePressEvent = (
-                lambda event, name=ingredient: self.toggle_checkbox(name)
-            )
-            self.checkbox_layout.addWidget(checkbox)
-            self.checkboxes[ingredient] = checkbox
+        # The view only paints the rows on screen, so a catalog-sized list
+        # scrolls as smoothly as a short one
+        self.model = IngredientListModel(load_ingredients_from_csv(), self)
+        self.list_view = QListView()
+        self.list_view.setProperty("role", "ingredients")
+        self.list_view.setModel(self.model)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setSpacing(3)  # Rows keep the model colors, so no ::item rule
+        self.list_view.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.list_view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.list_view.clicked.connect(self.model.toggle)
+        self.layout.addWidget(self.list_view)
 
         self.update_list_button = QPushButton("Update List")
-        self.update_list_button.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 20px; font-weight: bold; padding: 5px; border: 1px solid #3D444D; background-color: #151B23; color: #F0F6FC;"
-        )
+        self.update_list_button.setProperty("role", "nav")
         self.update_list_button.clicked.connect(self.update_list)
         self.layout.addWidget(self.update_list_button)
 
         self.add_ingredient_button = QPushButton("Add Ingredient")
-        self.add_ingredient_button.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 20px; font-weight: bold; padding: 5px; border: 1px solid #3D444D; background-color: #151B23; color: #F0F6FC;"
-        )
+        self.add_ingredient_button.setProperty("role", "nav")
         self.add_ingredient_button.clicked.connect(self.add_ingredient)
         self.layout.addWidget(self.add_ingredient_button)
 
         self.ingredient_input = QLineEdit()
         self.ingredient_input.setPlaceholderText("Enter new ingredient")
-        self.ingredient_input.setStyleSheet(
-            "font-family: 'Consolas'; font-size: 20px; padding: 5px; border: 1px solid #3D444D; background-color: #151B23; color: #F0F6FC;"
-        )
         self.layout.addWidget(self.ingredient_input)
 
-    def load_ingredients_from_csv(self):
-        """
-        Load the ingredients from the ingredients.csv file.
-
-        Args:
-            None
-
-        Returns:
-            list: The list of ingredients.
-        """
-        ingredients = set()
-        with open("data/ingredients.csv", "r") as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                ingredients.add(row["ingredient"].lower())
-        return sorted(ingredients)
-
     def save_ingredients_to_csv(self):
         """
         Save the ingredients to the ingredients.csv file.
@@ -113,32 +172,12 @@ class IngredientsPage(QWidget):
         Returns:
             None
         """
-        with open("data/ingredients.csv", "w", newline="") as file:
+        with open(INGREDIENTS_CSV, "w", newline="") as file:
             writer = csv.writer(file)
             writer.writerow(["ingredient"])
-            for ingredient in self.ingredients:
+            for ingredient in self.model.ingredients:
                 writer.writerow([ingredient])
 
-    def toggle_checkbox(self, name):
-        """
-        Toggle the background color of the checkbox.
-
-        Args:
-            name (str): The name of the checkbox.
-
-        Returns:
-            None
-        """
-        checkbox = self.checkboxes[name]
-        if checkbox.styleSheet().find("background-color: #238636;") == -1:
-            checkbox.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 20px; padding: 5px; border: 1px solid #3D444D; background-color: #238636; color: #F0F6FC;"
-            )
-        else:
-            checkbox.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 20px; padding: 5px; border: 1px solid #3D444D; color: #F0F6FC;"
-            )
-
     def update_list(self):
         """
         Update the list of checked ingredients.
@@ -149,11 +188,7 @@ class IngredientsPage(QWidget):
         Returns:
             list: The list of checked ingredients.
         """
-        checked_ingredients = [
-            ingredient
-            for ingredient, checkbox in self.checkboxes.items()
-            if checkbox.styleSheet().find("background-color: #238636;") != -1
-        ]
+        checked_ingredients = self.model.checked()
         print(
             "Checked ingredients:", checked_ingredients
         )  # TODO: Remove this troubleshooting print statement
@@ -182,33 +217,6 @@ class IngredientsPage(QWidget):
             None
         """
         new_ingredient = self.ingredient_input.text().strip().lower()
-        if new_ingredient and new_ingredient not in self.ingredients:
-            self.ingredients.append(new_ingredient)
-            self.ingredients = sorted(self.ingredients)
+        if new_ingredient and self.model.add_ingredient(new_ingredient):
             self.save_ingredients_to_csv()
             self.ingredient_input.clear()
-            self.refresh_ingredient_list()
-
-    def refresh_ingredient_list(self):
-        """
-        Refresh the list of ingredients.
-
-        Args:
-            None
-
-        Returns:
-            None
-        """
-        for checkbox in self.checkboxes.values():
-            checkbox.deleteLater()
-        self.checkboxes.clear()
-        for ingredient in self.ingredients:
-            checkbox = QLabel(ingredient)
-            checkbox.setStyleSheet(
-                "font-family: 'Consolas'; font-size: 20px; padding: 5px; border: 1px solid #3D444D; background-color: #238636; color: #F0F6FC;"
-            )
-            checkbox.mousePressEvent = (
-                lambda event, name=ingredient: self.toggle_checkbox(name)
-            )
-            self.checkbox_layout.addWidget(checkbox)
-            self.checkboxes[ingredient] = checkbox
@@ -3,8 +3,8 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import platform
-from PyQt6.QtGui import QFontDatabase, QFont, QPixmap, QIcon
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QPixmap, QIcon
+from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtWidgets import (
     QApplication,
     QWidget,
@@ -17,9 +17,25 @@ from PyQt6.QtWidgets import (
     QSpacerItem,
     QSizePolicy,
 )
-from gui.functions_page import FunctionsPage
-from gui.ingredients_page import IngredientsPage
-from gui.discover_page import DiscoverPage
+from gui.theme import load_fonts, application_stylesheet
+
+
+def build_functions_page():
+    from gui.functions_page import FunctionsPage  # Imports the hardware stack
+
+    return FunctionsPage()
+
+
+def build_ingredients_page():
+    from gui.ingredients_page import IngredientsPage
+
+    return IngredientsPage()
+
+
+def build_discover_page():
+    from gui.discover_page import DiscoverPage  # Imports the CocktailDB client
+
+    return DiscoverPage()
 
 
 class GUI(QWidget):
@@ -32,25 +48,19 @@ class GUI(QWidget):
         # Set the application icon in the taskbar
         self.setWindowIcon(QIcon("media/images/cocktail_icon_wback.png"))
 
-        # Load custom fonts
-        font_id = QFontDatabase.addApplicationFont("media/fonts/InterVariable.ttf")
-        consolas_font_id = QFontDatabase.addApplicationFont("media/fonts/Consolas.ttf")
-        if font_id == -1 or consolas_font_id == -1:
-            print("Failed to load fonts")
-        else:
-            font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            consolas_font_family = QFontDatabase.applicationFontFamilies(
-                consolas_font_id
-            )[0]
-            print(f"Loaded font families: {font_family}, {consolas_font_family}")
-            self.setFont(QFont(font_family))
+        # Custom fonts, registered once for the whole application
+        font_family = load_fonts()[0]
+        self.setFont(QFont(font_family))
+
+        # One stylesheet for every widget; pages only set roles and states
+        QApplication.instance().setStyleSheet(application_stylesheet())
 
         self.layout = QVBoxLayout(self)
 
         # Sidebar layout
         self.sidebar_layout = QVBoxLayout()
         self.sidebar_frame = QFrame()
-        self.sidebar_frame.setStyleSheet("background-color: #010409;")
+        self.sidebar_frame.setObjectName("sidebar")
         self.sidebar_frame.setLayout(self.sidebar_layout)
         self.layout.addWidget(self.sidebar_frame)
 
@@ -63,9 +73,7 @@ class GUI(QWidget):
             )
         )
         self.logo_label = QLabel("cocktail-compiler")
-        self.logo_label.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 26px; font-weight: bold; color: #F0F6FC;"
-        )
+        self.logo_label.setObjectName("logo")
         self.logo_layout.addWidget(self.logo_icon)
         self.logo_layout.addWidget(self.logo_label)
 
@@ -77,28 +85,7 @@ class GUI(QWidget):
         # Add the new exit button
         self.exit_button_top = QPushButton("✕")
         self.exit_button_top.setFixedSize(32, 32)  # Make it square
-        self.exit_button_top.setStyleSheet(
-            f"""
-            QPushButton {{
-                font-family: '{font_family}';
-                font-size: 20px;
-                background-color: #151B23;
-                color: #F0F6FC;
-                border: 1px solid #3D444D;
-                padding: 5px;
-            }}
-            QPushButton:hover {{
-                background-color: #FF0000;
-                color: #FFFFFF;
-                border: none;
-            }}
-            QPushButton:pressed {{
-                background-color: #CC0000;
-                color: #FFFFFF;
-                border: none;
-            }}
-            """
-        )
+        self.exit_button_top.setObjectName("exit")
         self.exit_button_top.clicked.connect(self.close_application)
         self.logo_layout.addWidget(self.exit_button_top)
 
@@ -106,37 +93,33 @@ class GUI(QWidget):
 
         # Sidebar buttons
         self.sidebar_button_1 = QPushButton("Functions")
-        self.sidebar_button_1.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 20px; font-weight: bold; background-color: #151B23; color: #F0F6FC; border: 1px solid #3D444D; padding: 5px;"
-        )
+        self.sidebar_button_1.setProperty("role", "nav")
         self.sidebar_button_1.clicked.connect(lambda: self.show_frame(0))
         self.sidebar_layout.addWidget(self.sidebar_button_1)
 
         self.sidebar_button_2 = QPushButton("Ingredients")
-        self.sidebar_button_2.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 20px; font-weight: bold; background-color: #151B23; color: #F0F6FC; border: 1px solid #3D444D; padding: 5px;"
-        )
+        self.sidebar_button_2.setProperty("role", "nav")
         self.sidebar_button_2.clicked.connect(lambda: self.show_frame(1))
         self.sidebar_layout.addWidget(self.sidebar_button_2)
 
         self.sidebar_button_3 = QPushButton("Discover")
-        self.sidebar_button_3.setStyleSheet(
-            f"font-family: '{font_family}'; font-size: 20px; font-weight: bold; background-color: #151B23; color: #F0F6FC; border: 1px solid #3D444D; padding: 5px;"
-        )
+        self.sidebar_button_3.setProperty("role", "nav")
         self.sidebar_button_3.clicked.connect(lambda: self.show_frame(2))
         self.sidebar_layout.addWidget(self.sidebar_button_3)
 
-        # Stacked widget for pages
+        # Stacked widget for pages, each built the first time it is shown so
+        # startup doesn't wait for the GPIO setup or the CocktailDB client
         self.stacked_widget = QStackedWidget()
         self.layout.addWidget(self.stacked_widget)
 
-        self.functions_page = FunctionsPage()
-        self.ingredients_page = IngredientsPage()
-        self.discover_page = DiscoverPage()
-
-        self.stacked_widget.addWidget(self.functions_page)
-        self.stacked_widget.addWidget(self.ingredients_page)
-        self.stacked_widget.addWidget(self.discover_page)
+        self.page_builders = [
+            build_functions_page,
+            build_ingredients_page,
+            build_discover_page,
+        ]
+        self.pages = [None] * len(self.page_builders)
+        for _ in self.page_builders:
+            self.stacked_widget.addWidget(QWidget())  # Placeholder
 
         self.show_frame(0)
 
@@ -144,16 +127,62 @@ class GUI(QWidget):
         if platform.system() == "Linux" and os.uname()[1] == "raspberrypi":
             self.showFullScreen()
 
+    def page(self, index):
+        """
+        Get a page, building it in place of its placeholder on first use.
+
+        Args:
+            index (int): The page index in the stacked widget.
+
+        Returns:
+            QWidget: The page.
+        """
+        if self.pages[index] is None:
+            placeholder = self.stacked_widget.widget(index)
+            self.pages[index] = self.page_builders[index]()
+            self.stacked_widget.insertWidget(index, self.pages[index])
+            self.stacked_widget.removeWidget(placeholder)
+            placeholder.deleteLater()
+        return self.pages[index]
+
+    @property
+    def functions_page(self):
+        return self.page(0)
+
+    @property
+    def ingredients_page(self):
+        return self.page(1)
+
+    @property
+    def discover_page(self):
+        return self.page(2)
+
     def show_frame(self, index):
-        self.stacked_widget.setCurrentIndex(index)
+        self.stacked_widget.setCurrentWidget(self.page(index))
 
     def close_application(self):
         QApplication.instance().quit()
 
 
 if __name__ == "__main__":
+    # Report import times and time to the first frame instead of running
+    if "--startup-report" in sys.argv:
+        from gui.startup_report import startup_report
+
+        sys.exit(startup_report(os.path.abspath(__file__)))
+
     app = QApplication(sys.argv)
     window = GUI()
-    window.setStyleSheet("background-color: #0D1017;")
     window.show()
+
+    if "--exit-after-first-frame" in sys.argv:
+        import time
+
+        def report_first_frame():
+            started = float(os.environ.get("STARTUP_REPORT_T0", time.time()))
+            print(f"First frame: {(time.time() - started) * 1000:.1f} ms")
+            app.quit()
+
+        QTimer.singleShot(0, report_first_frame)
+
     sys.exit(app.exec())
@@ -56,22 +56,7 @@ class Numpad(QWidget):
                         Qt.FocusPolicy.NoFocus
                     )  # Ensure buttons do not take focus
                     button.clicked.connect(self.create_handler(handler, text))
-                    button.setStyleSheet(
-                        """
-                        QPushButton {
-                            font-family: 'Consolas';
-                            font-size: 18px;
-                            padding: 10px;  /* Adjust padding */
-                            height: 60px;  /* Adjust height */
-                            border: 1px solid #3D444D;
-                            background-color: #151B23;
-                            color: #F0F6FC;
-                        }
-                        QPushButton:pressed {
-                            background-color: #238636;
-                        }
-                    """
-                    )
+                    button.setProperty("role", "key")
                     row_layout.addWidget(button)
             self.layout.addLayout(row_layout)
 
@@ -0,0 +1,76 @@
+import os
+import re
+import subprocess
+import sys
+import time
+
+STARTUP_BUDGET_MS = 3000  # time to the first frame allowed on the Pi
+REPORT_LINES = 15
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_import_times(stderr) -> list:
+    """
+    Parse the output of python -X importtime.
+
+    Args:
+        stderr (str): The interpreter's stderr.
+
+    Returns:
+        list: One (module, self us, cumulative us, depth) tuple per import,
+            in the order they finished.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            depth = (len(indent) - 1) // 2
+            imports.append((module, int(self_us), int(cumulative_us), depth))
+    return imports
+
+
+def startup_report(main_path, budget_ms=STARTUP_BUDGET_MS) -> int:
+    """
+    Start the GUI in a child interpreter with -X importtime and report where startup goes.
+
+    The child quits as soon as the first frame has been painted. The report
+    lists the slowest top-level imports and the time to the first frame,
+    which is checked against the startup budget.
+
+    Args:
+        main_path (str): The path of gui/main.py.
+        budget_ms (float): The allowed time to the first frame in milliseconds.
+
+    Returns:
+        int: The exit code, 1 if the first frame missed the budget.
+    """
+    env = dict(os.environ, STARTUP_REPORT_T0=repr(time.time()))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", main_path, "--exit-after-first-frame"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    first_frame = re.search(r"First frame: ([\d.]+) ms", result.stdout)
+    if result.returncode != 0 or not first_frame:
+        print(result.stdout + result.stderr)
+        print("The GUI did not reach its first frame.")
+        return 1
+
+    imports = parse_import_times(result.stderr)
+    top_level = sorted(
+        (i for i in imports if i[3] == 0), key=lambda i: i[2], reverse=True
+    )
+    total_ms = sum(i[1] for i in imports) / 1000
+    print(f"{'cumulative ms':>14} {'self ms':>9}  top-level import")
+    for module, self_us, cumulative_us, depth in top_level[:REPORT_LINES]:
+        print(f"{cumulative_us / 1000:14.1f} {self_us / 1000:9.1f}  {module}")
+    print(f"{len(imports)} modules imported in {total_ms:.1f} ms")
+
+    first_frame_ms = float(first_frame.group(1))
+    status = "OK" if first_frame_ms <= budget_ms else "OVER BUDGET"
+    print(f"First frame after {first_frame_ms:.1f} ms (budget {budget_ms} ms): {status}")
+    return 0 if first_frame_ms <= budget_ms else 1
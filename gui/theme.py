@@ -0,0 +1,215 @@
+from PyQt6.QtGui import QFontDatabase
+
+FONT_PATH = "media/fonts/InterVariable.ttf"
+MONO_FONT_PATH = "media/fonts/Consolas.ttf"
+FALLBACK_FONT = "Arial"
+FALLBACK_MONO_FONT = "Consolas"
+
+font_families = None  # (font, mono font), loaded once by load_fonts
+
+
+def load_fonts() -> tuple:
+    """
+    Register the application fonts with Qt, once per process.
+
+    Pages call this instead of adding the TTF files themselves, so the fonts
+    are read and parsed a single time however many pages are built.
+
+    Args:
+        None
+
+    Returns:
+        tuple: The family names of the UI font and the monospace font, or
+            the fallback families if a file could not be loaded.
+    """
+    global font_families
+    if font_families is None:
+        font_id = QFontDatabase.addApplicationFont(FONT_PATH)
+        mono_font_id = QFontDatabase.addApplicationFont(MONO_FONT_PATH)
+        if font_id == -1 or mono_font_id == -1:
+            print("Failed to load fonts")
+        font_families = (
+            (
+                QFontDatabase.applicationFontFamilies(font_id)[0]
+                if font_id != -1
+                else FALLBACK_FONT
+            ),
+            (
+                QFontDatabase.applicationFontFamilies(mono_font_id)[0]
+                if mono_font_id != -1
+                else FALLBACK_MONO_FONT
+            ),
+        )
+        print(f"Loaded font families: {font_families[0]}, {font_families[1]}")
+    return font_families
+
+
+def font_family() -> str:
+    return load_fonts()[0]
+
+
+def mono_font_family() -> str:
+    return load_fonts()[1]
+
+
+# Colors shared by every page
+BACKGROUND = "#0D1017"
+SIDEBAR = "#010409"
+SURFACE = "#151B23"
+BORDER = "#3D444D"
+TEXT = "#F0F6FC"
+MUTED_TEXT = "#9198A1"
+DISABLED_TEXT = "#6E7681"
+ACCENT = "#238636"
+
+# The application stylesheet. Widgets pick their look with the "role"
+# property or their object name, so Qt parses this sheet once instead of
+# one inline sheet per widget.
+STYLESHEET = """
+QWidget {{
+    background-color: {background};
+    color: {text};
+}}
+QFrame#sidebar, QFrame#sidebar QLabel {{
+    background-color: {sidebar};
+}}
+QLabel {{
+    font-family: '{mono}';
+    font-size: 18px;
+}}
+QLabel#logo {{
+    font-family: '{font}';
+    font-size: 26px;
+    font-weight: bold;
+}}
+QLabel[role="page-title"] {{
+    font-family: '{font}';
+    font-size: 22px;
+    font-weight: bold;
+}}
+QLabel[role="title"] {{
+    font-size: 22px;
+    font-weight: bold;
+}}
+QLabel[role="heading"] {{
+    font-size: 20px;
+    font-weight: bold;
+}}
+QLabel[role="body"] {{
+    font-size: 20px;
+}}
+QLabel[role="hint"] {{
+    font-size: 16px;
+    color: {muted};
+}}
+QPushButton {{
+    font-family: '{mono}';
+    font-size: 20px;
+    font-weight: bold;
+    padding: 5px;
+    border: 1px solid {border};
+    background-color: {surface};
+}}
+QPushButton:pressed {{
+    background-color: {accent};
+}}
+QPushButton[role="nav"] {{
+    font-family: '{font}';
+}}
+QPushButton[role="compact"] {{
+    font-size: 18px;
+    font-weight: normal;
+}}
+QPushButton[role="toggle"] {{
+    font-size: 18px;
+    font-weight: normal;
+}}
+QPushButton[role="toggle"]:checked {{
+    background-color: {accent};
+}}
+QPushButton[role="key"] {{
+    font-size: 18px;
+    font-weight: normal;
+    padding: 10px;
+    height: 60px;
+}}
+QPushButton#exit {{
+    font-family: '{font}';
+    font-weight: normal;
+}}
+QPushButton#exit:hover {{
+    background-color: #FF0000;
+    color: #FFFFFF;
+    border: none;
+}}
+QPushButton#exit:pressed {{
+    background-color: #CC0000;
+    color: #FFFFFF;
+    border: none;
+}}
+QLineEdit {{
+    font-family: '{mono}';
+    font-size: 20px;
+    padding: 5px;
+    border: 1px solid {border};
+    background-color: {surface};
+}}
+QLineEdit[role="compact"] {{
+    font-size: 18px;
+}}
+QListView[role="ingredients"] {{
+    font-family: '{mono}';
+    font-size: 20px;
+}}
+QProgressBar {{
+    font-family: '{mono}';
+    font-size: 16px;
+    border: 1px solid {border};
+    background-color: {surface};
+    text-align: center;
+    height: 22px;
+}}
+QProgressBar::chunk {{
+    background-color: {accent};
+}}
+QListView[role="cocktails"] {{
+    background-color: {surface};
+    border: 1px solid {border};
+}}
+QListView[role="cocktails"]::item {{
+    font-family: '{mono}';
+    font-size: 20px;
+    padding: 8px;
+    background-color: {surface};
+    border-bottom: 1px solid {border};
+}}
+QListView[role="cocktails"]::item:selected {{
+    background-color: {accent};
+    color: #FFFFFF;
+}}
+"""
+
+
+def application_stylesheet() -> str:
+    """
+    Build the application stylesheet with the loaded font families.
+
+    Args:
+        None
+
+    Returns:
+        str: The stylesheet to set once on the QApplication.
+    """
+    font, mono = load_fonts()
+    return STYLESHEET.format(
+        font=font,
+        mono=mono,
+        background=BACKGROUND,
+        sidebar=SIDEBAR,
+        surface=SURFACE,
+        border=BORDER,
+        text=TEXT,
+        muted=MUTED_TEXT,
+        accent=ACCENT,
+    )
+
@@ -1,58 +1,49 @@
-try:
-    import RPi.GPIO as GPIO
-except ImportError:
-    # Mock RPi.GPIO for development on non-Raspberry Pi platforms
-    class GPIO:
-        BCM = "BCM"
-        OUT = "OUT"
-        IN = "IN"
-        HIGH = "HIGH"
-        LOW = "LOW"
-
-        @staticmethod
-        def setmode(mode):
-            print(f"GPIO setmode({mode})")
-
-        @staticmethod
-        def setup(pin, mode):
-            print(f"GPIO setup(pin={pin}, mode={mode})")
-
-        @staticmethod
-        def output(pin, state):
-            print(f"GPIO output(pin={pin}, state={state})")
-
-        @staticmethod
-        def cleanup():
-            print("GPIO cleanup()")
-
-
 import time
-import threading
 import data.config as cfg
-from data.cocktails_data import cocktail_list
+from data.calibration import calibration_journal
+from data.recipe_store import get_recipe_store
+from data.measures import drop_unpoured
 from hardware.pump import pump
+from hardware.scheduler import pour_scheduler
+from hardware.order_queue import order_queue, plan_phases
+from hardware.loadout import optimize_loadout
+from hardware.flow import flow_model
+
+FLOW_TEST_TIME = 10  # seconds poured to measure a pump's flow rate
+RELAY_PINS = [17, 27, 22, 23]  # GPIO pins connected to IN1-IN4 on relay board
 
 
 class bartender:
-    def __init__(self):
+    def __init__(self, gpio=None, clock=None):
         """
         Initialize the bartender class.
 
         Args:
-            None
+            gpio: The GPIO backend (default is RPi.GPIO, or its mock off the Pi).
+                Pass a simulated_gpio to pour in virtual time.
+            clock: The clock of the GPIO backend (default is the real clock).
 
         Returns:
             None
         """
-        self.relay_pins = [
-            17,
-            27,
-            22,
-            23,
-        ]  # GPIO pins connected to IN1-IN4 on relay board
-        self.tube_fill_times = cfg.TUBE_FILL_TIMES
-        self.pump = pump(self.relay_pins)
+        self.relay_pins = list(RELAY_PINS)
+        self.calibration = calibration_journal(
+            defaults=cfg.TUBE_FILL_TIMES, flow_defaults=cfg.PUMP_FLOW_RATES
+        )
+        self.tube_fill_times = list(self.calibration.fill_times)
+        self.calibration_version = self.calibration.version
+        self.flow = flow_model(
+            self.calibration.version,
+            self.calibration.fill_times,
+            self.calibration.flow_rates,
+        )
+        self.calibration.subscribe(self.apply_calibration)
+        self.recipes = get_recipe_store()
+        self.pump = pump(self.relay_pins, gpio=gpio, clock=clock)
         self.pump.setup()  # Initialize the relays
+        self.scheduler = pour_scheduler(self.pump)
+        self.loadout = [None] * len(self.relay_pins)  # ingredient on each pump
+        self.orders = order_queue(self.loadout, duration=self.estimate_pour_time)
 
     def __del__(self):
         """
@@ -64,30 +55,72 @@ class bartender:
         Returns:
             None
         """
-        GPIO.cleanup()
+        self.pump.gpio.cleanup()
+
+    def apply_calibration(self, version, fill_times, flow_rates) -> None:
+        """
+        Apply a newly saved calibration to the running bartender.
+
+        Args:
+            version (int): The calibration version
+            fill_times (list): The tube fill time of each pump in seconds
+            flow_rates (list): The flow rate of each pump in ml/sec
+
+        Returns:
+            None
+        """
+        self.tube_fill_times[:] = fill_times
+        self.flow = flow_model(version, fill_times, flow_rates)
+        self.calibration_version = version
 
-    def convert_oz_to_sec(self, oz, tube_number) -> float:
+    def save_calibration(self, fill_times, flow_rates=None) -> int:
         """
-        Convert ounces to seconds based on the tube fill time.
+        Save a calibration to the calibration journal and apply it immediately.
+
+        Args:
+            fill_times (dict): The new fill time in seconds of each pump index
+            flow_rates (dict): The new flow rate in ml/sec of each pump index
+
+        Returns:
+            int: The version of the saved calibration
+        """
+        return self.calibration.save(fill_times, self.relay_pins, flow_rates)
+
+    def convert_oz_to_sec(self, oz, tube_number, ingredient=None) -> float:
+        """
+        Convert ounces to seconds based on the pump's flow model.
 
         Args:
             oz (float): The amount to pour in ounces
             tube_number (int): The tube number to pour from
+            ingredient (str): The ingredient, whose viscosity slows the flow
 
         Returns:
             float: The time to pour in seconds
         """
-        ml_per_sec = 1.6  # flow rate is roughly 1.6 ml/sec from testing
-        ml_to_oz = 1 / 29.574  # 1 oz = 29.574 ml
-        time = self.tube_fill_times[tube_number] + (oz / (ml_per_sec * ml_to_oz))
+        time = self.flow.duration(tube_number, oz, ingredient)
         print(
-            f"Tube {tube_number} fill time: {self.tube_fill_times[tube_number]:.2f} seconds"
+            f"Tube {tube_number} fill time: {self.flow.fill_times[tube_number]:.2f} seconds"
         )
         return time
 
+    def estimate_pour_time(self, ingredient, oz) -> float:
+        """
+        Estimate how long an ingredient takes to pour before it is assigned a pump.
+
+        Args:
+            ingredient (str): The ingredient, whose viscosity slows the flow
+            oz (float): The amount to pour in ounces
+
+        Returns:
+            float: The average pour time over the pumps in seconds
+        """
+        pumps = range(len(self.relay_pins))
+        return sum(self.flow.duration(i, oz, ingredient) for i in pumps) / len(pumps)
+
     def clean_tubes(self) -> None:
         """
-        Clean all tubes for 10 seconds.
+        Clean all tubes for 10 seconds, running every pump at once.
 
         Args:
             None
@@ -96,9 +129,13 @@ class bartender:
             None
         """
         try:
-            for relay_pin in self.relay_pins:
-                print(f"Cleaning tube connected to GPIO {relay_pin}")
-                self.pump.turn_on(relay_pin, 10)  # Turn relay on for 10 seconds
+            print(f"Cleaning tubes connected to GPIO {self.relay_pins}")
+            self.run_plan(
+                [
+                    {"pump": i, "relay_pin": relay_pin, "duration": 10}
+                    for i, relay_pin in enumerate(self.relay_pins)
+                ]
+            )
         except KeyboardInterrupt:
             print("Keyboard interrupt")
 
@@ -128,19 +165,38 @@ class bartender:
                     f"Elapsed time: {elapsed_time:.2f} seconds"
                 )  # TODO: Remove this troubleshooting print statement
 
+                # The tube is full now, so a timed pour measures the flow rate alone
+                flow_rates = {}
+                measure = (
+                    input("Do you want to measure the flow rate? (y/n): ")
+                    .strip()
+                    .lower()
+                )
+                if measure == "y":
+                    input(
+                        f"Place a measuring cup and press any key to pour for {FLOW_TEST_TIME} seconds"
+                    )
+                    self.pump.turn_on(relay_pin, FLOW_TEST_TIME)
+                    while True:
+                        try:
+                            ml = float(input("How many ml were poured? "))
+                            break
+                        except ValueError:
+                            print("Please enter a number, e.g. 42.5")
+                    if ml > 0:
+                        flow_rates[i] = round(ml / FLOW_TEST_TIME, 3)
+                        print(f"Flow rate: {flow_rates[i]:.3f} ml/sec")
+                    else:
+                        print("Nothing was poured, keeping the previous flow rate.")
+
                 save = (
                     input("Do you want to save this calibration? (y/n): ")
                     .strip()
                     .lower()
                 )
                 if save == "y":
-                    self.tube_fill_times[i] = elapsed_time
-
-                    # Update config.py
-                    with open("data/config.py", "w") as file:
-                        file.write("TUBE_FILL_TIMES = ")
-                        file.write(str(self.tube_fill_times))
-                        print("Calibration saved.")
+                    self.save_calibration({i: elapsed_time}, flow_rates)
+                    print("Calibration saved.")
                 else:
                     print("Calibration not saved.")
         except KeyboardInterrupt:
@@ -163,6 +219,98 @@ class bartender:
         except KeyboardInterrupt:
             print("Keyboard interrupt")
 
+    def optimize_loadout(self, popularity=None) -> dict:
+        """
+        Find the ingredient for each pump that covers the most cocktails without swaps.
+
+        Args:
+            popularity (dict): Optional weight of each cocktail name (default
+                weighs each cocktail by one plus its pour count)
+
+        Returns:
+            dict: The pump index of each chosen ingredient
+        """
+        if popularity is None:
+            popularity = {
+                name: 1 + count for name, count in self.recipes.pour_counts().items()
+            }
+        return optimize_loadout(
+            self.recipes.all_cocktails(),
+            len(self.relay_pins),
+            popularity,
+            self.loadout,
+        )
+
+    def apply_loadout(self, assignment) -> None:
+        """
+        Record which ingredient is attached to each pump.
+
+        Args:
+            assignment (dict): The pump index of each attached ingredient
+
+        Returns:
+            None
+        """
+        self.loadout[:] = [None] * len(self.relay_pins)
+        for ingredient, pump_index in assignment.items():
+            self.loadout[pump_index] = ingredient
+
+    def pour_plan(self, cocktail, assignment=None) -> list:
+        """
+        Build the pour plan of a cocktail.
+
+        Args:
+            cocktail (dict): The cocktail with its name and ingredients.
+            assignment (dict): The pump index of each ingredient poured in this
+                phase (default maps ingredient i to pump i). Other ingredients
+                are left out of the plan.
+
+        Returns:
+            list: One step per pump, each a dict with the pump index, relay pin,
+                ingredient, amount and pour duration in seconds.
+        """
+        # Ingredients of 0 oz or less (e.g. a garnish) are not poured
+        poured = drop_unpoured(cocktail["ingredients"])
+        if assignment is None:
+            assignment = {
+                ingredient: i
+                for i, ingredient in enumerate(poured)
+                if i < len(self.relay_pins)
+            }
+
+        plan = []
+        for ingredient, amount in poured.items():
+            if ingredient not in assignment:
+                continue  # Poured in another phase
+
+            i = assignment[ingredient]
+            plan.append(
+                {
+                    "pump": i,
+                    "relay_pin": self.relay_pins[i],
+                    "ingredient": ingredient,
+                    "amount": amount,
+                    "duration": self.convert_oz_to_sec(amount, i, ingredient),
+                }
+            )
+        return plan
+
+    def run_plan(self, plan, progress=None) -> dict:
+        """
+        Run a pour plan on the scheduler and wait for it to finish.
+
+        Args:
+            plan (list): The steps built by pour_plan.
+            progress (function): Optional function called with the seconds
+                since the start while the plan runs.
+
+        Returns:
+            dict: The timing metrics of the run.
+        """
+        metrics = self.scheduler.run(plan, progress)
+        print(f"Stop skew: {metrics['stop_skew'] * 1000:.2f} ms")
+        return metrics
+
     def cocktail_to_pump(self, cocktail_name) -> None:
         """
         Make a cocktail.
@@ -173,37 +321,32 @@ class bartender:
         Returns:
             None
         """
-        cocktail = next(
-            (c for c in cocktail_list if c["name"].lower() == cocktail_name.lower()),
-            None,
-        )
+        cocktail = self.recipes.get_cocktail(cocktail_name)
 
         if cocktail is None:
             print(f"Cocktail '{cocktail_name}' not found.")
             return
 
         try:
-            threads = []
-            for i, (ingredient, amount) in enumerate(cocktail["ingredients"].items()):
-                if i >= len(self.relay_pins):
-                    print("Not enough pumps for all ingredients.")
-                    break
-
-                relay_pin = self.relay_pins[i]
-                time_to_pour = self.convert_oz_to_sec(amount, i)  # Tube i
-                print(
-                    f"Pouring {amount} oz of {ingredient} (GPIO {relay_pin}) for {time_to_pour:.2f} seconds"
-                )
-
-                # Create a thread for each pump
-                thread = threading.Thread(
-                    target=self.pump.turn_on, args=(relay_pin, time_to_pour)
-                )
-                threads.append(thread)
-                thread.start()
-
-            # Wait for all threads to complete
-            for thread in threads:
-                thread.join()
+            # Pour in phases when there are more ingredients than pumps,
+            # keeping lines that are already attached and swapping the rest
+            phases = plan_phases(
+                cocktail["ingredients"], self.loadout, duration=self.estimate_pour_time
+            )
+            for number, (assignment, swaps) in enumerate(phases, 1):
+                if len(phases) > 1:
+                    print(f"Phase {number} of {len(phases)}")
+                for pump_index, old, new in swaps:
+                    print(f"Attach {new} to pump {pump_index + 1} (was {old})")
+                if swaps:
+                    input("Swap the lines, then press Enter to continue")
+
+                plan = self.pour_plan(cocktail, assignment)
+                for step in plan:
+                    print(
+                        f"Pouring {step['amount']} oz of {step['ingredient']} (GPIO {step['relay_pin']}) for {step['duration']:.2f} seconds"
+                    )
+                self.run_plan(plan)
+            self.recipes.record_pour(cocktail["name"])
         except KeyboardInterrupt:
             print("Keyboard interrupt")
@@ -0,0 +1,209 @@
+import threading
+from collections import deque
+
+MAX_PENDING_JOBS = 8  # jobs allowed to wait behind the running one
+
+# Results of hardware_executor.submit
+ACCEPTED = "accepted"
+BUSY = "busy"  # a relay the job needs is driven or reserved by another job
+FULL = "full"  # MAX_PENDING_JOBS are already waiting
+STOPPED = "stopped"
+
+
+class hardware_executor:
+    def __init__(self, relay_pins, max_pending=MAX_PENDING_JOBS):
+        """
+        Initialize the hardware job executor.
+
+        Jobs run one at a time on a single worker thread, started with the
+        first job, so the thread count stays fixed however often jobs are
+        submitted. Every relay has at most one owner: the running job, or a
+        claim held by code that drives the relay directly (e.g. pump
+        calibration). A job only starts once every relay it needs is free,
+        so no relay is driven by two jobs or switched off by the wrong one.
+
+        Args:
+            relay_pins (list): The GPIO pins of the relays.
+            max_pending (int): The number of jobs allowed to wait.
+
+        Returns:
+            None
+        """
+        self.relay_pins = list(relay_pins)
+        self.max_pending = max_pending
+        self.condition = threading.Condition()
+        self.pending = deque()  # (name, relay pins, job) waiting to run
+        self.owners = {}  # relay pin -> name of the job or claim driving it
+        self.listeners = []
+        self.worker_thread = None
+        self.stopping = False
+
+    def submit(self, name, relay_pins, job, conflict="reject") -> str:
+        """
+        Queue a job that drives some relays.
+
+        Args:
+            name (str): The job name, passed to the listeners.
+            relay_pins (iterable): The relay pins the job switches.
+            job (function): Called without arguments on the worker thread.
+            conflict (str): "reject" to refuse the job when one of its relays
+                is driven or reserved by another job or claim, or "queue" to
+                wait until they are free.
+
+        Returns:
+            str: ACCEPTED, or BUSY, FULL or STOPPED if the job was refused.
+        """
+        relay_pins = set(relay_pins)
+        with self.condition:
+            if self.stopping:
+                return STOPPED
+            if len(self.pending) >= self.max_pending:
+                return FULL
+            if conflict == "reject" and relay_pins & self.busy_pins():
+                return BUSY
+            self.pending.append((name, relay_pins, job))
+            if self.worker_thread is None:
+                self.worker_thread = threading.Thread(
+                    target=self.run, name="hardware-executor", daemon=True
+                )
+                self.worker_thread.start()
+            self.condition.notify_all()
+        return ACCEPTED
+
+    def claim(self, name, relay_pins) -> bool:
+        """
+        Take ownership of relays to drive them directly, outside a job.
+
+        Args:
+            name (str): The owner name, used to release the claim.
+            relay_pins (iterable): The relay pins to claim.
+
+        Returns:
+            bool: False if a relay is driven or reserved by someone else.
+        """
+        relay_pins = set(relay_pins)
+        with self.condition:
+            if relay_pins & self.busy_pins(name):
+                return False
+            for relay_pin in relay_pins:
+                self.owners[relay_pin] = name
+        return True
+
+    def release(self, name) -> None:
+        """
+        Release every relay owned by a claim, letting waiting jobs start.
+
+        Args:
+            name (str): The owner name given to claim.
+
+        Returns:
+            None
+        """
+        with self.condition:
+            for relay_pin in [p for p, owner in self.owners.items() if owner == name]:
+                del self.owners[relay_pin]
+            self.condition.notify_all()
+
+    def busy_pins(self, owner=None) -> set:
+        """
+        Get the relays driven or reserved by others. Must hold the condition.
+
+        Args:
+            owner (str): An owner whose own relays count as free.
+
+        Returns:
+            set: The busy relay pins.
+        """
+        busy = {pin for pin, name in self.owners.items() if name != owner}
+        for name, relay_pins, job in self.pending:
+            busy |= relay_pins
+        return busy
+
+    def subscribe(self, listener) -> None:
+        """
+        Register a function called when a job starts, finishes or fails.
+
+        The function gets the event ("started", "finished" or "failed"), the
+        job name and the job's result or exception, on the worker thread.
+
+        Args:
+            listener (function): The function to call.
+
+        Returns:
+            None
+        """
+        self.listeners.append(listener)
+
+    def stop(self, wait=True) -> None:
+        """
+        Drop the waiting jobs and end the worker thread after the running job.
+
+        Args:
+            wait (bool): Whether to wait for the running job to finish.
+
+        Returns:
+            None
+        """
+        with self.condition:
+            self.stopping = True
+            self.pending.clear()
+            self.condition.notify_all()
+            worker_thread = self.worker_thread
+        if wait and worker_thread is not None:
+            worker_thread.join()
+
+    def run(self) -> None:
+        """
+        Run the waiting jobs in order, each once its relays are free.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        try:
+            while True:
+                with self.condition:
+                    while not self.stopping and not (
+                        self.pending and not self.pending[0][1] & set(self.owners)
+                    ):
+                        self.condition.wait()
+                    if self.stopping:
+                        return
+                    name, relay_pins, job = self.pending.popleft()
+                    for relay_pin in relay_pins:
+                        self.owners[relay_pin] = name
+
+                self.notify("started", name, None)
+                try:
+                    event, value = "finished", job()
+                except Exception as error:
+                    print(f"Hardware job {name} failed: {error}")
+                    event, value = "failed", error
+
+                # Free the relays before reporting, so a listener can submit at once
+                self.release(name)
+                self.notify(event, name, value)
+        finally:
+            # Let the next submit start a new worker if this one died
+            with self.condition:
+                self.worker_thread = None
+
+    def notify(self, event, name, value) -> None:
+        """
+        Call every listener, so one that raises can't end the worker thread.
+
+        Args:
+            event (str): "started", "finished" or "failed".
+            name (str): The job name.
+            value: The job's result or exception, or None.
+
+        Returns:
+            None
+        """
+        for listener in self.listeners:
+            try:
+                listener(event, name, value)
+            except Exception as error:
+                print(f"Hardware job listener failed on {name}: {error}")
@@ -0,0 +1,84 @@
+import data.config as cfg
+
+ML_PER_OZ = 29.574  # 1 oz = 29.574 ml
+
+
+def viscosity_class(ingredient) -> str:
+    """
+    Get the viscosity class of an ingredient.
+
+    Args:
+        ingredient (str): The ingredient name.
+
+    Returns:
+        str: The viscosity class, "thin" unless listed in the config.
+    """
+    return cfg.INGREDIENT_VISCOSITY.get(ingredient.lower(), "thin")
+
+
+class flow_model:
+    def __init__(self, version, fill_times, flow_rates):
+        """
+        Initialize the flow model of one calibration version.
+
+        The pour time of every pump and viscosity class is precomputed into a
+        lookup table, so converting an amount is one multiply and one add.
+        A new model is built for every calibration version instead of being
+        updated in place, so a pour in progress keeps a consistent table.
+
+        Args:
+            version (int): The calibration version the model was built from.
+            fill_times (list): The tube fill time of each pump in seconds.
+            flow_rates (list): The flow rate of each pump in ml/sec for thin
+                liquids. A rate that is not positive falls back to the
+                configured default of its pump.
+
+        Returns:
+            None
+        """
+        self.version = version
+        self.fill_times = list(fill_times)
+        self.flow_rates = [
+            flow_rate
+            if flow_rate > 0
+            else cfg.PUMP_FLOW_RATES[min(pump, len(cfg.PUMP_FLOW_RATES) - 1)]
+            for pump, flow_rate in enumerate(flow_rates)
+        ]
+        # seconds per oz of each viscosity class, for each pump
+        self.table = [
+            {
+                viscosity: ML_PER_OZ / (flow_rate * factor)
+                for viscosity, factor in cfg.VISCOSITY_FACTORS.items()
+            }
+            for flow_rate in self.flow_rates
+        ]
+
+    def seconds_per_oz(self, pump, ingredient) -> float:
+        """
+        Look up how long a pump takes to pour one ounce of an ingredient.
+
+        Args:
+            pump (int): The pump index.
+            ingredient (str): The ingredient name.
+
+        Returns:
+            float: The time in seconds.
+        """
+        rates = self.table[pump]
+        return rates.get(viscosity_class(ingredient), rates["thin"])
+
+    def duration(self, pump, oz, ingredient=None) -> float:
+        """
+        Convert an amount to the time the pump has to run, including filling the tube.
+
+        Args:
+            pump (int): The pump index.
+            oz (float): The amount to pour in ounces.
+            ingredient (str): The ingredient name (default pours like water).
+
+        Returns:
+            float: The time in seconds.
+        """
+        if ingredient is None:
+            return self.fill_times[pump] + oz * self.table[pump]["thin"]
+        return self.fill_times[pump] + oz * self.seconds_per_oz(pump, ingredient)
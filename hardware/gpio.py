@@ -0,0 +1,26 @@
+try:
+    import RPi.GPIO as GPIO
+except ImportError:
+    # Mock RPi.GPIO for development on non-Raspberry Pi platforms
+    class GPIO:
+        BCM = "BCM"
+        OUT = "OUT"
+        IN = "IN"
+        HIGH = "HIGH"
+        LOW = "LOW"
+
+        @staticmethod
+        def setmode(mode):
+            print(f"GPIO setmode({mode})")
+
+        @staticmethod
+        def setup(pin, mode):
+            print(f"GPIO setup(pin={pin}, mode={mode})")
+
+        @staticmethod
+        def output(pin, state):
+            print(f"GPIO output(pin={pin}, state={state})")
+
+        @staticmethod
+        def cleanup():
+            print("GPIO cleanup()")
@@ -0,0 +1,225 @@
+EXACT_PUMP_LIMIT = 4  # largest pump count searched exhaustively
+
+
+def submasks(mask):
+    """
+    Yield every non-empty subset of a bitmask.
+
+    Args:
+        mask (int): The bitmask.
+
+    Yields:
+        int: The subsets of mask.
+    """
+    sub = mask
+    while sub:
+        yield sub
+        sub = (sub - 1) & mask
+
+
+def optimize_loadout(recipes, pump_count, popularity=None, loadout=None) -> dict:
+    """
+    Choose which ingredient to attach to each pump to serve the most demand without swaps.
+
+    A recipe is covered when all its ingredients are attached. Each recipe is
+    weighted by its popularity (default 1 each). Up to EXACT_PUMP_LIMIT pumps
+    the unions of recipes that fit on the pumps are searched by branch and
+    bound, which is exact because an optimal set of lines is always such a
+    union; beyond that a greedy search adds the recipe with the best weight
+    per new line.
+
+    Args:
+        recipes (list): The cocktails with their names and ingredients.
+        pump_count (int): The number of pumps.
+        popularity (dict): Optional weight of each cocktail name.
+        loadout (list): The ingredient currently on each pump, used to avoid
+            moving lines that stay attached.
+
+    Returns:
+        dict: The pump index of each chosen ingredient.
+    """
+    popularity = popularity or {}
+
+    # Encode each coverable recipe as a bitmask of interned ingredients
+    ingredient_ids = {}
+    weight_by_mask = {}
+    for recipe in recipes:
+        ingredients = list(recipe["ingredients"])
+        if not ingredients or len(ingredients) > pump_count:
+            continue
+        mask = 0
+        for ingredient in ingredients:
+            mask |= 1 << ingredient_ids.setdefault(ingredient, len(ingredient_ids))
+        weight = popularity.get(recipe["name"], 1)
+        weight_by_mask[mask] = weight_by_mask.get(mask, 0) + weight
+
+    if pump_count <= EXACT_PUMP_LIMIT:
+        chosen = exact_search(weight_by_mask, pump_count)
+    else:
+        chosen = greedy_search(weight_by_mask, pump_count)
+
+    # Fill spare pumps with the most used remaining ingredients
+    usage = {}
+    for mask, weight in weight_by_mask.items():
+        for sub in bits(mask & ~chosen):
+            usage[sub] = usage.get(sub, 0) + weight
+    for bit in sorted(usage, key=usage.get, reverse=True):
+        if bin(chosen).count("1") >= pump_count:
+            break
+        chosen |= bit
+
+    names = {1 << i: ingredient for ingredient, i in ingredient_ids.items()}
+    return place_on_pumps([names[bit] for bit in bits(chosen)], pump_count, loadout)
+
+
+def bits(mask):
+    """
+    Yield each set bit of a bitmask as its own mask.
+
+    Args:
+        mask (int): The bitmask.
+
+    Yields:
+        int: The single-bit masks.
+    """
+    while mask:
+        low = mask & -mask
+        yield low
+        mask ^= low
+
+
+def coverage(weight_by_mask, chosen) -> float:
+    """
+    Sum the weight of the recipes covered by a set of small size, via its subsets.
+
+    Args:
+        weight_by_mask (dict): The total weight of each recipe bitmask.
+        chosen (int): The bitmask of attached ingredients.
+
+    Returns:
+        float: The covered weight.
+    """
+    return sum(weight_by_mask.get(sub, 0) for sub in submasks(chosen))
+
+
+def exact_search(weight_by_mask, pump_count) -> int:
+    """
+    Find the best set of ingredients by branch and bound over unions of recipes.
+
+    Recipes are added in a fixed order so every union is reachable. A branch
+    is pruned when an upper bound on what its free pumps could still add
+    doesn't beat the best set found so far (seeded by the greedy search).
+    The bound splits each recipe's weight evenly over the ingredients it still
+    needs and takes the best ingredients for the free pumps, which can only
+    overestimate because a recipe is covered only once all of them are chosen.
+
+    Args:
+        weight_by_mask (dict): The total weight of each recipe bitmask.
+        pump_count (int): The number of pumps.
+
+    Returns:
+        int: The bitmask of the chosen ingredients.
+    """
+    masks = sorted(weight_by_mask, key=weight_by_mask.get, reverse=True)
+    best_mask = greedy_search(weight_by_mask, pump_count)
+    best_weight = coverage(weight_by_mask, best_mask)
+    expanded = {}  # union -> lowest start index it was expanded from
+    stack = [(0, 0)]  # (union so far, index of the next recipe to try)
+    while stack:
+        union, start = stack.pop()
+        if union in expanded and expanded[union] <= start:
+            continue
+        expanded[union] = start
+        weight = coverage(weight_by_mask, union)
+        if weight > best_weight:
+            best_mask, best_weight = union, weight
+
+        free = pump_count - bin(union).count("1")
+        extensions = []
+        shares = {}
+        for i in range(start, len(masks)):
+            needed = masks[i] & ~union
+            count = bin(needed).count("1")
+            if not needed or count > free:
+                continue
+            extensions.append(i)
+            share = weight_by_mask[masks[i]] / count
+            for bit in bits(needed):
+                shares[bit] = shares.get(bit, 0) + share
+        bound = weight + sum(sorted(shares.values(), reverse=True)[:free])
+        if bound <= best_weight:
+            continue
+        for i in reversed(extensions):
+            stack.append((union | masks[i], i + 1))
+    return best_mask
+
+
+def greedy_search(weight_by_mask, pump_count) -> int:
+    """
+    Pick recipes greedily by covered weight gained per newly attached ingredient.
+
+    Args:
+        weight_by_mask (dict): The total weight of each recipe bitmask.
+        pump_count (int): The number of pumps.
+
+    Returns:
+        int: The bitmask of the chosen ingredients.
+    """
+
+    def covered(chosen):
+        return sum(w for m, w in weight_by_mask.items() if m & ~chosen == 0)
+
+    chosen = 0
+    chosen_weight = 0
+    while True:
+        best = None
+        for mask in weight_by_mask:
+            candidate = chosen | mask
+            added = bin(candidate).count("1") - bin(chosen).count("1")
+            if not added or bin(candidate).count("1") > pump_count:
+                continue
+            gain = (covered(candidate) - chosen_weight) / added
+            if best is None or gain > best[0]:
+                best = (gain, candidate)
+        if best is None:
+            return chosen
+        chosen = best[1]
+        chosen_weight = covered(chosen)
+
+
+def place_on_pumps(ingredients, pump_count, loadout=None) -> dict:
+    """
+    Give each chosen ingredient a pump, leaving already attached lines where they are.
+
+    Args:
+        ingredients (list): The chosen ingredients.
+        pump_count (int): The number of pumps.
+        loadout (list): The ingredient currently on each pump.
+
+    Returns:
+        dict: The pump index of each ingredient.
+    """
+    loadout = loadout or [None] * pump_count
+    assignment = {i: loadout.index(i) for i in ingredients if i in loadout}
+    free_pumps = [p for p in range(pump_count) if p not in assignment.values()]
+    for ingredient in sorted(i for i in ingredients if i not in assignment):
+        assignment[ingredient] = free_pumps.pop(0)
+    return assignment
+
+
+def covered_recipes(recipes, assignment) -> list:
+    """
+    List the recipes that can be poured with a loadout without any swap.
+
+    Args:
+        recipes (list): The cocktails with their names and ingredients.
+        assignment (dict): The pump index of each attached ingredient.
+
+    Returns:
+        list: The names of the covered cocktails.
+    """
+    return [
+        recipe["name"]
+        for recipe in recipes
+        if recipe["ingredients"] and all(i in assignment for i in recipe["ingredients"])
+    ]
@@ -0,0 +1,279 @@
+import itertools
+import threading
+from data.measures import drop_unpoured
+
+
+def assign_pumps(ingredients, loadout, demand=None) -> tuple:
+    """
+    Assign a cocktail's ingredients to pumps, keeping lines that are already attached.
+
+    Ingredients already on a pump stay there. The rest go to pumps whose line
+    is not needed by this cocktail, preferring empty pumps and then the lines
+    with the least demand from upcoming orders.
+
+    Args:
+        ingredients (iterable): The ingredients of the cocktail, in recipe order.
+        loadout (list): The ingredient attached to each pump (None if empty).
+        demand (dict): How many upcoming orders use each ingredient.
+
+    Returns:
+        tuple: The ingredient -> pump index assignment and the list of swaps,
+            each a (pump index, old ingredient, new ingredient) tuple.
+            Ingredients that don't fit on the pumps are left unassigned.
+    """
+    demand = demand or {}
+    ingredients = list(ingredients)
+    assignment = {
+        ingredient: loadout.index(ingredient)
+        for ingredient in ingredients
+        if ingredient in loadout
+    }
+    free_pumps = sorted(
+        (i for i, attached in enumerate(loadout) if attached not in assignment),
+        key=lambda i: (loadout[i] is not None, demand.get(loadout[i], 0), i),
+    )
+    swaps = []
+    for ingredient in ingredients:
+        if ingredient in assignment or not free_pumps:
+            continue
+        pump_index = free_pumps.pop(0)
+        assignment[ingredient] = pump_index
+        swaps.append((pump_index, loadout[pump_index], ingredient))
+    return assignment, swaps
+
+
+def apply_swaps(loadout, swaps) -> None:
+    """
+    Update a loadout with line swaps.
+
+    Args:
+        loadout (list): The ingredient attached to each pump, updated in place.
+        swaps (list): The (pump index, old ingredient, new ingredient) swaps.
+
+    Returns:
+        None
+    """
+    for pump_index, old, new in swaps:
+        loadout[pump_index] = new
+
+
+def plan_phases(ingredients, loadout, demand=None, duration=None) -> list:
+    """
+    Split a cocktail into pour phases of at most one ingredient per pump.
+
+    A phase takes as long as its longest pour, so the total time is smallest
+    when the longest pours share a phase: ingredients are sorted by their
+    estimated pour time and grouped pump_count at a time, with the shorter
+    pours filling each phase after its longest one. Ties go to lines that
+    are already attached. The operator makes each phase's swaps before it
+    is poured.
+
+    Args:
+        ingredients (dict): The amount of each ingredient of the cocktail.
+        loadout (list): The ingredient attached to each pump (None if empty),
+            updated in place with the swaps of every phase.
+        demand (dict): How many upcoming orders use each ingredient.
+        duration (function): Estimates the pour time of an ingredient from
+            its name and amount (default is the amount, as if every
+            ingredient poured at the same rate).
+
+    Returns:
+        list: One (assignment, swaps) tuple per phase, in pouring order (see
+            assign_pumps). Ingredients of 0 oz or less are not poured. A
+            cocktail without ingredients has one empty phase.
+    """
+    ingredients = drop_unpoured(ingredients)
+    pump_count = len(loadout)
+    if duration is None:
+        duration = lambda ingredient, amount: amount
+    ordered = sorted(
+        ingredients,
+        key=lambda ingredient: (
+            -duration(ingredient, ingredients[ingredient]),
+            ingredient not in loadout,
+        ),
+    )
+    phases = []
+    for start in range(0, max(len(ordered), 1), pump_count):
+        assignment, swaps = assign_pumps(
+            ordered[start : start + pump_count], loadout, demand
+        )
+        apply_swaps(loadout, swaps)
+        phases.append((assignment, swaps))
+    return phases
+
+
+class order_queue:
+    def __init__(self, loadout, fairness_window=3, duration=None):
+        """
+        Initialize the order queue.
+
+        Orders are served so as to minimize line swaps: the next order is the
+        one needing the fewest swaps among the first fairness_window waiting
+        orders. An order that has been passed over fairness_window times is
+        served next regardless, so no order waits indefinitely.
+
+        Args:
+            loadout (list): The ingredient attached to each pump (None if
+                empty). The list is updated in place as orders are served.
+            fairness_window (int): How many waiting orders are considered at once.
+            duration (function): Estimates the pour time of an ingredient
+                from its name and amount (see plan_phases).
+
+        Returns:
+            None
+        """
+        self.loadout = loadout
+        self.fairness_window = fairness_window
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.orders = []
+        self.order_ids = itertools.count(1)
+
+    def __len__(self):
+        return len(self.orders)
+
+    def submit(self, cocktail) -> int:
+        """
+        Add an order to the queue.
+
+        Args:
+            cocktail (dict): The cocktail with its name and ingredients.
+
+        Returns:
+            int: The order ID.
+        """
+        with self.lock:
+            order = {"id": next(self.order_ids), "cocktail": cocktail, "skipped": 0}
+            self.orders.append(order)
+        return order["id"]
+
+    def pending(self) -> list:
+        """
+        Get the waiting orders in arrival order.
+
+        Args:
+            None
+
+        Returns:
+            list: The waiting orders.
+        """
+        with self.lock:
+            return list(self.orders)
+
+    def demand(self, orders) -> dict:
+        """
+        Count how many orders use each ingredient.
+
+        Args:
+            orders (list): The orders to count.
+
+        Returns:
+            dict: The number of orders using each ingredient.
+        """
+        counts = {}
+        for order in orders:
+            for ingredient in order["cocktail"]["ingredients"]:
+                counts[ingredient] = counts.get(ingredient, 0) + 1
+        return counts
+
+    def pick(self, orders, loadout) -> int:
+        """
+        Choose which waiting order to serve next.
+
+        Args:
+            orders (list): The waiting orders in arrival order.
+            loadout (list): The ingredient attached to each pump.
+
+        Returns:
+            int: The position of the chosen order in orders.
+        """
+        if orders[0]["skipped"] >= self.fairness_window:
+            return 0
+        window = orders[: self.fairness_window]
+
+        def swap_count(order):
+            phases = plan_phases(
+                order["cocktail"]["ingredients"], list(loadout), duration=self.duration
+            )
+            return sum(len(swaps) for assignment, swaps in phases)
+
+        return min(range(len(window)), key=lambda i: (swap_count(window[i]), i))
+
+    def take(self, orders, loadout) -> tuple:
+        """
+        Remove the next order to serve from a list and apply its swaps to a loadout.
+
+        Args:
+            orders (list): The waiting orders in arrival order, updated in place.
+            loadout (list): The ingredient attached to each pump, updated in place.
+
+        Returns:
+            tuple: The order and its pour phases (see plan_phases).
+        """
+        chosen = self.pick(orders, loadout)
+        for order in orders[:chosen]:
+            order["skipped"] += 1
+        order = orders.pop(chosen)
+        phases = plan_phases(
+            order["cocktail"]["ingredients"],
+            loadout,
+            self.demand(orders),
+            self.duration,
+        )
+        return order, phases
+
+    def next_order(self, commit=True):
+        """
+        Take the next order to serve and plan its swaps.
+
+        Args:
+            commit (bool): Whether to update the loadout with the swaps at once.
+                Pass False to stage the order and commit each phase's swaps
+                with commit_swaps once it is actually poured.
+
+        Returns:
+            tuple: The order and its pour phases, or None if the queue is empty.
+        """
+        with self.lock:
+            if not self.orders:
+                return None
+            loadout = self.loadout if commit else list(self.loadout)
+            return self.take(self.orders, loadout)
+
+    def commit_swaps(self, swaps) -> None:
+        """
+        Update the loadout with the swaps of a phase being poured.
+
+        Args:
+            swaps (list): The (pump index, old ingredient, new ingredient) swaps.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            apply_swaps(self.loadout, swaps)
+
+    def swap_plan(self, staged=()) -> list:
+        """
+        Preview the order in which the waiting orders will be served.
+
+        Args:
+            staged (list): The phases of a taken order whose swaps are not
+                committed yet, applied before planning the waiting orders.
+
+        Returns:
+            list: One (order, swaps) tuple per waiting order, in serving order,
+                with the swaps of all its phases.
+        """
+        with self.lock:
+            orders = [dict(order) for order in self.orders]
+            loadout = list(self.loadout)
+        for assignment, swaps in staged:
+            apply_swaps(loadout, swaps)
+        plan = []
+        while orders:
+            order, phases = self.take(orders, loadout)
+            swaps = [swap for assignment, phase_swaps in phases for swap in phase_swaps]
+            plan.append((order, swaps))
+        return plan
@@ -1,49 +1,26 @@
-try:
-    import RPi.GPIO as GPIO
-except ImportError:
-    # Mock RPi.GPIO for development on non-Raspberry Pi platforms
-    class GPIO:
-        BCM = "BCM"
-        OUT = "OUT"
-        IN = "IN"
-        HIGH = "HIGH"
-        LOW = "LOW"
-
-        @staticmethod
-        def setmode(mode):
-            print(f"GPIO setmode({mode})")
-
-        @staticmethod
-        def setup(pin, mode):
-            print(f"GPIO setup(pin={pin}, mode={mode})")
-
-        @staticmethod
-        def output(pin, state):
-            print(f"GPIO output(pin={pin}, state={state})")
-
-        @staticmethod
-        def cleanup():
-            print("GPIO cleanup()")
-
-
-import time
+from hardware.gpio import GPIO
+from hardware.timing import real_clock, pulse_log
 
 
 class pump:
-    def __init__(self, relay_pins=None):
+    def __init__(self, relay_pins=None, precise=True, gpio=None, clock=None):
         if relay_pins is None:
             relay_pins = []
         self.relay_pins = relay_pins
+        self.precise = precise  # perf_counter deadlines with a spin tail
+        self.gpio = gpio or GPIO  # e.g. a simulated_gpio for virtual-time runs
+        self.clock = clock or real_clock()
+        self.pulses = pulse_log()
 
     def set_relay_pins(self, relay_pins) -> None:
         self.relay_pins = relay_pins
 
     def setup(self) -> None:
-        GPIO.setmode(GPIO.BCM)  # Broadcom pin numbering
-        for relay_pin in self.relay_pins:
-            GPIO.setup(relay_pin, GPIO.OUT)
-            GPIO.output(
-                relay_pin, GPIO.LOW
+        self.gpio.setmode(self.gpio.BCM)  # Broadcom pin numbering
+        if self.relay_pins:
+            self.gpio.setup(list(self.relay_pins), self.gpio.OUT)
+            self.turn_off_many(
+                self.relay_pins
             )  # Ensure relays are off initially (HIGH for active-low)
         print(
             "Pump setup completed"
@@ -51,13 +28,29 @@ class pump:
 
     def turn_on(self, relay_pin=None, wait_time=None) -> None:
         if relay_pin is not None and wait_time is not None:
-            GPIO.output(relay_pin, GPIO.HIGH)  # Turn relay on
-            time.sleep(wait_time)
-            GPIO.output(relay_pin, GPIO.LOW)  # Turn relay off
-            time.sleep(0.5)  # Buffer
+            self.gpio.output(relay_pin, self.gpio.HIGH)  # Turn relay on
+            on_time = self.clock.now()
+            self.clock.wait_until(on_time + wait_time, precise=self.precise)
+            self.gpio.output(relay_pin, self.gpio.LOW)  # Turn relay off
+            self.pulses.record(relay_pin, wait_time, on_time, self.clock.now())
+            self.clock.sleep(0.5)  # Buffer
         elif relay_pin is not None:
-            GPIO.output(relay_pin, GPIO.HIGH)  # Turn relay on
+            self.gpio.output(relay_pin, self.gpio.HIGH)  # Turn relay on
 
     def turn_off(self, relay_pin=None) -> None:
         if relay_pin is not None:
-            GPIO.output(relay_pin, GPIO.LOW)
+            self.gpio.output(relay_pin, self.gpio.LOW)
+
+    def set_relays(self, relay_pins, state) -> None:
+        # RPi.GPIO accepts a list of channels, switching them in one call
+        if relay_pins:
+            self.gpio.output(list(relay_pins), state)
+
+    def turn_on_many(self, relay_pins) -> None:
+        self.set_relays(relay_pins, self.gpio.HIGH)
+
+    def turn_off_many(self, relay_pins) -> None:
+        self.set_relays(relay_pins, self.gpio.LOW)
+
+    def timing_report(self) -> dict:
+        return self.pulses.report()
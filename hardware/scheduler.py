@@ -0,0 +1,149 @@
+import threading
+
+BATCH_WINDOW = 0.001  # seconds between deadlines switched off in one call
+PROGRESS_INTERVAL = 0.1  # seconds between progress reports of a running plan
+
+
+class pour_scheduler:
+    def __init__(self, pump):
+        """
+        Initialize the pour scheduler.
+
+        The scheduler runs a whole pour plan from a single timing loop: every
+        relay is switched on in one batched call, then each one is switched
+        off at its own deadline on the pump's clock, using the hybrid sleep +
+        spin wait when the pump is in precise mode. No thread is spawned per
+        pump.
+
+        Args:
+            pump (pump): The pump used to switch the relays.
+
+        Returns:
+            None
+        """
+        self.pump = pump
+        self.stop_event = threading.Event()
+        self.last_metrics = None
+
+    def run(self, plan, progress=None) -> dict:
+        """
+        Run a pour plan and block until every relay is off.
+
+        Args:
+            plan (list): The steps to run, each a dict with a "relay_pin" and
+                a "duration" in seconds.
+            progress (function): Optional function called with the seconds
+                since the start every PROGRESS_INTERVAL while the plan runs.
+
+        Returns:
+            dict: The timing metrics of the run (see measure).
+        """
+        self.stop_event.clear()
+        off_times = {}
+
+        # Switch every relay on with a single batched GPIO call
+        relay_pins = [step["relay_pin"] for step in plan]
+        start = self.pump.clock.now()
+        self.pump.turn_on_many(relay_pins)
+        on_time = self.pump.clock.now()
+        on_times = {relay_pin: on_time for relay_pin in relay_pins}
+
+        try:
+            # Relays due within BATCH_WINDOW of each other are switched off together
+            deadlines = sorted(
+                (start + step["duration"], step["relay_pin"]) for step in plan
+            )
+            while deadlines:
+                deadline = deadlines[0][0]
+                batch = [pin for d, pin in deadlines if d - deadline <= BATCH_WINDOW]
+                deadlines = deadlines[len(batch) :]
+                if self.wait_until(deadline, start, progress):
+                    break
+                self.pump.turn_off_many(batch)
+                off_time = self.pump.clock.now()
+                off_times.update((relay_pin, off_time) for relay_pin in batch)
+        finally:
+            # Never leave a relay on, whether stopped early or interrupted
+            still_on = [pin for pin in relay_pins if pin not in off_times]
+            if still_on:
+                self.pump.turn_off_many(still_on)
+                off_time = self.pump.clock.now()
+                off_times.update((relay_pin, off_time) for relay_pin in still_on)
+            for step in plan:
+                self.pump.pulses.record(
+                    step["relay_pin"],
+                    step["duration"],
+                    on_times[step["relay_pin"]],
+                    off_times[step["relay_pin"]],
+                )
+
+        self.last_metrics = self.measure(plan, start, on_times, off_times)
+        return self.last_metrics
+
+    def wait_until(self, deadline, start, progress=None) -> bool:
+        """
+        Wait for a deadline, reporting progress on the way.
+
+        Progress is reported during coarse sleeps well before the deadline,
+        so the final precise wait is the same as without a progress function.
+
+        Args:
+            deadline (float): The clock time to wait for.
+            start (float): The clock time the plan started.
+            progress (function): Optional function called with the seconds
+                since the start.
+
+        Returns:
+            bool: True if the plan was stopped, False at the deadline.
+        """
+        clock = self.pump.clock
+        if progress is not None:
+            # Stop reporting one interval early, leaving room for sleep overshoot
+            while deadline - clock.now() > 2 * PROGRESS_INTERVAL:
+                next_report = clock.now() + PROGRESS_INTERVAL
+                if clock.wait_until(next_report, self.stop_event, False):
+                    return True
+                progress(clock.now() - start)
+        return clock.wait_until(deadline, self.stop_event, self.pump.precise)
+
+    def stop(self) -> None:
+        """
+        Stop the running plan and switch every relay off.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.stop_event.set()
+
+    def measure(self, plan, start, on_times, off_times) -> dict:
+        """
+        Compute the timing metrics of a run.
+
+        Args:
+            plan (list): The steps that were run.
+            start (float): The clock time the run started.
+            on_times (dict): The clock time each relay was switched on.
+            off_times (dict): The clock time each relay was switched off.
+
+        Returns:
+            dict: The stop skew (spread of the switch-off errors) and the
+                per-pin error between the requested and actual pour duration,
+                all in seconds.
+        """
+        if not plan:
+            return {"stop_skew": 0.0, "pour_errors": {}}
+        pour_errors = {
+            step["relay_pin"]: (off_times[step["relay_pin"]] - on_times[step["relay_pin"]])
+            - step["duration"]
+            for step in plan
+        }
+        stop_errors = [
+            off_times[step["relay_pin"]] - (start + step["duration"]) for step in plan
+        ]
+        return {
+            "stop_skew": max(stop_errors) - min(stop_errors),
+            "pour_errors": pour_errors,
+        }
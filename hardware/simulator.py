@@ -0,0 +1,144 @@
+import threading
+
+
+class virtual_clock:
+    def __init__(self, start=0.0):
+        """
+        Initialize a virtual clock.
+
+        Sleeping advances the clock instead of waiting, so pours and cleaning
+        cycles run instantly and always take exactly their requested time.
+
+        Args:
+            start (float): The time the clock starts at in seconds.
+
+        Returns:
+            None
+        """
+        self.lock = threading.Lock()
+        self.time = start
+
+    def now(self) -> float:
+        with self.lock:
+            return self.time
+
+    def sleep(self, seconds) -> None:
+        with self.lock:
+            self.time += max(seconds, 0)
+
+    def wait_until(self, deadline, stop_event=None, precise=True) -> bool:
+        """
+        Advance the clock to a deadline.
+
+        Args:
+            deadline (float): The virtual time to wait for.
+            stop_event (threading.Event): Optional event that ends the wait early.
+            precise (bool): Unused, a virtual clock is always exact.
+
+        Returns:
+            bool: True if the event was set, False at the deadline.
+        """
+        if stop_event is not None and stop_event.is_set():
+            return True
+        with self.lock:
+            self.time = max(self.time, deadline)
+        return False
+
+
+class simulated_gpio:
+    BCM = "BCM"
+    OUT = "OUT"
+    IN = "IN"
+    HIGH = "HIGH"
+    LOW = "LOW"
+
+    def __init__(self, clock=None):
+        """
+        Initialize a simulated GPIO backend.
+
+        It has the same interface as RPi.GPIO and records every output change
+        with its virtual time, so tests and benchmarks can check when each
+        relay was on. Use it together with its clock:
+
+            sim = simulated_gpio()
+            bartender(gpio=sim, clock=sim.clock)
+
+        Args:
+            clock (virtual_clock): The clock that timestamps the events
+                (default is a new virtual clock).
+
+        Returns:
+            None
+        """
+        self.clock = clock or virtual_clock()
+        self.lock = threading.Lock()
+        self.mode = None
+        self.pins = {}  # pin -> current state
+        self.events = []  # (time, pin, state) of every output change
+
+    def setmode(self, mode) -> None:
+        self.mode = mode
+
+    def setup(self, pin, mode) -> None:
+        with self.lock:
+            for channel in pin if isinstance(pin, (list, tuple)) else [pin]:
+                self.pins[channel] = self.LOW
+
+    def output(self, pin, state) -> None:
+        now = self.clock.now()
+        with self.lock:
+            for channel in pin if isinstance(pin, (list, tuple)) else [pin]:
+                if channel not in self.pins:
+                    raise RuntimeError(f"GPIO {channel} has not been set up")
+                if self.pins[channel] != state:
+                    self.events.append((now, channel, state))
+                self.pins[channel] = state
+
+    def cleanup(self) -> None:
+        with self.lock:
+            self.pins.clear()
+
+    def timeline(self) -> dict:
+        """
+        Get the on intervals of every relay.
+
+        Args:
+            None
+
+        Returns:
+            dict: A list of (on time, off time) tuples for each pin, with None
+                as the off time of a relay that is still on.
+        """
+        intervals = {}
+        on_since = {}
+        with self.lock:
+            events = list(self.events)
+        for time, pin, state in events:
+            intervals.setdefault(pin, [])
+            if state == self.HIGH:
+                on_since[pin] = time
+            elif pin in on_since:
+                intervals[pin].append((on_since.pop(pin), time))
+        for pin, time in on_since.items():
+            intervals[pin].append((time, None))
+        return intervals
+
+    def on_time(self, pin) -> float:
+        """
+        Get the total time a relay has been on.
+
+        Args:
+            pin (int): The GPIO pin of the relay.
+
+        Returns:
+            float: The time in seconds, counting a relay still on up to now.
+        """
+        now = self.clock.now()
+        return sum(
+            (off if off is not None else now) - on
+            for on, off in self.timeline().get(pin, [])
+        )
+
+    def clear(self) -> None:
+        with self.lock:
+            self.events.clear()
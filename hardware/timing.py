@@ -0,0 +1,158 @@
+import statistics
+import sys
+import threading
+import time
+
+SPIN_TIME = 0.002  # seconds busy-waited before a deadline instead of sleeping
+SWITCH_INTERVAL = 0.0005  # GIL switch interval while waiting for a deadline
+
+waiters_lock = threading.Lock()
+waiters = 0  # number of threads currently waiting for a deadline
+default_switch_interval = sys.getswitchinterval()
+
+
+def sleep_until(deadline, stop_event=None, spin_time=SPIN_TIME) -> bool:
+    """
+    Wait until a perf_counter deadline with a hybrid sleep and spin.
+
+    Sleeps until shortly before the deadline, then busy-waits the last
+    spin_time seconds so the scheduler's wake-up latency doesn't add to the
+    pour time.
+
+    Args:
+        deadline (float): The perf_counter time to wait for.
+        stop_event (threading.Event): Optional event that ends the wait early.
+        spin_time (float): The time in seconds to busy-wait before the deadline.
+
+    Returns:
+        bool: True if the wait was stopped by the event, False at the deadline.
+    """
+    # Other Python threads (e.g. the GUI) can hold the GIL for a whole switch
+    # interval (5 ms by default), so shorten it while any deadline is pending
+    global waiters
+    with waiters_lock:
+        waiters += 1
+        sys.setswitchinterval(min(default_switch_interval, SWITCH_INTERVAL))
+    try:
+        remaining = deadline - time.perf_counter()
+        if remaining > spin_time:
+            if stop_event is not None:
+                if stop_event.wait(remaining - spin_time):
+                    return True
+            else:
+                time.sleep(remaining - spin_time)
+        while time.perf_counter() < deadline:
+            pass
+        return stop_event is not None and stop_event.is_set()
+    finally:
+        with waiters_lock:
+            waiters -= 1
+            if not waiters:
+                sys.setswitchinterval(default_switch_interval)
+
+
+class real_clock:
+    """
+    The wall clock used with real (or mock) GPIO.
+
+    Times are perf_counter seconds. Pumps and the pour scheduler do all their
+    timing through a clock so a virtual one can stand in for it (see
+    hardware/simulator.py).
+    """
+
+    def now(self) -> float:
+        return time.perf_counter()
+
+    def sleep(self, seconds) -> None:
+        time.sleep(seconds)
+
+    def wait_until(self, deadline, stop_event=None, precise=True) -> bool:
+        """
+        Wait until a deadline.
+
+        Args:
+            deadline (float): The perf_counter time to wait for.
+            stop_event (threading.Event): Optional event that ends the wait early.
+            precise (bool): Whether to use the hybrid sleep + spin wait.
+
+        Returns:
+            bool: True if the wait was stopped by the event, False at the deadline.
+        """
+        if precise:
+            return sleep_until(deadline, stop_event)
+        remaining = deadline - time.perf_counter()
+        if stop_event is not None:
+            return stop_event.wait(remaining) if remaining > 0 else stop_event.is_set()
+        if remaining > 0:
+            time.sleep(remaining)
+        return False
+
+
+class pulse_log:
+    def __init__(self, max_pulses=1000):
+        """
+        Initialize the log of relay pulses.
+
+        Args:
+            max_pulses (int): The number of most recent pulses kept.
+
+        Returns:
+            None
+        """
+        self.max_pulses = max_pulses
+        self.lock = threading.Lock()
+        self.pulses = []
+
+    def record(self, relay_pin, requested, on_time, off_time) -> None:
+        """
+        Record one relay pulse.
+
+        Args:
+            relay_pin (int): The GPIO pin of the relay.
+            requested (float): The requested on time in seconds.
+            on_time (float): The perf_counter time the relay was switched on.
+            off_time (float): The perf_counter time the relay was switched off.
+
+        Returns:
+            None
+        """
+        with self.lock:
+            self.pulses.append(
+                {
+                    "relay_pin": relay_pin,
+                    "requested": requested,
+                    "on": on_time,
+                    "off": off_time,
+                    "error": (off_time - on_time) - requested,
+                }
+            )
+            del self.pulses[: -self.max_pulses]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.pulses.clear()
+
+    def report(self) -> dict:
+        """
+        Summarize the distribution of pulse errors (actual minus requested time).
+
+        Args:
+            None
+
+        Returns:
+            dict: The pulse count and the mean, standard deviation, median,
+                95th percentile, minimum and maximum error in milliseconds.
+        """
+        with self.lock:
+            errors = sorted(p["error"] * 1000 for p in self.pulses)
+        if not errors:
+            return {"count": 0}
+        return {
+            "count": len(errors),
+            "mean_ms": statistics.fmean(errors),
+            "stdev_ms": statistics.pstdev(errors),
+            "p50_ms": errors[len(errors) // 2],
+            "p95_ms": errors[min(len(errors) - 1, int(len(errors) * 0.95))],
+            "min_ms": errors[0],
+            "max_ms": errors[-1],
+        }
@@ -0,0 +1,86 @@
+import json
+import pytest
+from data.calibration import calibration_journal
+
+
+def write_lines(path, *records, torn=None):
+    with open(path, "w") as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+        if torn is not None:
+            file.write(torn)
+
+
+def record(version, pump, fill_time=None, flow_rate=None):
+    return {
+        "version": version,
+        "time": 0,
+        "pumps": [{"pump": pump, "fill_time": fill_time, "flow_rate": flow_rate}],
+    }
+
+
+def test_defaults_without_a_journal(tmp_path):
+    journal = calibration_journal(tmp_path / "calibration.jsonl", [1.0, 2.0], [5.0, 5.0])
+    assert journal.version == 0
+    assert journal.fill_times == [1.0, 2.0]
+    assert journal.flow_rates == [5.0, 5.0]
+
+
+def test_save_and_replay(tmp_path):
+    path = tmp_path / "calibration.jsonl"
+    journal = calibration_journal(path, [1.0, 2.0], [5.0, 5.0])
+    calls = []
+    journal.subscribe(lambda *args: calls.append(args))
+    assert journal.save({1: 2.5}, flow_rates={0: 4.0}) == 1
+    assert calls == [(1, [1.0, 2.5], [4.0, 5.0])]
+
+    replayed = calibration_journal(path, [1.0, 2.0], [5.0, 5.0])
+    assert replayed.version == 1
+    assert replayed.fill_times == [1.0, 2.5]
+    assert replayed.flow_rates == [4.0, 5.0]
+
+
+def test_replay_ignores_a_torn_last_line(tmp_path):
+    path = tmp_path / "calibration.jsonl"
+    torn = json.dumps(record(2, 0, fill_time=9.0))[:20]
+    write_lines(path, record(1, 0, fill_time=3.0), torn=torn)
+
+    journal = calibration_journal(path, [1.0], [5.0])
+    assert journal.version == 1
+    assert journal.fill_times == [3.0]
+    assert len(journal.history()) == 1
+
+    # The next save starts on a fresh line, so both complete records replay
+    journal.save({0: 4.0})
+    replayed = calibration_journal(path, [1.0], [5.0])
+    assert replayed.version == 2
+    assert replayed.fill_times == [4.0]
+    assert [r["version"] for r in replayed.history()] == [1, 2]
+
+
+def test_replay_skips_flow_rates_not_above_zero(tmp_path):
+    path = tmp_path / "calibration.jsonl"
+    write_lines(
+        path,
+        record(1, 0, fill_time=3.0, flow_rate=0.0),
+        record(2, 1, flow_rate=-2.0),
+    )
+    journal = calibration_journal(path, [1.0, 1.0], [5.0, 6.0])
+    assert journal.version == 2
+    assert journal.fill_times == [3.0, 1.0]
+    assert journal.flow_rates == [5.0, 6.0]
+
+
+def test_save_rejects_flow_rates_not_above_zero(tmp_path):
+    path = tmp_path / "calibration.jsonl"
+    journal = calibration_journal(path, [1.0], [5.0])
+    with pytest.raises(ValueError):
+        journal.save({0: 2.0}, flow_rates={0: 0})
+    assert journal.version == 0
+    assert not path.exists()
+
+
+def test_new_pump_copies_the_last_value(tmp_path):
+    journal = calibration_journal(tmp_path / "calibration.jsonl", [1.0], [5.0])
+    journal.save({2: 3.0})
+    assert journal.fill_times == [1.0, 1.0, 3.0]
@@ -0,0 +1,96 @@
+import threading
+import pytest
+from hardware.executor import hardware_executor, ACCEPTED, BUSY, FULL, STOPPED
+
+TIMEOUT = 5  # seconds before a test gives up waiting on the worker thread
+
+
+@pytest.fixture
+def executor():
+    executor = hardware_executor([17, 27, 22, 23], max_pending=1)
+    yield executor
+    executor.stop()
+
+
+def blocking_job(executor, name, relay_pins):
+    """Submit a job that runs until its release event is set."""
+    started, release = threading.Event(), threading.Event()
+
+    def job():
+        started.set()
+        release.wait(TIMEOUT)
+        return name
+
+    assert executor.submit(name, relay_pins, job) == ACCEPTED
+    assert started.wait(TIMEOUT)
+    return release
+
+
+def test_busy_while_a_relay_is_driven(executor):
+    release = blocking_job(executor, "pour", [17, 27])
+    assert executor.submit("test", [27], lambda: None) == BUSY
+    assert executor.submit("clean", [22], lambda: None) == ACCEPTED
+    release.set()
+
+
+def test_queued_job_waits_for_its_relays(executor):
+    release = blocking_job(executor, "pour", [17])
+    done = threading.Event()
+    assert executor.submit("pour", [17], done.set, conflict="queue") == ACCEPTED
+    assert not done.is_set()
+    release.set()
+    assert done.wait(TIMEOUT)
+
+
+def test_full_when_max_pending_jobs_wait(executor):
+    release = blocking_job(executor, "pour", [17])
+    assert executor.submit("clean", [22], lambda: None) == ACCEPTED
+    assert executor.submit("test", [23], lambda: None) == FULL
+    release.set()
+
+
+def test_stopped_after_stop(executor):
+    executor.stop()
+    assert executor.submit("pour", [17], lambda: None) == STOPPED
+
+
+def test_claim_blocks_jobs_until_released(executor):
+    assert executor.claim("calibration", [17])
+    assert executor.submit("pour", [17], lambda: None) == BUSY
+    assert not executor.claim("other", [17])
+    executor.release("calibration")
+    done = threading.Event()
+    assert executor.submit("pour", [17], done.set) == ACCEPTED
+    assert done.wait(TIMEOUT)
+
+
+def test_worker_survives_a_failing_listener_and_job(capsys):
+    executor = hardware_executor([17])
+    events = []
+    finished = threading.Event()
+
+    def failing_listener(event, name, value):
+        raise RuntimeError("listener bug")
+
+    def listener(event, name, value):
+        events.append((event, name))
+        if (event, name) == ("finished", "second"):
+            finished.set()
+
+    def failing_job():
+        raise ValueError("relay stuck")
+
+    executor.subscribe(failing_listener)
+    executor.subscribe(listener)
+    assert executor.submit("first", [17], failing_job) == ACCEPTED
+    assert executor.submit("second", [17], lambda: None, conflict="queue") == ACCEPTED
+    assert finished.wait(TIMEOUT)
+    executor.stop()
+
+    assert events == [
+        ("started", "first"),
+        ("failed", "first"),
+        ("started", "second"),
+        ("finished", "second"),
+    ]
+    assert "listener bug" in capsys.readouterr().out
@@ -0,0 +1,48 @@
+from data.ingredient_index import ingredient_index
+
+
+def make_index():
+    index = ingredient_index()
+    index.add("negroni", ["gin", "sweet vermouth", "campari"])
+    index.add("gin and tonic", ["gin", "tonic water"])
+    index.add("vodka soda", ["vodka", "soda water"])
+    return index
+
+
+def test_makeable():
+    index = make_index()
+    assert index.makeable({"gin", "tonic water"}) == ["gin and tonic"]
+    assert index.makeable(["Gin", " Tonic Water ", "vodka", "soda water"]) == [
+        "gin and tonic",
+        "vodka soda",
+    ]
+    assert index.makeable([]) == []
+    assert index.makeable({"unknown"}) == []
+
+
+def test_can_make():
+    index = make_index()
+    assert index.can_make("vodka soda", {"vodka", "soda water", "gin"})
+    assert not index.can_make("negroni", {"gin", "campari"})
+    assert not index.can_make("missing", {"gin"})
+
+
+def test_remove():
+    index = make_index()
+    index.remove("gin and tonic")
+    assert index.makeable({"gin", "tonic water"}) == []
+    assert index.cocktails_with("gin") == ["negroni"]
+    index.remove("gin and tonic")  # Removing twice is a no-op
+    assert not index.can_make("gin and tonic", {"gin", "tonic water"})
+
+
+def test_add_replaces_the_same_key():
+    index = make_index()
+    index.add("negroni", ["gin", "campari"])
+    assert index.makeable({"gin", "campari"}) == ["negroni"]
+    assert index.cocktails_with("sweet vermouth") == []
+    assert sorted(index.cocktails_with("gin")) == ["gin and tonic", "negroni"]
+
+
+def test_cocktails_with_unknown_ingredient():
+    assert make_index().cocktails_with("rum") == []
@@ -0,0 +1,72 @@
+import itertools
+import random
+import pytest
+from hardware.loadout import (
+    coverage,
+    covered_recipes,
+    exact_search,
+    greedy_search,
+    optimize_loadout,
+)
+
+
+def brute_force(weight_by_mask, pump_count) -> float:
+    ingredient_bits = set()
+    for mask in weight_by_mask:
+        ingredient_bits |= {1 << i for i in range(mask.bit_length()) if mask >> i & 1}
+    best = 0
+    for size in range(pump_count + 1):
+        for chosen in itertools.combinations(sorted(ingredient_bits), size):
+            union = sum(chosen)
+            best = max(
+                best, sum(w for m, w in weight_by_mask.items() if m & ~union == 0)
+            )
+    return best
+
+
+def random_recipes(rng, ingredient_count, recipe_count, pump_count) -> dict:
+    weight_by_mask = {}
+    for _ in range(recipe_count):
+        size = rng.randint(1, pump_count)
+        mask = sum(1 << i for i in rng.sample(range(ingredient_count), size))
+        weight_by_mask[mask] = weight_by_mask.get(mask, 0) + rng.randint(1, 5)
+    return weight_by_mask
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_exact_search_matches_brute_force(seed):
+    rng = random.Random(seed)
+    pump_count = rng.randint(1, 4)
+    weight_by_mask = random_recipes(rng, rng.randint(2, 8), rng.randint(1, 10), pump_count)
+
+    exact = exact_search(weight_by_mask, pump_count)
+    greedy = greedy_search(weight_by_mask, pump_count)
+    best = brute_force(weight_by_mask, pump_count)
+
+    assert bin(exact).count("1") <= pump_count
+    assert bin(greedy).count("1") <= pump_count
+    assert coverage(weight_by_mask, exact) == best
+    assert coverage(weight_by_mask, greedy) <= best
+
+
+def test_exact_search_beats_greedy():
+    # The one-line recipe has the best weight per line, but once it is
+    # attached the more popular two-line recipe no longer fits
+    a, b, c = 1, 2, 4
+    weight_by_mask = {a | b: 5, c: 3}
+    assert greedy_search(weight_by_mask, 2) == c
+    assert exact_search(weight_by_mask, 2) == a | b
+
+
+def test_optimize_loadout_keeps_attached_lines():
+    recipes = [
+        {"name": "negroni", "ingredients": {"gin": 1, "vermouth": 1, "campari": 1}},
+        {"name": "gin and tonic", "ingredients": {"gin": 2, "tonic": 4}},
+        {"name": "vodka soda", "ingredients": {"vodka": 2, "soda": 4}},
+    ]
+    loadout = [None, None, "tonic", "gin"]
+    assignment = optimize_loadout(recipes, 4, {"negroni": 3}, loadout)
+    assert set(assignment) >= {"gin", "vermouth", "campari"}
+    assert assignment["gin"] == 3
+    assert sorted(assignment.values()) == sorted(set(assignment.values()))
+    assert "negroni" in covered_recipes(recipes, assignment)
@@ -0,0 +1,56 @@
+import pytest
+from data.measures import parse_measure, measures_to_oz, drop_unpoured, UNIT_OZ
+
+
+@pytest.mark.parametrize(
+    "measure, expected",
+    [
+        ("1 oz", (1.0, "oz")),
+        ("1 1/2 oz", (1.5, "oz")),
+        ("1½ oz", (1.5, "oz")),
+        (".5 oz", (0.5, "oz")),
+        ("1-2 oz", (1.5, "oz")),
+        ("1 to 2 oz", (1.5, "oz")),
+        ("2 cl", (2 * UNIT_OZ["cl"], "oz")),
+        ("1 fl oz", (1.0, "oz")),
+        ("2 tblsp", (1.0, "oz")),
+        ("Juice of 1", (1.0, "oz")),
+        ("2 parts", (2.0, "part")),
+        ("2 dashes", (2 * UNIT_OZ["dash"], "oz")),
+        ("Dash", (UNIT_OZ["dash"], "oz")),
+        ("a splash of", (UNIT_OZ["splash"], "oz")),
+        ("Splash", (UNIT_OZ["splash"], "oz")),
+    ],
+)
+def test_parse_measure(measure, expected):
+    amount, unit = parse_measure(measure)
+    assert unit == expected[1]
+    assert amount == pytest.approx(expected[0])
+
+
+@pytest.mark.parametrize(
+    "measure", ["", None, "Garnish", "Fill with", "2", "1 lemon peel", "0 oz"]
+)
+def test_parse_measure_not_poured(measure):
+    assert parse_measure(measure) is None
+
+
+def test_measures_to_oz_parts_only_make_one_serving():
+    ounces = measures_to_oz({"gin": "3 parts", "tonic": "1 part"})
+    assert ounces == {"gin": 3.0, "tonic": 1.0}
+
+
+def test_measures_to_oz_parts_with_real_measures():
+    ounces = measures_to_oz({"gin": "2 oz", "tonic": "1 part", "lime": "Garnish"})
+    assert ounces == {"gin": 2.0, "tonic": 1.0, "lime": 0.0}
+
+
+def test_measures_to_oz_keeps_numbers():
+    assert measures_to_oz({"gin": 1, "tonic": 2.5}) == {"gin": 1.0, "tonic": 2.5}
+
+
+def test_drop_unpoured():
+    ounces = {"gin": 2.0, "lime": 0.0, "tonic": 4.0, "ice": -1.0}
+    assert drop_unpoured(ounces) == {"gin": 2.0, "tonic": 4.0}
+    assert list(drop_unpoured(ounces)) == ["gin", "tonic"]
+    assert drop_unpoured({}) == {}
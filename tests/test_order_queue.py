@@ -0,0 +1,100 @@
+from hardware.order_queue import order_queue, plan_phases
+
+
+def cocktail(name, **ingredients):
+    return {"name": name, "ingredients": ingredients}
+
+
+def test_plan_phases_fits_on_the_pumps():
+    loadout = [None, None, None]
+    phases = plan_phases({"gin": 1.0, "tonic": 3.0}, loadout)
+    assert len(phases) == 1
+    assignment, swaps = phases[0]
+    assert set(assignment) == {"gin", "tonic"}
+    assert len(swaps) == 2
+    assert sorted(filter(None, loadout)) == ["gin", "tonic"]
+
+
+def test_plan_phases_keeps_attached_lines():
+    loadout = ["campari", "gin"]
+    phases = plan_phases({"gin": 1.0, "vermouth": 1.0}, loadout)
+    assert phases == [({"gin": 1, "vermouth": 0}, [(0, "campari", "vermouth")])]
+    assert loadout == ["vermouth", "gin"]
+
+
+def test_plan_phases_groups_the_longest_pours():
+    ingredients = {"a": 3.0, "b": 1.0, "c": 2.0, "d": 0.5}
+    phases = plan_phases(ingredients, [None, None])
+    assert [set(assignment) for assignment, swaps in phases] == [{"a", "c"}, {"b", "d"}]
+
+
+def test_plan_phases_uses_the_pour_time_estimate():
+    # "b" pours 10 times slower, so it is the longest pour despite its amount
+    rates = {"a": 1.0, "b": 0.1, "c": 1.0}
+    phases = plan_phases(
+        {"a": 3.0, "b": 1.0, "c": 2.0},
+        [None, None],
+        duration=lambda ingredient, amount: amount / rates[ingredient],
+    )
+    assert [set(assignment) for assignment, swaps in phases] == [{"a", "b"}, {"c"}]
+
+
+def test_plan_phases_skips_unpoured_ingredients():
+    phases = plan_phases({"gin": 1.0, "lime": 0.0, "ice": -1.0}, [None])
+    assert phases == [({"gin": 0}, [(0, None, "gin")])]
+
+
+def test_plan_phases_without_ingredients():
+    assert plan_phases({}, [None, None]) == [({}, [])]
+
+
+def test_next_order_prefers_fewer_swaps():
+    queue = order_queue(["gin", "tonic"])
+    queue.submit(cocktail("vodka soda", vodka=2.0, soda=4.0))
+    queue.submit(cocktail("gin and tonic", gin=2.0, tonic=4.0))
+    order, phases = queue.next_order()
+    assert order["cocktail"]["name"] == "gin and tonic"
+    assert phases[0][1] == []
+
+
+def test_fairness_window_serves_a_passed_over_order():
+    queue = order_queue(["gin", "tonic"], fairness_window=2)
+    queue.submit(cocktail("vodka soda", vodka=2.0, soda=4.0))
+    for _ in range(4):
+        queue.submit(cocktail("gin and tonic", gin=2.0, tonic=4.0))
+
+    served = [queue.next_order(commit=False)[0]["cocktail"]["name"] for _ in range(5)]
+    assert served == [
+        "gin and tonic",
+        "gin and tonic",
+        "vodka soda",  # Skipped fairness_window times, served regardless
+        "gin and tonic",
+        "gin and tonic",
+    ]
+    assert queue.next_order() is None
+
+
+def test_fairness_window_only_considers_the_first_orders():
+    queue = order_queue(["gin", "tonic"], fairness_window=2)
+    queue.submit(cocktail("vodka soda", vodka=2.0, soda=4.0))
+    queue.submit(cocktail("rum cola", rum=2.0, cola=4.0))
+    queue.submit(cocktail("gin and tonic", gin=2.0, tonic=4.0))
+    order, phases = queue.next_order(commit=False)
+    assert order["cocktail"]["name"] == "vodka soda"
+
+
+def test_staged_order_leaves_the_loadout_until_committed():
+    loadout = ["gin", "tonic"]
+    queue = order_queue(loadout)
+    queue.submit(cocktail("vodka soda", vodka=2.0, soda=4.0))
+    order, phases = queue.next_order(commit=False)
+    assert loadout == ["gin", "tonic"]
+
+    # The preview plans the rest of the queue from the staged swaps
+    queue.submit(cocktail("vodka soda", vodka=2.0, soda=4.0))
+    assert len(queue.swap_plan()[0][1]) == 2
+    assert queue.swap_plan(phases)[0][1] == []
+
+    for assignment, phase_swaps in phases:
+        queue.commit_swaps(phase_swaps)
+    assert sorted(loadout) == ["soda", "vodka"]
@@ -0,0 +1,55 @@
+from data.recipe_index import recipe_index, normalize_name
+
+COCKTAILS = [
+    {"name": "negroni", "ingredients": {"gin": 1.0}},
+    {"name": "gin and tonic", "ingredients": {"gin": 2.0}},
+    {"name": "gin fizz", "ingredients": {"gin": 2.0}},
+    {"name": "piña colada", "ingredients": {"rum": 2.0}},
+    {"name": "moscow mule", "ingredients": {"vodka": 2.0}},
+]
+
+
+def test_normalize_name():
+    assert normalize_name("  Piña   Colada ") == "pina colada"
+
+
+def test_get_by_any_spelling():
+    index = recipe_index(COCKTAILS)
+    assert index.get("PINA colada")["name"] == "piña colada"
+    assert index.get("mojito") is None
+
+
+def test_prefix_search():
+    index = recipe_index(COCKTAILS)
+    assert index.prefix_search("neg") == ["negroni"]
+    assert index.prefix_search("gin") == ["gin and tonic", "gin fizz"]
+    assert index.prefix_search("gin t") == ["gin and tonic"]
+    assert index.prefix_search("mule") == ["moscow mule"]
+    assert index.prefix_search("") == sorted(index.recipes)
+
+
+def test_prefix_matches_start_of_name_first():
+    index = recipe_index(COCKTAILS + [{"name": "tonic gin", "ingredients": {}}])
+    assert index.prefix_search("tonic")[0] == "tonic gin"
+
+
+def test_fuzzy_search_finds_typos():
+    index = recipe_index(COCKTAILS)
+    assert index.search("negorni")[0] == "negroni"
+    assert index.search("moscow mle")[0] == "moscow mule"
+    assert index.search("xyzzy") == []
+
+
+def test_search_limit():
+    index = recipe_index(COCKTAILS)
+    assert index.search("gin", limit=1) == ["gin and tonic"]
+
+
+def test_remove_and_replace():
+    index = recipe_index(COCKTAILS)
+    index.remove("Negroni")
+    assert index.search("negroni") == []
+    index.add({"name": "Gin Fizz", "ingredients": {"gin": 1.5}})
+    assert len(index) == 4
+    assert index.get("gin fizz")["ingredients"] == {"gin": 1.5}
+    assert index.prefix_search("fizz") == ["gin fizz"]
@@ -0,0 +1,79 @@
+import pytest
+from hardware.pump import pump
+from hardware.scheduler import pour_scheduler, PROGRESS_INTERVAL
+from hardware.simulator import simulated_gpio
+
+RELAY_PINS = [17, 27, 22, 23]
+
+
+@pytest.fixture
+def sim():
+    return simulated_gpio()
+
+
+@pytest.fixture
+def scheduler(sim, capsys):
+    relays = pump(RELAY_PINS, gpio=sim, clock=sim.clock)
+    relays.setup()
+    sim.clear()
+    capsys.readouterr()  # Drop the setup print
+    return pour_scheduler(relays)
+
+
+def test_run_switches_each_relay_for_its_duration(sim, scheduler):
+    plan = [
+        {"relay_pin": 17, "duration": 2.0},
+        {"relay_pin": 27, "duration": 0.5},
+        {"relay_pin": 22, "duration": 1.25},
+    ]
+    metrics = scheduler.run(plan)
+
+    timeline = sim.timeline()
+    assert set(timeline) == {17, 27, 22}
+    for step in plan:
+        ((on, off),) = timeline[step["relay_pin"]]
+        assert on == 0.0
+        assert off - on == pytest.approx(step["duration"])
+    assert sim.clock.now() == pytest.approx(2.0)
+    assert metrics["stop_skew"] == pytest.approx(0.0)
+    assert metrics["pour_errors"] == pytest.approx({17: 0.0, 27: 0.0, 22: 0.0})
+    assert len(scheduler.pump.pulses.pulses) == 3
+
+
+def test_run_switches_relays_due_together_in_one_batch(sim, scheduler):
+    plan = [
+        {"relay_pin": 17, "duration": 1.0},
+        {"relay_pin": 27, "duration": 1.0005},
+    ]
+    scheduler.run(plan)
+    off_times = {pin: intervals[0][1] for pin, intervals in sim.timeline().items()}
+    assert off_times[17] == off_times[27] == pytest.approx(1.0)
+
+
+def test_run_reports_progress(sim, scheduler):
+    reports = []
+    scheduler.run([{"relay_pin": 17, "duration": 1.0}], reports.append)
+    assert reports
+    assert reports == sorted(reports)
+    assert all(0 < seconds <= 1.0 - PROGRESS_INTERVAL for seconds in reports)
+
+
+def test_stop_switches_every_relay_off(sim, scheduler):
+    plan = [
+        {"relay_pin": 17, "duration": 5.0},
+        {"relay_pin": 27, "duration": 1.0},
+    ]
+
+    def progress(seconds):
+        if seconds >= 0.5:
+            scheduler.stop()
+
+    scheduler.run(plan, progress)
+    timeline = sim.timeline()
+    assert all(off is not None for intervals in timeline.values() for on, off in intervals)
+    assert timeline[17][0][1] < 1.0
+    assert sim.pins == {pin: sim.LOW for pin in RELAY_PINS}
+
+
+def test_run_an_empty_plan(scheduler):
+    assert scheduler.run([]) == {"stop_skew": 0.0, "pour_errors": {}}